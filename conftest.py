@@ -2,91 +2,885 @@ import os
 
 import allure
 import pytest
-from playwright.sync_api import sync_playwright, Browser, BrowserContext, Page, APIRequestContext
+from playwright.sync_api import sync_playwright, Page, Playwright, APIRequestContext
 
+from local_app.server import LocalAppServer, create_server
+from pages.contacts_list_page import ContactListPage
+from utils import config as app_config
+from utils.allure_steps import STEP_MODES, step_benchmarks, step_collapser
 from utils.api import APIClient
+from utils.api_metrics import api_metrics
+from utils.artifacts import failure_artifacts
+from utils.async_api import run_async
+from utils.auth_cache import AuthStateCache
+from utils.benchmarks import DEFAULT_TOLERANCE, operation_benchmarks
+from utils.browser_pool import BrowserPool, BROWSER_PROFILES, PooledSession
+from utils.datasets import DatasetRecord, close_datasets, parse_shard, shard_records
+from utils.factories import ApiUser, ContactFactory, UserFactory
+from utils.file_handler import get_json
+from utils.har import HAR_MODES, HarSession, har_router
+from utils.load import load_results
+from utils.locator_registry import locator_profiler
+from utils.resource_cache import resource_cache
+from utils.routing import ROUTING_POLICIES, RoutingStats, request_router
+from utils.scale import seed_scale_account, delete_account, scale_results
+from utils.text_input import TypingStrategy, set_forced_strategy, typing_recorder
+from utils.tokens import token_manager
+from utils.tracing import trace_recorder
+from utils.transport import TRANSPORTS, Transport, create_transport, transport_benchmarks
+from utils.waits import wait_recorder
+from utils.workers import unique_email, worker_id, worker_count
 
-MAIN_URL: str = "https://thinking-tester-contact-list.herokuapp.com"
+browser_pool_key = pytest.StashKey[BrowserPool]()
+local_app_key = pytest.StashKey[LocalAppServer]()
+phase_reports_key = pytest.StashKey[dict[str, pytest.TestReport]]()
+dataset_shard_key = pytest.StashKey[tuple[int, int]]()
+
+
+def pytest_addoption(parser):
+    """
+    Registers the command line options of the framework.
+
+    Options:
+        --browser-profile: Browser launch profile ('headed' for visual debugging, 'fast' for headless runs).
+        --recycle-after: Number of tests after which the pooled browser is relaunched (0 never recycles).
+        --login-via: Whether cached authenticated sessions log in through the 'api' or the 'ui'.
+        --local-app: Run the tests against the bundled local Contact List app instead of --base-url.
+        --scale-sizes: Comma-separated contact counts the 'scale' tests run with; they are skipped without it.
+        --load-concurrency: Virtual users of the closed-loop 'load' test.
+        --load-rps: Request rate of the open-loop 'load' test, or the pacing of the closed loop.
+        --load-duration: Seconds the 'load' test generates load for.
+        --load-report: The JSON file the 'load' test writes its results to.
+        --api-metrics: The JSON file the per-endpoint metrics of the APIClient requests are written to.
+        --typing-strategy: How page objects type text ('auto' detects it per field).
+        --trace-budget-mb: The total size of the traces kept per run, after which tracing stops.
+        --har: Record the application traffic of every UI test to a HAR file, or replay the tests from them.
+        --har-dir: The directory of the HAR files.
+        --routing: The routing policy of the test contexts, e.g. 'lean' to block images, fonts and trackers.
+        --locator-profile: Measure how long every selector takes to resolve, separately from its action.
+        --dataset-shard: The share of every 'dataset' test's records this run covers, e.g. '1/4'.
+        --api-transport: What sends the APIClient requests, e.g. 'requests' to run API tests without the driver.
+        --allure-steps: Record every Allure step ('full') or collapse the passing ones into summaries ('compact').
+        --benchmark-baseline: The JSON file the operation benchmarks are compared with.
+        --benchmark-tolerance: How much slower than its baseline an operation may get, e.g. 0.2 for 20%.
+        --benchmark-save: Store the operation benchmarks of the run as the new baselines.
+    """
+    group = parser.getgroup("contact-list", "Contact List framework")
+    group.addoption("--browser-profile", action="store", choices=sorted(BROWSER_PROFILES),
+                    default=os.environ.get("BROWSER_PROFILE", "headed"),
+                    help="Browser launch profile (default: headed, env BROWSER_PROFILE).")
+    group.addoption("--recycle-after", action="store", type=int,
+                    default=int(os.environ.get("BROWSER_RECYCLE_AFTER", "50")),
+                    help="Relaunch the pooled browser after this many tests, 0 disables recycling (default: 50).")
+    group.addoption("--login-via", action="store", choices=["api", "ui"], default="api",
+                    help="How the cached authenticated sessions log in (default: api).")
+    group.addoption("--local-app", action="store_true", default=os.environ.get("LOCAL_APP") == "1",
+                    help="Start the bundled Contact List app and run the tests against it (env LOCAL_APP=1).")
+    group.addoption("--scale-sizes", action="store", default=os.environ.get("SCALE_SIZES", ""),
+                    help="Run the large-dataset tests with these contact counts, e.g. 1000,10000,100000 "
+                         "(env SCALE_SIZES).")
+    group.addoption("--load-concurrency", action="store", type=int,
+                    default=int(os.environ.get("LOAD_CONCURRENCY", "0")),
+                    help="Run the load test as a closed loop with this many virtual users (env LOAD_CONCURRENCY).")
+    group.addoption("--load-rps", action="store", type=float, default=float(os.environ.get("LOAD_RPS", "0")),
+                    help="Run the load test as an open loop at this many requests per second, or pace the closed "
+                         "loop to it (env LOAD_RPS).")
+    group.addoption("--load-duration", action="store", type=float,
+                    default=float(os.environ.get("LOAD_DURATION", "30")),
+                    help="Seconds the load test generates load for (default: 30, env LOAD_DURATION).")
+    group.addoption("--load-report", action="store", default=os.environ.get("LOAD_REPORT", "load-report.json"),
+                    help="The JSON file the load test results are written to (default: load-report.json).")
+    group.addoption("--api-metrics", action="store", default=os.environ.get("API_METRICS", "api-metrics.json"),
+                    help="The JSON file the per-endpoint metrics of the API requests are written to, an empty value "
+                         "disables it (default: api-metrics.json, env API_METRICS).")
+    group.addoption("--typing-strategy", action="store",
+                    choices=["auto"] + [strategy.value for strategy in TypingStrategy],
+                    default=os.environ.get("TYPING_STRATEGY", "auto"),
+                    help="How page objects type text: 'auto' picks fill, batched key events or real keystrokes per "
+                         "field from its key event listeners (default: auto, env TYPING_STRATEGY).")
+    group.addoption("--trace-budget-mb", action="store", type=float,
+                    default=float(os.environ.get("TRACE_BUDGET_MB", "200")),
+                    help="Stop tracing once the kept traces of the run reach this size, 0 for no limit "
+                         "(default: 200, env TRACE_BUDGET_MB).")
+    group.addoption("--har", action="store", choices=HAR_MODES, default=os.environ.get("HAR_MODE", "off"),
+                    help="'record' writes the application traffic of every UI test to a HAR file, 'replay' answers "
+                         "it from the file and falls back to the network, 'replay-strict' fails the test on any "
+                         "request that isn't in the file (default: off, env HAR_MODE).")
+    group.addoption("--har-dir", action="store", default=os.environ.get("HAR_DIR", "har"),
+                    help="The directory of the HAR files (default: har, env HAR_DIR).")
+    group.addoption("--routing", action="store", choices=sorted(ROUTING_POLICIES),
+                    default=os.environ.get("ROUTING", "lean"),
+                    help="Requests the test contexts don't send: 'lean' stubs images and blocks fonts, media and "
+                         "analytics, 'off' loads everything (default: lean, env ROUTING).")
+    group.addoption("--locator-profile", action="store_true", default=os.environ.get("LOCATOR_PROFILE") == "1",
+                    help="Resolve every selector once more before its action, to report resolution and auto-wait "
+                         "time separately per selector (env LOCATOR_PROFILE=1).")
+    group.addoption("--dataset-shard", action="store", default=os.environ.get("DATASET_SHARD", "1/1"),
+                    help="Run only every <count>-th record of the 'dataset' tests, starting at <index>, given as "
+                         "'<index>/<count>' to split large datasets over machines (default: 1/1, env "
+                         "DATASET_SHARD).")
+    group.addoption("--api-transport", action="store", choices=TRANSPORTS,
+                    default=os.environ.get("API_TRANSPORT", "playwright"),
+                    help="What sends the API requests: 'playwright' (the driver's request context), 'requests' "
+                         "(pooled keep-alive sessions, no driver, thread-safe) or 'async' (an async request context "
+                         "on its own event loop, thread-safe) (default: playwright, env API_TRANSPORT).")
+    group.addoption("--allure-steps", action="store", choices=STEP_MODES,
+                    default=os.environ.get("ALLURE_STEPS", "full"),
+                    help="'full' records every Allure step, 'compact' collapses passing steps into summary steps "
+                         "and keeps failing branches in full (default: full, env ALLURE_STEPS).")
+    group.addoption("--benchmark-baseline", action="store",
+                    default=os.environ.get("BENCHMARK_BASELINE", ".benchmarks/baseline.json"),
+                    help="JSON file of the operation benchmark baselines "
+                         "(default: .benchmarks/baseline.json, env BENCHMARK_BASELINE).")
+    group.addoption("--benchmark-tolerance", action="store", type=float,
+                    default=float(os.environ.get("BENCHMARK_TOLERANCE", DEFAULT_TOLERANCE)),
+                    help="How much slower than its baseline the median of an operation may get before its "
+                         f"benchmark fails, e.g. 0.2 for 20%% (default: {DEFAULT_TOLERANCE}, env BENCHMARK_TOLERANCE).")
+    group.addoption("--benchmark-save", action="store_true", default=os.environ.get("BENCHMARK_SAVE") == "1",
+                    help="Store the operation benchmarks of the run as the new baselines instead of failing on "
+                         "regressions (env BENCHMARK_SAVE=1).")
+
+
+def _is_xdist_controller(config) -> bool:
+    """
+    Checks whether this process only distributes tests to xdist workers instead of running them.
+
+    Args:
+        config: The pytest config object.
+
+    Returns:
+        bool: True for the controller of a parallel run.
+    """
+    return not hasattr(config, "workerinput") and bool(config.getoption("numprocesses", None))
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    """
+    Resolves the base URL of the application under test, the typing strategy, tracing, HAR recording, request
+    routing, the locator profiling, the dataset shard and the benchmark baselines, and prepares parallel runs.
+
+    The URL comes from --base-url (pytest-base-url, also settable with PYTEST_BASE_URL or the 'base_url' ini
+    option) and defaults to the hosted application. With --local-app every test process starts its own seeded
+    copy of the bundled server and uses it instead.
+
+    In a parallel run every worker writes its results into the same Allure directory, so only the controller may
+    clean it.
+
+    Args:
+        config: The pytest config object.
+    """
+    if hasattr(config, "workerinput"):
+        config.option.clean_alluredir = False
+    if config.getoption("--typing-strategy") != "auto":
+        set_forced_strategy(TypingStrategy(config.getoption("--typing-strategy")))
+    # pytest-playwright's --tracing only covers its own 'context' fixture, the pooled contexts are traced here
+    if config.getoption("--tracing") != "off":
+        # Every worker gets an equal share of the run's budget
+        trace_recorder.enabled = True
+        trace_recorder.directory = "allure-results/traces"
+        trace_recorder.budget_bytes = int(config.getoption("--trace-budget-mb") * 2 ** 20 / worker_count())
+    locator_profiler.probe_resolution = config.getoption("--locator-profile")
+    request_router.policy = ROUTING_POLICIES[config.getoption("--routing")]
+    har_router.mode, har_router.directory = config.getoption("--har"), config.getoption("--har-dir")
+    # A replay doesn't reach the network, not even to measure the assets the routing blocks
+    request_router.measure_blocked = not har_router.replaying
+    operation_benchmarks.path = config.getoption("--benchmark-baseline")
+    operation_benchmarks.tolerance = config.getoption("--benchmark-tolerance")
+    operation_benchmarks.save = config.getoption("--benchmark-save")
+    try:
+        config.stash[dataset_shard_key] = parse_shard(config.getoption("--dataset-shard"))
+    except ValueError as e:
+        raise pytest.UsageError(str(e))
+    if config.getoption("--local-app") and not _is_xdist_controller(config):
+        server: LocalAppServer = create_server()
+        app_config.set_base_url(server.start_in_thread())
+        config.stash[local_app_key] = server
+    elif config.getoption("base_url", None) or config.getini("base_url"):
+        app_config.set_base_url(config.getoption("base_url", None) or config.getini("base_url"))
+
+
+def pytest_unconfigure(config):
+    """
+    Stops the bundled server started by pytest_configure.
+
+    Args:
+        config: The pytest config object.
+    """
+    server: LocalAppServer | None = config.stash.get(local_app_key, None)
+    if server is not None:
+        server.stop()
+
+
+def pytest_sessionstart(session):
+    """
+    Starts collapsing the passing Allure steps with --allure-steps=compact, once allure-pytest has registered its
+    listener in its own pytest_configure.
+
+    Args:
+        session: The pytest session.
+    """
+    listener = session.config.pluginmanager.get_plugin("allure_listener")
+    if session.config.getoption("--allure-steps") == "compact" and listener is not None:
+        step_collapser.install(listener)
+
+
+def pytest_sessionfinish(session):
+    """
+    Waits for the failure artifacts to be written, unmaps the datasets, stores the operation benchmarks with
+    --benchmark-save and writes the per-endpoint metrics of the API requests of the run to --api-metrics.
+
+    Every xdist worker writes its own file, named after the worker, e.g. 'api-metrics-gw0.json'.
+
+    Args:
+        session: The pytest session.
+    """
+    failure_artifacts.close()
+    close_datasets()
+    if operation_benchmarks.save and operation_benchmarks.comparisons:
+        operation_benchmarks.write()
+    path: str = session.config.getoption("--api-metrics")
+    if not path or not api_metrics.endpoints:
+        return
+    if worker_id() != "main":
+        root, extension = os.path.splitext(path)
+        path = f"{root}-{worker_id()}{extension}"
+    api_metrics.write_json(path)
+
+
+def _scale_sizes(config) -> list[int]:
+    """
+    Parses the contact counts of --scale-sizes.
+
+    Args:
+        config: The pytest config object.
+
+    Returns:
+        list[int]: The contact counts, empty when the large-dataset tests are disabled.
+    """
+    return [int(size) for size in config.getoption("--scale-sizes").split(",") if size.strip()]
+
+
+def pytest_generate_tests(metafunc):
+    """
+    Parametrizes the large-dataset tests with the contact counts of --scale-sizes, and the tests marked with
+    'dataset' with the records of their dataset that belong to --dataset-shard.
+
+    Only a reference (path and index) of every record is collected, so every xdist worker collects the same tests
+    without reading the dataset. The marked argument has to be a fixture, which is parametrized indirectly and reads
+    its record with `_dataset_record` when it is set up, before the fixtures that depend on it.
+
+    Args:
+        metafunc: The test function being collected.
+    """
+    if "contact_count" in metafunc.fixturenames:
+        sizes: list[int] = _scale_sizes(metafunc.config) or [1000]
+        metafunc.parametrize("contact_count", sizes, ids=[f"{size}_contacts" for size in sizes])
+    for marker in metafunc.definition.iter_markers("dataset"):
+        argname, path = marker.args
+        records: list[DatasetRecord] = shard_records(path, metafunc.config.stash[dataset_shard_key])
+        metafunc.parametrize(argname, records, indirect=True,
+                             ids=[f"{argname}{record.index}" for record in records])
+
+
+def _dataset_record(request) -> dict[str, object] | None:
+    """
+    Reads the record a fixture was parametrized with by a 'dataset' marker, and adds it to the Allure parameters.
+
+    Args:
+        request: The fixture's request.
+
+    Returns:
+        dict[str, object] | None: The record, None if the fixture wasn't parametrized from a dataset.
+    """
+    reference: DatasetRecord | None = getattr(request, "param", None)
+    if not isinstance(reference, DatasetRecord):
+        return None
+    record: dict[str, object] = reference.load()
+    allure.dynamic.parameter(request.fixturename, record)
+    return record
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Skips the opt-in tests whose option wasn't given, the benchmarks unless they were selected with -m, the
+    tests marked 'local_app' unless they run against the bundled app, so they never flood the hosted one, and the
+    tests marked 'live_backend' in a strict HAR replay.
+
+    Args:
+        config: The pytest config object.
+        items: The collected tests.
+    """
+    if not _scale_sizes(config):
+        skip_scale = pytest.mark.skip(reason="large-dataset test, enable it with --scale-sizes")
+        for item in items:
+            if "scale" in item.keywords:
+                item.add_marker(skip_scale)
+    if "benchmark" not in (config.getoption("markexpr", "") or ""):
+        skip_benchmark = pytest.mark.skip(reason="benchmark, select it with -m benchmark")
+        for item in items:
+            if "benchmark" in item.keywords:
+                item.add_marker(skip_benchmark)
+    if not config.getoption("--load-concurrency") and not config.getoption("--load-rps"):
+        skip_load = pytest.mark.skip(reason="load test, enable it with --load-concurrency or --load-rps")
+        for item in items:
+            if "load" in item.keywords:
+                item.add_marker(skip_load)
+    if not config.getoption("--local-app"):
+        skip_local = pytest.mark.skip(reason="too heavy for the hosted app, run it with --local-app")
+        for item in items:
+            if item.get_closest_marker("local_app") is not None:
+                item.add_marker(skip_local)
+    if config.getoption("--har") == "replay-strict":
+        skip_live = pytest.mark.skip(reason="needs the live backend, it can't be replayed from a HAR file")
+        for item in items:
+            if item.get_closest_marker("live_backend") is not None:
+                item.add_marker(skip_live)
+
+
+def pytest_report_header(config):
+    """
+    Hook to show the application under test in the header of the run.
+
+    Args:
+        config: The pytest config object.
+    """
+    return f"application under test: {app_config.base_url()}"
+
+
+@pytest.fixture(scope="session")
+def playwright_instance():
+    """
+    Fixture to start the single Playwright driver shared by the browser pool and the API client.
+
+    The sync API allows only one running Playwright instance per thread, so every other fixture has to reuse
+    this one instead of entering `sync_playwright()` itself.
+
+    Scope: 'session' (One driver per worker)
+
+    Returns:
+        playwright (Playwright): The running Playwright instance.
+    """
+    with sync_playwright() as playwright:
+        yield playwright
+
+
+@pytest.fixture(scope="session")
+def browser_pool(request, playwright_instance: Playwright):
+    """
+    Fixture to provide the worker's browser pool.
+
+    The browser is launched once with the profile selected by --browser-profile and relaunched every
+    --recycle-after tests. The pool is stored on the config so its timings can be reported at the end of the run.
+
+    Scope: 'session' (One browser pool per worker)
+
+    Returns:
+        pool (BrowserPool): The BrowserPool handing out contexts and pages.
+
+    Cleanup:
+        The browser is closed after the session ends.
+    """
+    pool = BrowserPool(playwright_instance, BROWSER_PROFILES[request.config.getoption("--browser-profile")],
+                       request.config.getoption("--recycle-after"))
+    request.config.stash[browser_pool_key] = pool
+    yield pool
+    pool.close()
 
 
 @pytest.fixture(scope="function")
-def setup():
+def setup(request, browser_pool: BrowserPool):
     """
     Fixture to initialize the Playwright browser page instance.
 
-    This fixture launches a Chromium browser with the provided configuration (headless=False for visual debugging,
-    slow motion enabled, maximized window) and navigates to the main URL of the application.
-    The page object is returned for use in the test and ensures browser cleanup after test execution.
+    This fixture takes an isolated browser context and page from the already running pooled browser and navigates
+    to the main URL of the application. The launch, context creation and teardown timings are attached to the
+    Allure report. With --tracing the test is traced and the trace attached if the test fails. The context's
+    requests are routed with --routing, unless the test is marked 'full_fidelity'.
 
-    Scope: 'function' (Each test will have a fresh browser page instance)
+    Scope: 'function' (Each test will have a fresh browser context and page)
 
     Returns:
         page (Page): The Playwright page instance that represents the browser tab.
 
     Cleanup:
-        The browser is closed after the test completes.
+        The browser context is closed after the test completes.
     """
-    with sync_playwright() as playwright:
-        browser: Browser = playwright.chromium.launch(headless=False, slow_mo=500, args=['--start-maximized'])
-        context: BrowserContext = browser.new_context(no_viewport=True)
-        page: Page = context.new_page()
-        page.goto(MAIN_URL)
+    session: PooledSession = browser_pool.acquire(request.node.nodeid)
+    page: Page = session.page
+    try:
+        _start_session(request.node, session)
+        page.goto(app_config.base_url())
         yield page  # Return the 'page' object to be used in the test
-        browser.close()
+    finally:
+        unmatched: list[str] = _finish_session(request.node, session)
+        browser_pool.release(session)
+    allure.attach(str(session.timing), name="Browser timings", attachment_type=allure.attachment_type.TEXT)
+    _fail_on_unmatched(unmatched)
 
 
 @pytest.fixture(scope="session")
-def api_client():
+def worker_account(api_transport: Transport):
+    """
+    Fixture to register an account that belongs to this worker alone.
+
+    The account from resources/worker_account_data.jsonc is registered with an email that is unique for the run and
+    the worker, and gets the contacts listed there. Tests that change contacts use it, so parallel workers never
+    edit or delete each other's data.
+
+    Scope: 'session' (One account per worker)
+
+    Returns:
+        credentials (dict): The 'email' and 'password' of the account.
+
+    Cleanup:
+        The account and its contacts are deleted after the session ends.
+    """
+    account: dict[str, object] = dict(get_json("resources/worker_account_data.jsonc")[0])
+    contacts: list[dict[str, object]] = account.pop("contacts")
+    account["email"] = unique_email(str(account["email"]))
+    client = APIClient(api_transport, app_config.base_url())
+    response = client.post("users", account)
+    if not response.ok:
+        raise Exception(f"Error registering the worker account {account['email']}: {response.text()}")
+    client.authenticate(str(account["email"]), str(account["password"]), response.json().get("token"))
+    for contact in contacts:
+        response = client.post("contacts", contact)
+        if not response.ok:
+            raise Exception(f"Error adding a contact to the worker account: {response.text()}")
+    yield {"email": account["email"], "password": account["password"]}
+    client.delete("users/me")
+    token_manager.forget(token_manager.key(client.base_url, str(account["email"]), str(account["password"])))
+
+
+@pytest.fixture(scope="function")
+def scale_account(contact_count: int):
+    """
+    Fixture to register an account with `contact_count` generated contacts for the large-dataset tests.
+
+    The contacts are added through concurrent API requests (see utils/scale.py).
+
+    Returns:
+        account (dict): The 'email', 'password' and 'token' of the account and the 'seed_seconds' it took.
+
+    Cleanup:
+        The account and its contacts are deleted after the test.
+    """
+    with allure.step(f"Seed an account with {contact_count} contacts"):
+        account: dict[str, object] = run_async(seed_scale_account(app_config.base_url(), contact_count))
+    yield account
+    run_async(delete_account(app_config.base_url(), str(account["token"])))
+
+
+@pytest.fixture(scope="function")
+def login_credentials(request):
+    """
+    Fixture to provide the credentials of the worker's own account, or of the record of a test marked with
+    `@pytest.mark.dataset("login_credentials", ...)`.
+
+    The record is read before the fixtures that depend on the credentials, e.g. `logged_in_setup`, are set up. A
+    HAR replay uses the credentials the test was recorded with, so no worker account is registered.
+
+    Returns:
+        credentials (dict): The 'email' and 'password' to log in with.
+    """
+    record: dict[str, object] | None = _dataset_record(request)
+    if record is not None:
+        return record
+    login: dict[str, object] | None = har_router.recorded_login(request.node.nodeid)
+    return login["credentials"] if login is not None else request.getfixturevalue("worker_account")
+
+
+@pytest.fixture(autouse=True)
+def wait_report():
+    """
+    Fixture to attach the waits of a UI test to the Allure report.
+
+    Every wait performed through the BasePage wait methods is recorded with how long it blocked and which fixed
+    sleep it replaced, so the report shows the time saved per test.
     """
-    Fixture to create an API client for making requests to the backend.
+    yield
+    if wait_recorder.records:
+        allure.attach(wait_recorder.finish_test(), name="Waits", attachment_type=allure.attachment_type.TEXT)
 
-    This fixture sets up an APIClient instance, which uses Playwright's request context for interacting with the API.
-    The fixture is scoped to the session, meaning the same instance is shared across multiple tests.
+
+@pytest.fixture(autouse=True)
+def api_request_report():
+    """
+    Fixture to attach the API requests of a test to the Allure report.
+
+    Every request sent through the APIClient is recorded with its endpoint, status, sizes and wall time. The
+    requests are also aggregated per endpoint over the run and written to --api-metrics at the end.
+    """
+    yield
+    if api_metrics.records:
+        allure.attach(api_metrics.finish_test(), name="API requests", attachment_type=allure.attachment_type.TEXT)
+
+
+@pytest.fixture(scope="session")
+def auth_cache(api_client: APIClient):
+    """
+    Fixture to provide the worker's cache of authenticated storage states.
+
+    Scope: 'session' (Each credential set logs in once per worker)
+
+    Returns:
+        cache (AuthStateCache): The AuthStateCache keyed by credential set.
+    """
+    return AuthStateCache(api_client, app_config.base_url())
+
+
+def _start_session(item, session: PooledSession):
+    """
+    Starts tracing the test's session, records or replays it with --har and routes its requests, unless the test is
+    marked 'full_fidelity'.
+
+    Args:
+        item: The test item.
+        session (PooledSession): The test's new session, before its first navigation.
+    """
+    trace_recorder.start(session.context, item.nodeid)
+    # Installed before the routing policy, whose routes take precedence for the assets it blocks
+    har_router.install(session.context, item.nodeid, app_config.base_url())
+    full_fidelity: bool = item.get_closest_marker("full_fidelity") is not None
+    request_router.install(session.context, item.nodeid, full_fidelity=full_fidelity)
+
+
+def _finish_session(item, session: PooledSession) -> list[str]:
+    """
+    Stops tracing the test's session, keeping and attaching the trace if the test failed or is a retry (or always
+    with --tracing=on), and attaches the requests its routing blocked and its HAR replay couldn't answer.
+
+    Args:
+        item: The test item.
+        session (PooledSession): The test's session, before it is released.
+
+    Returns:
+        list[str]: The requests a strict HAR replay couldn't answer, the test fails with them once the session is
+            released.
+    """
+    har: HarSession | None = har_router.finish(session.context)
+    if har is not None and har.unmatched:
+        allure.attach("\n".join(har.unmatched), name="Unmatched HAR requests",
+                      attachment_type=allure.attachment_type.TEXT)
+    routing: RoutingStats | None = request_router.finish(session.context)
+    if routing is not None:
+        allure.attach(str(routing), name="Blocked requests", attachment_type=allure.attachment_type.TEXT)
+    reports: dict[str, pytest.TestReport] = item.stash.get(phase_reports_key, {})
+    failed: bool = any(report.failed for report in reports.values())
+    retried: bool = getattr(item, "execution_count", 1) > 1  # Set by pytest-rerunfailures
+    retain: bool = failed or retried or item.config.getoption("--tracing") == "on"
+    record = trace_recorder.stop(session.context, retain=retain)
+    if record is not None and record.path:
+        allure.attach.file(record.path, name="Playwright trace", extension="zip")
+    return har.unmatched if har is not None else []
+
+
+def _fail_on_unmatched(unmatched: list[str]):
+    """
+    Fails a strict HAR replay whose application requests weren't all in the HAR file.
+
+    Args:
+        unmatched (list[str]): The requests that weren't in the file.
+    """
+    if unmatched:
+        pytest.fail(f"{len(unmatched)} requests not in the HAR file, re-record it with --har=record:\n"
+                    + "\n".join(unmatched))
+
+
+def _open_contact_list(page: Page) -> bool:
+    """
+    Opens the contact list and reports whether the application accepted the session token.
+
+    Args:
+        page (Page): The page of an authenticated context.
+
+    Returns:
+        bool: False if the contacts request was rejected, i.e. the cached token is no longer valid.
+    """
+    with page.expect_response(lambda response: response.url.endswith("/contacts")
+                              and response.request.method == "GET") as response_info:
+        page.goto(ContactListPage(page).url)
+    return response_info.value.status != 401
+
+
+@pytest.fixture(scope="function")
+def logged_in_setup(request, browser_pool: BrowserPool, login_credentials: dict[str, object]):
+    """
+    Fixture to provide a page that is already logged in and showing the contact list.
+
+    The test's browser context is created from the cached storage state of `login_credentials` (the test's
+    parametrized credentials), so the login form is skipped entirely. A token the application rejects is refreshed
+    once transparently. With --tracing the test is traced and the trace attached if the test fails. The context's
+    requests are routed with --routing, unless the test is marked 'full_fidelity'. With --har=record the storage
+    state is saved next to the test's HAR file, and a replay starts from it without logging in.
+
+    Scope: 'function' (Each test will have a fresh browser context and page)
+
+    Returns:
+        page (Page): The Playwright page instance on the contact list page.
+
+    Cleanup:
+        The browser context is closed after the test completes.
+    """
+    email, password = str(login_credentials.get('email')), str(login_credentials.get('password'))
+    login: dict[str, object] | None = har_router.recorded_login(request.node.nodeid)
+    # A replay starts from the recorded session, without the worker's auth cache and its logins
+    auth_cache: AuthStateCache | None = request.getfixturevalue("auth_cache") if login is None else None
+    login_browser = browser_pool.browser if request.config.getoption("--login-via") == "ui" else None
+    storage_state: str | dict[str, object] = (login["storage_state"] if login is not None
+                                              else auth_cache.storage_state(email, password, login_browser))
+    session: PooledSession = browser_pool.acquire(request.node.nodeid, storage_state=storage_state)
+    try:
+        _start_session(request.node, session)
+        if login is not None:
+            # Every request is answered from the HAR file, no backend checks the recorded token
+            ContactListPage(session.page).open()
+        elif not _open_contact_list(session.page):
+            # The token was revoked or expired server side: log in again and start over with a fresh context
+            trace_recorder.stop(session.context, retain=False)
+            har_router.finish(session.context)
+            request_router.finish(session.context)
+            browser_pool.release(session)
+            auth_cache.invalidate(email, password)
+            storage_state = auth_cache.storage_state(email, password, login_browser)
+            session = browser_pool.acquire(request.node.nodeid, storage_state=storage_state)
+            _start_session(request.node, session)
+            ContactListPage(session.page).open()
+        har_router.save_login(request.node.nodeid, {"email": email, "password": password}, storage_state)
+        yield session.page
+    finally:
+        unmatched: list[str] = _finish_session(request.node, session)
+        browser_pool.release(session)
+    allure.attach(str(session.timing), name="Browser timings", attachment_type=allure.attachment_type.TEXT)
+    _fail_on_unmatched(unmatched)
+
+
+@pytest.fixture(scope="session")
+def api_request_context(playwright_instance: Playwright):
+    """
+    Fixture to create the Playwright request context of the 'playwright' API transport.
+
+    Scope: 'session' (One request context per worker)
+
+    Returns:
+        request_context (APIRequestContext): The request context.
+
+    Cleanup:
+        The request context is disposed after the session ends.
+    """
+    request_context: APIRequestContext = playwright_instance.request.new_context()
+    yield request_context
+    request_context.dispose()
+
+
+@pytest.fixture(scope="session")
+def api_transport(request):
+    """
+    Fixture to create the transport selected by --api-transport, shared by the API clients of the worker.
+
+    Only the 'playwright' transport starts the Playwright driver, so API-only runs with another transport don't.
+
+    Scope: 'session' (One transport per worker)
+
+    Returns:
+        transport (Transport): The transport.
+
+    Cleanup:
+        The transport's connections are closed after the session ends.
+    """
+    name: str = request.config.getoption("--api-transport")
+    request_context: APIRequestContext | None = (request.getfixturevalue("api_request_context")
+                                                 if name == "playwright" else None)
+    transport: Transport = create_transport(name, request_context)
+    yield transport
+    transport.close()
+
+
+@pytest.fixture(scope="session")
+def api_client(api_transport: Transport):
+    """
+    Fixture to create an unauthenticated API client for making requests to the backend.
+
+    The client is shared across the session, so tests must not give it a token; tests acting as a user take
+    'user_client' instead.
 
     Scope: 'session' (The same client instance will be used throughout the session)
 
     Returns:
         client (APIClient): The APIClient instance for making API requests.
+    """
+    return APIClient(api_transport, app_config.base_url())
+
+
+@pytest.fixture(scope="session")
+def api_user(api_transport: Transport):
+    """
+    Fixture to register a user for the API tests of this worker, on first use.
+
+    Tests only read the user and its token, so one user per worker is safe to share; the data they change (its
+    contacts) comes from 'contact_factory'.
+
+    Scope: 'session' (One user per worker)
+
+    Returns:
+        user (ApiUser): The registered user.
 
     Cleanup:
-        The request context is disposed after the session ends.
+        The user and its contacts are deleted after the session ends.
     """
-    with sync_playwright() as playwright:
-        request_context: APIRequestContext = playwright.request.new_context()
-        client = APIClient(request_context, MAIN_URL)
-        yield client
-        request_context.dispose()
+    factory = UserFactory(api_transport, app_config.base_url())
+    try:
+        yield factory.create()
+    finally:
+        factory.cleanup()
+
+
+@pytest.fixture(scope="function")
+def user_factory(api_transport: Transport):
+    """
+    Fixture to register users on demand, e.g. for tests that change or delete their user.
+
+    Returns:
+        factory (UserFactory): The factory.
+
+    Cleanup:
+        The users the test created or adopted are deleted after the test.
+    """
+    factory = UserFactory(api_transport, app_config.base_url())
+    yield factory
+    factory.cleanup()
+
+
+@pytest.fixture(scope="function")
+def user_client(api_transport: Transport, api_user: ApiUser):
+    """
+    Fixture to provide an API client authenticated as the worker's API user, of the test's own.
+
+    Returns:
+        client (APIClient): The authenticated client.
+    """
+    return UserFactory(api_transport, app_config.base_url()).client(api_user)
+
+
+@pytest.fixture(scope="function")
+def contact_factory(user_client: APIClient):
+    """
+    Fixture to add contacts for the worker's API user on demand.
+
+    Returns:
+        factory (ContactFactory): The factory.
+
+    Cleanup:
+        The contacts the test created or adopted are deleted after the test.
+    """
+    factory = ContactFactory(user_client)
+    yield factory
+    factory.cleanup()
+
+
+@pytest.fixture(scope="function")
+def contact(contact_factory: ContactFactory):
+    """
+    Fixture to provide a contact of the worker's API user that belongs to the test alone.
+
+    Returns:
+        contact (dict): The contact as returned by the API, with its '_id'.
+    """
+    return contact_factory.create()
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    """
+    Hook to print the resource file loading, the browser pool timings, the HAR recordings, the blocked requests, the
+    tracing cost, the time per selector, the wait savings, the typing costs, the Allure report size, the API tokens,
+    the API transport benchmarks, the operation benchmarks, the API request metrics, the large-dataset measurements
+    and the load test results at the end of the run.
+
+    Args:
+        terminalreporter: The terminal reporter plugin.
+        config: The pytest config object.
+    """
+    if resource_cache.records:
+        terminalreporter.write_sep("-", "resource files")
+        terminalreporter.write_line(resource_cache.summary())
+    pool: BrowserPool | None = config.stash.get(browser_pool_key, None)
+    if pool is not None and pool.timings:
+        terminalreporter.write_sep("-", "browser pool")
+        terminalreporter.write_line(pool.summary())
+    if har_router.sessions:
+        terminalreporter.write_sep("-", "har")
+        terminalreporter.write_line(har_router.summary())
+    if request_router.stats:
+        terminalreporter.write_sep("-", "routing")
+        terminalreporter.write_line(request_router.summary())
+    if trace_recorder.records:
+        terminalreporter.write_sep("-", "tracing")
+        terminalreporter.write_line(trace_recorder.summary())
+    if locator_profiler.selectors:
+        terminalreporter.write_sep("-", "locators")
+        terminalreporter.write_line(locator_profiler.summary())
+    if wait_recorder.total_blocked_seconds:
+        terminalreporter.write_sep("-", "waits")
+        terminalreporter.write_line(f"Blocked {wait_recorder.total_blocked_seconds:.2f}s in event-driven waits, "
+                                    f"saved {wait_recorder.total_saved_seconds:.2f}s compared to fixed sleeps")
+    if typing_recorder.records:
+        terminalreporter.write_sep("-", "typing")
+        terminalreporter.write_line(typing_recorder.summary())
+    if token_manager.logins or token_manager.memory_hits or token_manager.shared_hits:
+        terminalreporter.write_sep("-", "tokens")
+        terminalreporter.write_line(token_manager.summary())
+    results_dir: str | None = config.getoption("allure_report_dir", None)
+    if results_dir and os.path.isdir(results_dir) and not config.option.collectonly:
+        terminalreporter.write_sep("-", "allure steps")
+        terminalreporter.write_line(step_collapser.summary(results_dir))
+        for benchmark in step_benchmarks:
+            terminalreporter.write_line(str(benchmark))
+    if transport_benchmarks:
+        terminalreporter.write_sep("-", "api transports")
+        for benchmark in transport_benchmarks:
+            terminalreporter.write_line(str(benchmark))
+    if operation_benchmarks.comparisons:
+        terminalreporter.write_sep("-", "operation benchmarks")
+        terminalreporter.write_line(operation_benchmarks.summary())
+    if api_metrics.endpoints:
+        terminalreporter.write_sep("-", "api requests")
+        terminalreporter.write_line(api_metrics.summary())
+    if scale_results:
+        terminalreporter.write_sep("-", "contact list scale")
+        for metrics in scale_results:
+            terminalreporter.write_line(str(metrics))
+    if load_results:
+        terminalreporter.write_sep("-", "api load")
+        for result in load_results:
+            terminalreporter.write_line(str(result))
 
 
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
-def pytest_runtest_makereport(item):
+def pytest_runtest_makereport(item, call):
     """
-    Hook to capture a screenshot in case of test failure.
+    Hook to attach the failure artifacts of a test to the Allure report.
 
-    This hook adds functionality to capture a screenshot when a test fails, provided the test is not marked as
-    an API test (via @pytest.mark.api). The screenshot is stored in the 'allure-results/screenshots' directory
-    and attached to the Allure report.
+    The report of every phase is also stored on the item, so fixtures can tell in their teardown whether the test
+    failed.
 
-    This hook runs after each test case execution to check the outcome and determine if a screenshot should be captured.
+    When a UI test fails, the page of its 'setup' or 'logged_in_setup' fixture is captured, unless the page
+    objects already captured the same failure on the way up, in which case the report only adds the test's error
+    as context. The screenshots and DOM snapshots of the test are then attached to the Allure report, and copies
+    are written to the 'allure-results/screenshots' directory in the background. API tests (marked with
+    @pytest.mark.api) have no page to capture.
 
     Args:
         item: The test item (test function) being executed.
-
-    Note:
-        If the test fails, a screenshot is captured and attached to the Allure report for visual inspection.
+        call: The result of the test phase, with the error if it failed.
     """
     outcome = yield
     report = outcome.get_result()
-    if "api" in item.keywords:  # Skip API tests
-        return
-    if report.when == "call" and report.failed:
-        try:
-            page = item.funcargs["setup"]  # Access 'setup' fixture (the page object)
-            screenshot_dir = "allure-results/screenshots"
-            os.makedirs(screenshot_dir, exist_ok=True)  # Ensure the directory exists
-            screenshot_path = f"{screenshot_dir}/{item.name}.png"
-            page.screenshot(path=screenshot_path)  # Capture screenshot
-            allure.attach.file(screenshot_path, name="Screenshot on Failure",
-                               attachment_type=allure.attachment_type.PNG)  # Attach to Allure report
-        except Exception as e:
-            print(f"Error capturing screenshot: {e}")
+    item.stash.setdefault(phase_reports_key, {})[report.when] = report
+    if report.when == "call" and report.failed and "api" not in item.keywords:
+        page: Page | None = item.funcargs.get("setup") or item.funcargs.get("logged_in_setup")
+        if page is not None:
+            error: BaseException | None = call.excinfo.value if call.excinfo else None
+            failure_artifacts.capture(page, f"Test failed: {type(error).__name__}: {str(error)[:1000]}", error)
+    if failure_artifacts.artifacts:
+        failure_artifacts.finish_test(item.name, "allure-results/screenshots")
@@ -0,0 +1,78 @@
+// Shared client code of the local Contact List application pages.
+const CONTACT_FIELDS = ["firstName", "lastName", "birthdate", "email", "phone", "street1", "street2", "city",
+    "stateProvince", "postalCode", "country"];
+
+function getToken() {
+    const match = document.cookie.match(/(?:^|; )token=([^;]*)/);
+    return match ? decodeURIComponent(match[1]) : null;
+}
+
+function setToken(token) {
+    document.cookie = "token=" + encodeURIComponent(token) + "; path=/";
+}
+
+function clearToken() {
+    document.cookie = "token=; path=/; max-age=0";
+}
+
+async function api(method, path, body) {
+    const headers = {"Content-Type": "application/json"};
+    const token = getToken();
+    if (token) {
+        headers["Authorization"] = "Bearer " + token;
+    }
+    const response = await fetch("/" + path, {
+        method: method,
+        headers: headers,
+        body: body === undefined ? undefined : JSON.stringify(body),
+    });
+    if (response.status === 401 && path !== "users/login") {
+        clearToken();
+        window.location.href = "/";
+    }
+    return response;
+}
+
+function showError(message) {
+    document.getElementById("error").textContent = message;
+}
+
+async function showResponseError(response) {
+    let message = response.statusText;
+    try {
+        message = (await response.json()).message || message;
+    } catch (e) {
+        // Empty or non-JSON error body
+    }
+    showError(message);
+}
+
+function readForm(fields) {
+    const data = {};
+    for (const field of fields) {
+        data[field] = document.getElementById(field).value;
+    }
+    return data;
+}
+
+function contactAddress(contact) {
+    return [contact.street1, contact.street2].filter(Boolean).join(" ");
+}
+
+function contactCityLine(contact) {
+    return [contact.city, contact.stateProvince, contact.postalCode].filter(Boolean).join(" ");
+}
+
+function requireLogin() {
+    if (!getToken()) {
+        window.location.href = "/";
+    }
+}
+
+function bindLogout() {
+    document.getElementById("logout").addEventListener("click", async () => {
+        await api("POST", "users/logout");
+        clearToken();
+        window.location.href = "/";
+    });
+}
@@ -0,0 +1,354 @@
+import argparse
+import asyncio
+import json
+import os
+import re
+import threading
+from http import HTTPStatus
+from urllib.parse import unquote
+
+import json5
+
+from local_app.store import ContactStore, StoreError
+
+try:
+    import uvloop  # Optional: a faster event loop for load tests
+except ImportError:
+    uvloop = None
+
+ROOT_DIR: str = os.path.dirname(os.path.abspath(__file__))
+PAGES_DIR: str = os.path.join(ROOT_DIR, "pages")
+DEFAULT_SEED: str = os.path.join(os.path.dirname(ROOT_DIR), "resources", "local_app_seed.jsonc")
+
+# URL path -> file in local_app/pages, mirroring the routes of the hosted application
+PAGES: dict[str, str] = {
+    "/": "login.html",
+    "/addUser": "add_user.html",
+    "/contactList": "contact_list.html",
+    "/addContact": "add_contact.html",
+    "/contactDetails": "contact_details.html",
+    "/editContact": "edit_contact.html",
+    "/app.js": "app.js",
+}
+
+CONTACT_ID_ROUTE = re.compile(r"^/contacts/([^/]+)$")
+MAX_HEADER_BYTES: int = 64 * 1024
+
+
+class Response:
+    """
+    A response produced by a route handler.
+
+    Attributes:
+        status (int): The HTTP status code.
+        body (bytes): The encoded body.
+        content_type (str | None): The Content-Type header, None for empty bodies.
+    """
+
+    def __init__(self, status: int, body: bytes = b"", content_type: str | None = None):
+        self.status = status
+        self.body = body
+        self.content_type = content_type
+
+    @classmethod
+    def json(cls, status: int, data: object | None) -> "Response":
+        if data is None:
+            return cls(status)
+        return cls(status, json.dumps(data).encode(), "application/json; charset=utf-8")
+
+
+def _token(headers: dict[str, str]) -> str | None:
+    """
+    Extracts the session token from the Authorization header, falling back to the 'token' cookie.
+
+    Args:
+        headers (dict[str, str]): The request headers with lower-case names.
+
+    Returns:
+        str | None: The token, or None if the request carries none.
+    """
+    authorization: str = headers.get("authorization", "")
+    if authorization.startswith("Bearer "):
+        return authorization[len("Bearer "):].strip()
+    for cookie in headers.get("cookie", "").split(";"):
+        name, _, value = cookie.strip().partition("=")
+        if name == "token" and value:
+            return unquote(value)
+    return None
+
+
+class ContactListApp:
+    """
+    Routes requests to the API endpoints and the HTML pages of the local Contact List application.
+
+    Attributes:
+        store (ContactStore): The application state.
+    """
+
+    def __init__(self, store: ContactStore):
+        """
+        Initializes the application and loads the pages into memory.
+
+        Args:
+            store (ContactStore): The application state.
+        """
+        self.store = store
+        self._pages: dict[str, Response] = {}
+        for path, file_name in PAGES.items():
+            with open(os.path.join(PAGES_DIR, file_name), "rb") as file:
+                content_type = "text/javascript" if file_name.endswith(".js") else "text/html"
+                self._pages[path] = Response(200, file.read(), f"{content_type}; charset=utf-8")
+
+    def handle(self, method: str, path: str, headers: dict[str, str], body: bytes) -> Response:
+        """
+        Handles a single request.
+
+        Args:
+            method (str): The HTTP method.
+            path (str): The request path without the query string.
+            headers (dict[str, str]): The request headers with lower-case names.
+            body (bytes): The request body.
+
+        Returns:
+            Response: The response to send. A body that isn't a JSON object gets a 400, and an unexpected error a
+                500, so the connection is never dropped without a response.
+        """
+        if method == "GET" and path in self._pages:
+            return self._pages[path]
+        try:
+            payload: object = json.loads(body) if body else {}
+        except ValueError:
+            return Response.json(400, {"message": "Invalid JSON body"})
+        if not isinstance(payload, dict):
+            return Response.json(400, {"message": "The JSON body must be an object"})
+        try:
+            return self._route(method, path, headers, payload)
+        except StoreError as e:
+            return Response.json(e.status, e.body)
+        except Exception as e:
+            return Response.json(500, {"message": f"Internal server error: {type(e).__name__}"})
+
+    def _route(self, method: str, path: str, headers: dict[str, str], payload: dict[str, object]) -> Response:
+        store = self.store
+        if path == "/users" and method == "POST":
+            return Response.json(201, store.add_user(payload))
+        if path == "/users/login" and method == "POST":
+            return Response.json(200, store.login(payload))
+
+        if path.startswith("/users/") or path.startswith("/contacts"):
+            token: str | None = _token(headers)
+            user_id: str = store.authenticate(token)
+            if path == "/users/logout" and method == "POST":
+                store.logout(token)
+                return Response(200)
+            if path == "/users/me":
+                if method == "GET":
+                    return Response.json(200, store.get_user(user_id))
+                if method == "DELETE":
+                    store.delete_user(user_id)
+                    return Response(200)
+            if path == "/contacts":
+                if method == "GET":
+                    return Response.json(200, store.list_contacts(user_id))
+                if method == "POST":
+                    return Response.json(201, store.add_contact(user_id, payload))
+            match = CONTACT_ID_ROUTE.match(path)
+            if match:
+                contact_id: str = match.group(1)
+                if method == "GET":
+                    return Response.json(200, store.get_contact(user_id, contact_id))
+                if method in ("PUT", "PATCH"):
+                    return Response.json(200, store.update_contact(user_id, contact_id, payload,
+                                                                   partial=method == "PATCH"))
+                if method == "DELETE":
+                    store.delete_contact(user_id, contact_id)
+                    return Response(200, b"Contact deleted", "text/plain; charset=utf-8")
+        return Response(404, b"Not Found", "text/plain; charset=utf-8")
+
+
+class LocalAppServer:
+    """
+    An asyncio HTTP/1.1 server for the local Contact List application.
+
+    Every connection is a coroutine on a single event loop and connections are kept alive between requests, so the
+    server handles thousands of concurrent clients without a thread per connection. It can run in the foreground
+    (`python -m local_app.server`) or in a background thread of the test process (`start_in_thread`).
+
+    Attributes:
+        app (ContactListApp): The request handler.
+        host (str): The interface to bind.
+        port (int): The port to bind, 0 picks a free one (updated once the server is listening).
+        backlog (int): The listen backlog, sized for bursts of new connections.
+    """
+
+    def __init__(self, app: ContactListApp, host: str = "127.0.0.1", port: int = 0, backlog: int = 4096):
+        self.app = app
+        self.host = host
+        self.port = port
+        self.backlog = backlog
+        self._server: asyncio.AbstractServer | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    async def _read_body(self, reader: asyncio.StreamReader, headers: dict[str, str]) -> bytes:
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks: list[bytes] = []
+            while True:
+                size = int((await reader.readline()).split(b";")[0], 16)
+                chunk = await reader.readexactly(size + 2)
+                if size == 0:
+                    return b"".join(chunks)
+                chunks.append(chunk[:-2])
+        length = int(headers.get("content-length", "0"))
+        return await reader.readexactly(length) if length else b""
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """
+        Serves requests on one connection until the client closes it or asks to.
+
+        Args:
+            reader (asyncio.StreamReader): The connection's input stream.
+            writer (asyncio.StreamWriter): The connection's output stream.
+        """
+        try:
+            while True:
+                try:
+                    head: bytes = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    break
+                request_line, *header_lines = head.decode("latin-1").split("\r\n")
+                method, target, version = request_line.split(" ", 2)
+                headers: dict[str, str] = {}
+                for line in header_lines:
+                    if line:
+                        name, _, value = line.partition(":")
+                        headers[name.strip().lower()] = value.strip()
+                body: bytes = await self._read_body(reader, headers)
+
+                response: Response = self.app.handle(method, target.split("?", 1)[0], headers, body)
+                keep_alive: bool = (headers.get("connection", "").lower() != "close"
+                                    and version.strip() == "HTTP/1.1")
+                status_line = f"HTTP/1.1 {response.status} {HTTPStatus(response.status).phrase}\r\n"
+                head_lines: list[str] = [status_line, f"Content-Length: {len(response.body)}\r\n",
+                                         f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"]
+                if response.content_type:
+                    head_lines.append(f"Content-Type: {response.content_type}\r\n")
+                writer.write("".join(head_lines).encode("latin-1") + b"\r\n" + response.body)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, ValueError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def start(self):
+        """
+        Starts listening on the configured host and port.
+        """
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port,
+                                                  backlog=self.backlog, limit=MAX_HEADER_BYTES, reuse_address=True)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self):
+        """
+        Starts the server and serves until cancelled.
+        """
+        await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    def start_in_thread(self) -> str:
+        """
+        Runs the server on its own event loop in a daemon thread.
+
+        Returns:
+            str: The base URL the server listens on.
+        """
+        ready = threading.Event()
+
+        def run():
+            self._loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+            self._loop.run_until_complete(self.start())
+            ready.set()
+            self._loop.run_forever()
+
+        self._thread = threading.Thread(target=run, name="local-contact-list-app", daemon=True)
+        self._thread.start()
+        ready.wait()
+        return self.base_url
+
+    def stop(self):
+        """
+        Stops a server started with `start_in_thread`.
+        """
+        if self._loop is None:
+            return
+
+        async def shutdown():
+            self._server.close()
+            await self._server.wait_closed()
+            self._loop.stop()
+
+        asyncio.run_coroutine_threadsafe(shutdown(), self._loop)
+        self._thread.join(timeout=5)
+        self._loop = None
+
+
+def create_server(host: str = "127.0.0.1", port: int = 0, seed_path: str | None = DEFAULT_SEED) -> LocalAppServer:
+    """
+    Creates a server with a freshly seeded store.
+
+    Args:
+        host (str): The interface to bind.
+        port (int): The port to bind, 0 picks a free one.
+        seed_path (str | None): A JSONC file with the users and contacts to create, None for an empty store.
+
+    Returns:
+        LocalAppServer: The server, not yet started.
+    """
+    store = ContactStore()
+    if seed_path:
+        with open(seed_path, "r") as file:
+            store.seed(json5.load(file))
+    return LocalAppServer(ContactListApp(store), host, port)
+
+
+def _raise_open_file_limit():
+    """
+    Raises the soft limit of open files to the hard limit so thousands of sockets can be open at once.
+    """
+    try:
+        import resource
+    except ImportError:  # Not available on Windows
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft < hard != resource.RLIM_INFINITY:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in for the Contact List application.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=3000)
+    parser.add_argument("--seed", default=DEFAULT_SEED, help="JSONC file with the initial users and contacts.")
+    parser.add_argument("--no-seed", action="store_true", help="Start with an empty store.")
+    args = parser.parse_args()
+
+    _raise_open_file_limit()
+    server = create_server(args.host, args.port, None if args.no_seed else args.seed)
+    print(f"Serving the Contact List app on http://{args.host}:{args.port}")
+    if uvloop:
+        uvloop.install()
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,350 @@
+import base64
+import hashlib
+import hmac
+import itertools
+import json
+import re
+import time
+
+EMAIL_PATTERN = re.compile(r"^[^\s@]+@[^\s@]+\.[^\s@]+$")
+DATE_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+PHONE_PATTERN = re.compile(r"^\d*$")
+POSTAL_CODE_PATTERN = re.compile(r"^[A-Za-z0-9 -]*$")
+OBJECT_ID_PATTERN = re.compile(r"^[0-9a-f]{24}$")
+
+CONTACT_FIELDS: tuple[str, ...] = ("firstName", "lastName", "birthdate", "email", "phone", "street1", "street2",
+                                   "city", "stateProvince", "postalCode", "country")
+USER_FIELDS: tuple[str, ...] = ("firstName", "lastName", "email", "password")
+
+# Field: (required, max length, pattern, message when the pattern doesn't match)
+CONTACT_RULES: dict[str, tuple[bool, int, re.Pattern | None, str]] = {
+    "firstName": (True, 20, None, ""),
+    "lastName": (True, 20, None, ""),
+    "birthdate": (False, 10, DATE_PATTERN, "Birthdate is invalid"),
+    "email": (False, 60, EMAIL_PATTERN, "Email is invalid"),
+    "phone": (False, 15, PHONE_PATTERN, "Phone number is invalid"),
+    "street1": (False, 40, None, ""),
+    "street2": (False, 40, None, ""),
+    "city": (False, 40, None, ""),
+    "stateProvince": (False, 20, None, ""),
+    "postalCode": (False, 10, POSTAL_CODE_PATTERN, "Postal code is invalid"),
+    "country": (False, 40, None, ""),
+}
+
+
+class StoreError(Exception):
+    """
+    An error the API reports to the client with the given status and JSON body.
+
+    Attributes:
+        status (int): The HTTP status code.
+        body (dict[str, object] | None): The JSON body, or None for an empty response.
+    """
+
+    def __init__(self, status: int, body: dict[str, object] | None = None):
+        super().__init__(f"{status}: {body}")
+        self.status = status
+        self.body = body
+
+
+def _b64(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def validation_error(model: str, errors: dict[str, str]) -> StoreError:
+    """
+    Builds a validation error in the format the Contact List API uses.
+
+    Args:
+        model (str): The name of the validated model ('User' or 'Contact').
+        errors (dict[str, str]): The error message per field.
+
+    Returns:
+        StoreError: A 400 error listing every failing field.
+    """
+    message = ", ".join(f"{field}: {text}" for field, text in errors.items())
+    return StoreError(400, {
+        "errors": {field: {"message": text, "path": field, "kind": "user defined", "name": "ValidatorError"}
+                   for field, text in errors.items()},
+        "_message": f"{model} validation failed",
+        "message": f"{model} validation failed: {message}",
+        "name": "ValidationError",
+    })
+
+
+class ContactStore:
+    """
+    In-memory state of the local Contact List application: users, their tokens and their contacts.
+
+    The store is only touched from the server's event loop, so it needs no locking. Identifiers are generated from
+    a counter, which makes runs against a freshly seeded store deterministic.
+    """
+
+    def __init__(self, secret: str = "local-contact-list"):
+        """
+        Initializes an empty store.
+
+        Args:
+            secret (str): The key used to sign session tokens.
+        """
+        self._secret: bytes = secret.encode()
+        self._ids = itertools.count(1)
+        self.users: dict[str, dict[str, object]] = {}
+        self.users_by_email: dict[str, dict[str, object]] = {}
+        self.passwords: dict[str, str] = {}
+        self.tokens: dict[str, str] = {}
+        self.contacts: dict[str, dict[str, dict[str, object]]] = {}
+
+    def _next_id(self) -> str:
+        return f"{next(self._ids):024x}"
+
+    def _issue_token(self, user_id: str) -> str:
+        """
+        Creates a signed JWT for the user and registers it as a valid session.
+
+        Args:
+            user_id (str): The user the token belongs to.
+
+        Returns:
+            str: The token.
+        """
+        header: str = _b64(json.dumps({"alg": "HS256", "typ": "JWT"}).encode())
+        payload: str = _b64(json.dumps({"_id": user_id, "iat": int(time.time()), "jti": next(self._ids)}).encode())
+        signature: str = _b64(hmac.new(self._secret, f"{header}.{payload}".encode(), hashlib.sha256).digest())
+        token = f"{header}.{payload}.{signature}"
+        self.tokens[token] = user_id
+        return token
+
+    def authenticate(self, token: str | None) -> str:
+        """
+        Resolves a session token to its user.
+
+        Args:
+            token (str | None): The token from the Authorization header or the 'token' cookie.
+
+        Returns:
+            str: The id of the authenticated user.
+
+        Raises:
+            StoreError: 401 if the token is missing or not a valid session.
+        """
+        user_id: str | None = self.tokens.get(token) if token else None
+        if user_id is None:
+            raise StoreError(401, {"error": "Please authenticate."})
+        return user_id
+
+    def add_user(self, payload: dict[str, object]) -> dict[str, object]:
+        """
+        Registers a user and logs them in.
+
+        Args:
+            payload (dict[str, object]): The firstName, lastName, email and password of the user.
+
+        Returns:
+            dict[str, object]: The created user and its token.
+
+        Raises:
+            StoreError: 400 on validation errors or if the email is already in use.
+        """
+        errors: dict[str, str] = {}
+        for field in USER_FIELDS:
+            if not str(payload.get(field) or "").strip():
+                errors[field] = f"Path `{field}` is required."
+        email: str = str(payload.get("email") or "").strip().lower()
+        if email and not EMAIL_PATTERN.match(email):
+            errors["email"] = "Email is invalid"
+        if payload.get("password") and len(str(payload["password"])) < 7:
+            errors["password"] = "Path `password` is shorter than the minimum allowed length (7)."
+        if errors:
+            raise validation_error("User", errors)
+        if email in self.users_by_email:
+            raise StoreError(400, {"message": "Email address is already in use"})
+
+        user: dict[str, object] = {"_id": self._next_id(), "firstName": str(payload["firstName"]),
+                                   "lastName": str(payload["lastName"]), "email": email, "__v": 1}
+        self.users[str(user["_id"])] = user
+        self.users_by_email[email] = user
+        self.passwords[str(user["_id"])] = str(payload["password"])
+        self.contacts[str(user["_id"])] = {}
+        return {"user": dict(user), "token": self._issue_token(str(user["_id"]))}
+
+    def login(self, payload: dict[str, object]) -> dict[str, object]:
+        """
+        Logs a user in with email and password.
+
+        Args:
+            payload (dict[str, object]): The email and password.
+
+        Returns:
+            dict[str, object]: The user and a new token.
+
+        Raises:
+            StoreError: 401 with an empty body for unknown users or wrong passwords.
+        """
+        user = self.users_by_email.get(str(payload.get("email") or "").strip().lower())
+        if user is None or self.passwords[str(user["_id"])] != payload.get("password"):
+            raise StoreError(401)
+        return {"user": dict(user), "token": self._issue_token(str(user["_id"]))}
+
+    def logout(self, token: str):
+        """
+        Revokes a session token.
+
+        Args:
+            token (str): The token to revoke.
+        """
+        self.tokens.pop(token, None)
+
+    def get_user(self, user_id: str) -> dict[str, object]:
+        """
+        Returns the public profile of a user.
+
+        Args:
+            user_id (str): The user's id.
+
+        Returns:
+            dict[str, object]: The user without their password.
+        """
+        return dict(self.users[user_id])
+
+    def delete_user(self, user_id: str):
+        """
+        Deletes a user together with their contacts and sessions.
+
+        Args:
+            user_id (str): The user to delete.
+        """
+        user = self.users.pop(user_id)
+        self.users_by_email.pop(str(user["email"]), None)
+        self.passwords.pop(user_id, None)
+        self.contacts.pop(user_id, None)
+        for token in [token for token, owner in self.tokens.items() if owner == user_id]:
+            del self.tokens[token]
+
+    def _validate_contact(self, contact: dict[str, object]):
+        errors: dict[str, str] = {}
+        for field, (required, max_length, pattern, message) in CONTACT_RULES.items():
+            value: str = str(contact.get(field) or "")
+            if required and not value.strip():
+                errors[field] = f"Path `{field}` is required."
+            elif len(value) > max_length:
+                errors[field] = (f"Path `{field}` (`{value}`) is longer than the maximum allowed length "
+                                 f"({max_length}).")
+            elif value and pattern is not None and not pattern.match(value):
+                errors[field] = message
+        if errors:
+            raise validation_error("Contact", errors)
+
+    def _owned_contact(self, user_id: str, contact_id: str) -> dict[str, object]:
+        if not OBJECT_ID_PATTERN.match(contact_id):
+            raise StoreError(400, {"message": f"Cast to ObjectId failed for value \"{contact_id}\""})
+        contact = self.contacts[user_id].get(contact_id)
+        if contact is None:
+            raise StoreError(404)
+        return contact
+
+    def add_contact(self, user_id: str, payload: dict[str, object]) -> dict[str, object]:
+        """
+        Adds a contact for the user.
+
+        Args:
+            user_id (str): The owner of the contact.
+            payload (dict[str, object]): The contact fields.
+
+        Returns:
+            dict[str, object]: The stored contact.
+
+        Raises:
+            StoreError: 400 on validation errors.
+        """
+        contact: dict[str, object] = {field: payload[field] for field in CONTACT_FIELDS
+                                      if payload.get(field) not in (None, "")}
+        self._validate_contact(contact)
+        contact["_id"] = self._next_id()
+        contact["owner"] = user_id
+        contact["__v"] = 0
+        self.contacts[user_id][str(contact["_id"])] = contact
+        return contact
+
+    def list_contacts(self, user_id: str) -> list[dict[str, object]]:
+        """
+        Returns the user's contacts in insertion order.
+
+        Args:
+            user_id (str): The owner of the contacts.
+
+        Returns:
+            list[dict[str, object]]: The contacts.
+        """
+        return list(self.contacts[user_id].values())
+
+    def get_contact(self, user_id: str, contact_id: str) -> dict[str, object]:
+        """
+        Returns one of the user's contacts.
+
+        Args:
+            user_id (str): The owner of the contact.
+            contact_id (str): The contact's id.
+
+        Returns:
+            dict[str, object]: The contact.
+
+        Raises:
+            StoreError: 400 for malformed ids, 404 if the user has no such contact.
+        """
+        return self._owned_contact(user_id, contact_id)
+
+    def update_contact(self, user_id: str, contact_id: str, payload: dict[str, object],
+                       partial: bool = False) -> dict[str, object]:
+        """
+        Replaces (PUT) or patches (PATCH) a contact.
+
+        Args:
+            user_id (str): The owner of the contact.
+            contact_id (str): The contact to update.
+            payload (dict[str, object]): The new contact fields.
+            partial (bool): Whether fields missing from the payload are kept.
+
+        Returns:
+            dict[str, object]: The updated contact.
+
+        Raises:
+            StoreError: 400 on validation errors or malformed ids, 404 if the contact doesn't exist.
+        """
+        current = self._owned_contact(user_id, contact_id)
+        updated: dict[str, object] = {field: current[field] for field in CONTACT_FIELDS if field in current} \
+            if partial else {}
+        updated.update({field: payload[field] for field in CONTACT_FIELDS if payload.get(field) not in (None, "")})
+        self._validate_contact(updated)
+        updated.update({"_id": contact_id, "owner": user_id, "__v": current["__v"]})
+        self.contacts[user_id][contact_id] = updated
+        return updated
+
+    def delete_contact(self, user_id: str, contact_id: str):
+        """
+        Deletes one of the user's contacts.
+
+        Args:
+            user_id (str): The owner of the contact.
+            contact_id (str): The contact's id.
+
+        Raises:
+            StoreError: 400 for malformed ids, 404 if the user has no such contact.
+        """
+        self._owned_contact(user_id, contact_id)
+        del self.contacts[user_id][contact_id]
+
+    def seed(self, users: list[dict[str, object]]):
+        """
+        Loads users and their contacts, e.g. the accounts the test data refers to.
+
+        Args:
+            users (list[dict[str, object]]): Users with firstName, lastName, email, password and an optional
+                'contacts' list.
+        """
+        for user in users:
+            created = self.add_user(user)
+            user_id = str(created["user"]["_id"])
+            self.logout(str(created["token"]))
+            for contact in user.get("contacts", []):
+                self.add_contact(user_id, contact)
@@ -66,6 +66,7 @@ class AddContactPageLocators:
         country_input (str): Selector for the country input field.
         submit_button (str): Selector for the submit button to save the contact.
         cancel_button (str): Selector for the cancel button to discard changes.
+        contact_form (dict[str, str]): The selectors of the contact fields by field name, for `BasePage.fill_form`.
     """
     first_name_input: str = "[id='firstName']"
     last_name_input: str = "[id='lastName']"
@@ -80,6 +81,19 @@ class AddContactPageLocators:
     country_input: str = "[id='country']"
     submit_button: str = "[id='submit']"
     cancel_button: str = "[id='cancel']"
+    contact_form: dict[str, str] = {
+        "first_name": first_name_input,
+        "last_name": last_name_input,
+        "birthdate": birthdate_input,
+        "email": email_input,
+        "phone": phone_input,
+        "address_street_1": address_street_1_input,
+        "address_street_2": address_street_2_input,
+        "city": city_input,
+        "state_province": state_province_input,
+        "postal_code": postal_code_input,
+        "country": country_input,
+    }
 
 
 class ContactDetailsPageLocators:
@@ -91,11 +105,13 @@ class ContactDetailsPageLocators:
         delete_contact_button (str): Selector for the button to delete the contact.
         return_to_contact_list_button (str): Selector for the button to return to the contact list page.
         contact_details_form (str): Selector for the fields related to contact details.
+        email (str): Selector for the contact's email.
     """
     edit_contact_button = "[id='edit-contact']"
     delete_contact_button = "[id='delete']"
     return_to_contact_list_button = "[id='return']"
     contact_details_form = "[id='contactDetails'] p span"
+    email = "[id='email']"
 
 
 class EditContactPageLocators:
@@ -116,6 +132,7 @@ class EditContactPageLocators:
         country_input (str): Selector for the country input field.
         submit_button (str): Selector for the submit button to save the contact.
         cancel_button (str): Selector for the cancel button to discard changes.
+        contact_form (dict[str, str]): The selectors of the contact fields by field name, for `BasePage.fill_form`.
     """
     first_name_input: str = "[id='firstName']"
     last_name_input: str = "[id='lastName']"
@@ -130,3 +147,5 @@ class EditContactPageLocators:
     country_input: str = "[id='country']"
     submit_button: str = "[id='submit']"
     cancel_button: str = "[id='cancel']"
+    # The edit form has the same fields as the add form
+    contact_form: dict[str, str] = AddContactPageLocators.contact_form
@@ -16,6 +16,8 @@ class ContactDetailsPage(BasePage):
     Attributes:
         page (Page): The Playwright page instance for interacting with the browser.
     """
+    path: str = "/contactDetails"
+    locators: tuple[type, ...] = (ContactDetailsPageLocators,)
 
     def __init__(self, page: Page):
         """
@@ -35,7 +37,7 @@ class ContactDetailsPage(BasePage):
             AssertionError: If the current URL does not match the expected URL.
         """
         try:
-            expect(self.page).to_have_url("https://thinking-tester-contact-list.herokuapp.com/contactDetails")
+            expect(self.page).to_have_url(self.url)
         except AssertionError as e:
             self._attach_screenshot("Page Load Failure")
             raise AssertionError(f"Contact Details Page did not load correctly: {str(e)}")
@@ -43,16 +45,18 @@ class ContactDetailsPage(BasePage):
     @allure.step("Click 'Edit Contact' button")
     def click_edit_contact_button(self) -> EditContactPage:
         """
-        Clicks the 'Edit Contact' button to navigate to the Edit Contact Page.
+        Clicks the 'Edit Contact' button to navigate to the Edit Contact Page, and waits until the page has loaded
+        the contact it prefills the form with, so a late prefill can't overwrite the values entered next.
 
         Returns:
             EditContactPage: An instance of the EditContactPage class.
 
         Raises:
-            Exception: If the click action fails.
+            Exception: If the click action fails, or the contact isn't loaded.
         """
         try:
-            self.click(ContactDetailsPageLocators.edit_contact_button)
+            with self.expect_api_response("contacts/{id}", "GET", page_path=EditContactPage.path):
+                self.click(ContactDetailsPageLocators.edit_contact_button)
             return EditContactPage(self.page)
         except Exception as e:
             self._attach_screenshot("Failed to click 'Edit Contact' button")
@@ -98,15 +102,15 @@ class ContactDetailsPage(BasePage):
         Steps:
             1. Click the 'Delete Contact' button.
             2. Confirm the action in the dialog.
-            3. Wait for the action to complete.
+            3. Wait for the delete request to complete.
 
         Raises:
             Exception: If any step in the delete process fails.
         """
         try:
             self.click_delete_contact_button()
-            self.click_ok_in_dialog()
-            self.page.wait_for_timeout(5000)  # Wait for the deletion process to complete
+            with self.expect_api_response("contacts/{id}", "DELETE", baseline_seconds=5.0):
+                self.click_ok_in_dialog()
         except Exception as e:
             self._attach_screenshot("Failed to delete contact")
             raise Exception(f"Error deleting contact: {str(e)}")
@@ -6,11 +6,24 @@ from locators.contact_list_locators import ContactListPageLocators
 from pages.add_contact_page import AddContactPage
 from pages.contact_details_page import ContactDetailsPage
 from utils.base_page import BasePage
+from utils.contact_table import CONTACT_TABLE_SCRIPT, ContactRow, ContactTable
 
 
 class ContactListPage(BasePage):
+    path: str = "/contactList"
+    locators: tuple[type, ...] = (ContactListPageLocators,)
+
     def __init__(self, page: Page):
         super().__init__(page)
+        self._contacts: ContactTable | None = None
+        self._contacts_read_at: int = -1
+
+    @allure.step("Open the Contact List page")
+    def open(self):
+        """
+        Navigates directly to the Contact List page, e.g. for a context that is already authenticated.
+        """
+        self.navigate(self.url)
 
     @allure.step("Verify user is logged in")
     def is_logged_in(self):
@@ -18,10 +31,76 @@ class ContactListPage(BasePage):
         Checks if the user is on the Contact List page by verifying the URL.
         """
         try:
-            expect(self.page).to_have_url("https://thinking-tester-contact-list.herokuapp.com/contactList")
+            expect(self.page).to_have_url(self.url)
         except AssertionError as e:
             pytest.fail(f"User is not logged in. {str(e)}")
 
+    @allure.step("Wait for {count} contacts to be listed")
+    def wait_for_contacts(self, count: int, timeout: float | None = None):
+        """
+        Waits until the contacts table has at least `count` rows.
+
+        Args:
+            count (int): The number of contacts expected in the table.
+            timeout (float | None): Timeout in milliseconds, defaults to `wait_timeout`.
+        """
+        self.wait_for_elements(ContactListPageLocators.contacts_table, count, timeout=timeout)
+
+    def contacts(self, refresh: bool = False) -> ContactTable:
+        """
+        Reads the contacts table in a single call to the browser, indexed by email and name.
+
+        The snapshot is kept until the page navigates, so repeated lookups don't read the table again. Wait for the
+        contacts to be rendered (e.g. with `wait_for_contacts`) before the first read.
+
+        Args:
+            refresh (bool): Whether to read the table again even though the page didn't navigate.
+
+        Returns:
+            ContactTable: The snapshot of the table.
+        """
+        if refresh or self._contacts is None or self._contacts_read_at != self.locator_registry.invalidations:
+            self._contacts = ContactTable.parse(self.page.evaluate(CONTACT_TABLE_SCRIPT,
+                                                                   ContactListPageLocators.contacts_table))
+            self._contacts_read_at = self.locator_registry.invalidations
+        return self._contacts
+
+    @allure.step("Find contact by email: {email}, name: {name}")
+    def find_contact(self, email: str | None = None, name: str | None = None) -> ContactRow | None:
+        """
+        Finds a contact in the contacts table by email or, without an email, by name.
+
+        Args:
+            email (str | None): The contact's email address.
+            name (str | None): The contact's first and last name, e.g. 'Amy Miller'.
+
+        Returns:
+            ContactRow | None: The contact's row, None if it isn't listed.
+        """
+        return self.contacts().find(email=email, name=name)
+
+    @allure.step("Select contact by email: {email}, name: {name}")
+    def select_contact(self, email: str | None = None, name: str | None = None) -> ContactDetailsPage:
+        """
+        Selects a contact by email or name and navigates to the Contact Details page.
+
+        Args:
+            email (str | None): The contact's email address.
+            name (str | None): The contact's first and last name, e.g. 'Amy Miller'.
+
+        Returns:
+            ContactDetailsPage: An instance of the ContactDetailsPage class.
+
+        Raises:
+            Exception: If the contact isn't listed or can't be clicked.
+        """
+        row: ContactRow | None = self.find_contact(email=email, name=name)
+        if row is None:
+            self._attach_screenshot(f"Contact not found: {email or name}")
+            raise Exception(f"No contact with {'email' if email is not None else 'name'} '{email or name}' in the "
+                            f"list of {len(self.contacts())} contacts")
+        return self.select_contact_by_index(row.index)
+
     @allure.step("Click 'Add New Contact' button")
     def click_add_new_contact(self) -> AddContactPage:
         """
@@ -17,6 +17,7 @@ class HomePage(BasePage):
     Attributes:
         page (Page): The Playwright page instance for interacting with the browser.
     """
+    locators: tuple[type, ...] = (HomePageLocators,)
 
     def __init__(self, page: Page):
         """
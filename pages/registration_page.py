@@ -16,6 +16,8 @@ class RegistrationPage(BasePage):
     Attributes:
         page (Page): The Playwright page instance for interacting with the browser.
     """
+    path: str = "/addUser"
+    locators: tuple[type, ...] = (RegistrationPageLocators,)
 
     def __init__(self, page: Page):
         """
@@ -33,7 +35,7 @@ class RegistrationPage(BasePage):
         Raises:
             AssertionError: If the current URL does not match the expected URL.
         """
-        expect(self.page).to_have_url("https://thinking-tester-contact-list.herokuapp.com/addUser")
+        expect(self.page).to_have_url(self.url)
 
     @allure.step("Input first name: {first_name}")
     def _input_first_name(self, first_name: str):
@@ -47,7 +49,7 @@ class RegistrationPage(BasePage):
             Exception: If the input operation fails.
         """
         try:
-            self.page.locator(RegistrationPageLocators.first_name_input).press_sequentially(first_name, timeout=200)
+            self.type_text(RegistrationPageLocators.first_name_input, first_name)
         except Exception as e:
             self._attach_screenshot("Failed to insert first name")
             raise Exception(f"Error inputting first name: {str(e)}")
@@ -64,7 +66,7 @@ class RegistrationPage(BasePage):
             Exception: If the input operation fails.
         """
         try:
-            self.page.locator(RegistrationPageLocators.last_name_input).press_sequentially(last_name, timeout=200)
+            self.type_text(RegistrationPageLocators.last_name_input, last_name)
         except Exception as e:
             self._attach_screenshot("Failed to insert last name")
             raise Exception(f"Error inputting last name: {str(e)}")
@@ -81,7 +83,7 @@ class RegistrationPage(BasePage):
             Exception: If the input operation fails.
         """
         try:
-            self.page.locator(RegistrationPageLocators.email_input).press_sequentially(email, timeout=200)
+            self.type_text(RegistrationPageLocators.email_input, email)
         except Exception as e:
             self._attach_screenshot("Failed to insert email")
             raise Exception(f"Error inputting email: {str(e)}")
@@ -98,7 +100,7 @@ class RegistrationPage(BasePage):
             Exception: If the input operation fails.
         """
         try:
-            self.page.locator(RegistrationPageLocators.password_input).press_sequentially(password, timeout=200)
+            self.type_text(RegistrationPageLocators.password_input, password)
         except Exception as e:
             self._attach_screenshot("Failed to insert password")
             raise Exception(f"Error inputting password: {str(e)}")
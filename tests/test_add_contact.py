@@ -5,30 +5,29 @@ from playwright.sync_api import expect
 from locators.contact_list_locators import ContactListPageLocators
 from pages.add_contact_page import AddContactPage
 from pages.contacts_list_page import ContactListPage
-from pages.home_page import HomePage
+from utils.contact_table import ContactRow
 from utils.file_handler import get_json
 
 
-@pytest.mark.parametrize("login_credentials", get_json("resources/login_data.jsonc"))
 @pytest.mark.user_interface
 @allure.title("Add Contact")
 @allure.description("Test to perform add contact scenario")
-def test_add_contact(setup, login_credentials: dict[str, object]):
+def test_add_contact(logged_in_setup, login_credentials: dict[str, object]):
     """
     Test for adding a new contact to the contact list.
 
-    This test logs in using the provided credentials, navigates to the 'Add Contact' page,
+    This test starts already logged in with the provided credentials, navigates to the 'Add Contact' page,
     adds new contacts as per the data in the resources/add_contact_data.jsonc file,
     and verifies that the newly added contact appears in the contact list.
 
     Parameters:
-        setup (Page): The setup function that provides a Playwright Page instance for testing.
-        login_credentials (dict): The login credentials used to authenticate the user.
+        logged_in_setup (Page): The fixture that provides a Playwright Page already logged in and on the contact list.
+        login_credentials (dict): The credentials of the worker's own account.
             - 'email': User's email for login.
             - 'password': User's password for login.
 
     Steps:
-        1. Log in using the credentials provided.
+        1. Verify the cached session is logged in.
         2. Navigate to the 'Add Contact' page.
         3. Add contacts by filling in their details from the add_contact_data.jsonc file.
         4. Validate that the newly added contact is listed in the contact list.
@@ -41,12 +40,8 @@ def test_add_contact(setup, login_credentials: dict[str, object]):
     Raises:
         AssertionError: If the contact is not added or not visible in the list.
     """
-    page = setup
-    home_page: HomePage = HomePage(page)
-
-    # Logging in with credentials
-    contact_list_page: ContactListPage = home_page.login_with_credential(str(login_credentials.get('email')),
-                                                                         str(login_credentials.get('password')))
+    page = logged_in_setup
+    contact_list_page: ContactListPage = ContactListPage(page)
     contact_list_page.is_logged_in()
 
     # Fetching the contacts data to be added
@@ -72,22 +67,15 @@ def test_add_contact(setup, login_credentials: dict[str, object]):
             postal_code=str(contact.get('postalCode'))
         )
 
-        # Wait for the page to reload after contact is added
-        page.wait_for_timeout(5000)
-
         # Verifying if the URL matches the expected contact list page URL
-        expect(page).to_have_url("https://thinking-tester-contact-list.herokuapp.com/contactList")
+        expect(page).to_have_url(contact_list_page.url)
 
-        # Extracting the list of contacts from the contact table
-        table_inner_text_list: list[str] = page.locator(ContactListPageLocators.contacts_table).all_inner_texts()
-        table_inner_text_list_formated: list[str] = [text.replace("\t", " ") for text in table_inner_text_list]
+        # Wait for the reloaded contacts to be rendered
+        contact_list_page.wait_for_elements(ContactListPageLocators.contacts_table, baseline_seconds=5.0)
 
-        # Checking if the new contact's email is present in the table
-        contact_added: bool = False
-        for item in table_inner_text_list_formated:
-            if item.__contains__(str(contact.get("email"))):
-                contact_added = True
-                break
+        # Looking the new contact up by email in a snapshot of the contact table
+        row: ContactRow | None = contact_list_page.find_contact(email=str(contact.get("email")))
 
         # Asserting the contact was added successfully
-        assert contact_added is True
+        assert row is not None, f"Contact {contact.get('email')} is not listed"
+        assert row.name == f"{contact.get('firstName')} {contact.get('lastName')}"
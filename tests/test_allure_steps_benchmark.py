@@ -0,0 +1,84 @@
+import json
+import time
+
+import allure
+import attr
+import pytest
+from allure_commons import model2
+
+from utils.allure_steps import STEP_MODES, StepBenchmark, step_benchmarks, step_collapser
+
+FORMS: int = 200
+FIELDS: tuple[str, ...] = ("First Name", "Last Name", "Date of Birth", "Email", "Phone", "Street 1", "Street 2",
+                           "City", "State or Province", "Postal Code", "Country")
+
+
+@allure.step("Fill in {field}")
+def fill_field(field: str, value: str):
+    assert value
+
+
+@allure.step("Fill in the contact form")
+def fill_form(number: int):
+    for field in FIELDS:
+        fill_field(field, f"value {number}")
+
+
+@pytest.mark.benchmark
+@allure.title("Allure step recording benchmark")
+@allure.description("Benchmark of the recording time and the report size of the passing steps in every step mode")
+@pytest.mark.parametrize("mode", STEP_MODES)
+def test_allure_steps_benchmark(request, mode: str):
+    """
+    Benchmark of recording the steps of a page object-like workload in one step mode.
+
+    FORMS form steps, each with a step per field of the contact form, are recorded, then one failing step. The time
+    they take, the time serializing them takes and the size they add to the test result are attached to the report
+    and, together with the other mode, printed in the "allure steps" section of the terminal summary. The steps are
+    then dropped from the result, so the report of the benchmark itself stays small.
+
+    Parameters:
+        request: The pytest request, to get the Allure listener.
+        mode (str): The step mode to measure.
+
+    Asserts:
+        - The failing step is kept in both modes.
+        - Compact mode keeps nothing else than summaries of the passing steps.
+    """
+    listener = request.config.pluginmanager.get_plugin("allure_listener")
+    if listener is None:
+        pytest.skip("Allure isn't recording, run with --alluredir")
+    result: model2.TestResult = listener.allure_logger.get_test(None)
+    was_installed: bool = step_collapser.installed
+    if mode == "compact":
+        step_collapser.install(listener)
+    else:
+        step_collapser.uninstall()
+    before: int = len(result.steps)
+    try:
+        start: float = time.perf_counter()
+        for number in range(FORMS):
+            fill_form(number)
+        seconds: float = time.perf_counter() - start
+        with pytest.raises(AssertionError):
+            fill_field("Email", "")
+    finally:
+        if was_installed:
+            step_collapser.install(listener)
+        else:
+            step_collapser.uninstall()
+    steps: list[model2.TestStepResult] = result.steps[before:]
+    del result.steps[before:]
+
+    # Serialized like allure-pytest's file logger does
+    start = time.perf_counter()
+    report_bytes: int = sum(len(json.dumps(attr.asdict(step, filter=lambda _, value: value or value is False)))
+                            for step in steps)
+    write_seconds: float = time.perf_counter() - start
+    benchmark = StepBenchmark(mode, FORMS * (len(FIELDS) + 1) + 1, seconds, write_seconds, report_bytes)
+    step_benchmarks.append(benchmark)
+    allure.attach(str(benchmark), name="Step recording cost", attachment_type=allure.attachment_type.TEXT)
+
+    assert steps[-1].name == "Fill in 'Email'" and steps[-1].status == "failed", "The failing step wasn't kept"
+    if mode == "compact":
+        assert len(steps) == 2, f"Expected a summary and the failing step, got {[step.name for step in steps]}"
@@ -0,0 +1,74 @@
+import allure
+import pytest
+
+from utils import config as app_config
+from utils.async_api import AsyncAPIClient, BatchResult, async_api_client, run_async
+from utils.schemas import CONTACT
+from utils.workers import unique_email
+
+CONTACT_COUNT: int = 200
+
+
+@allure.epic("Contact List API Testing")
+class TestContactListBatchAPI:
+    """
+    Test suite for the concurrent batch operations of the AsyncAPIClient.
+
+    Every test registers its own account, so the hundreds of contacts it creates don't show up in other tests.
+    """
+
+    @allure.story("Add, Verify and Delete Contacts in Batches")
+    @pytest.mark.api
+    @pytest.mark.local_app
+    def test_contact_batches(self):
+        """
+        Test case for adding, fetching and deleting many contacts concurrently.
+
+        This test registers a user, adds contacts in one concurrent batch together with one invalid contact, fetches
+        and deletes the valid ones in batches and checks the contact list after each step. It sends hundreds of
+        concurrent requests, so it only runs against the local app (--local-app).
+
+        Asserts:
+            - Every valid contact is added, fetched and deleted without failures.
+            - Only the invalid contact is reported as a failure of the add batch.
+            - The contact list holds all contacts after the add batch, each complete (CONTACT schema), and none after
+              the delete batch.
+        """
+        contacts: list[dict[str, object]] = [{"firstName": f"Batch{index}", "lastName": "Contact"}
+                                             for index in range(CONTACT_COUNT)]
+        invalid_contact: dict[str, object] = {"firstName": "Batch", "lastName": "Contact", "email": "invalid-email"}
+
+        async def scenario(client: AsyncAPIClient) -> dict[str, object]:
+            response = await client.post("users", {"firstName": "Batch", "lastName": "User",
+                                                   "email": unique_email("batch-user@fake.com"),
+                                                   "password": "myPassword"})
+            assert response.ok, f"Registration failed: {await response.text()}"
+            client.set_token((await response.json()).get("token"))
+            try:
+                added: BatchResult = await client.add_contacts(contacts + [invalid_contact])
+                contact_ids: list[str] = [(await response.json()).get("_id") for response in added.succeeded]
+                listed: list[dict[str, object]] = await (await client.get("contacts")).json()
+                fetched: BatchResult = await client.get_contacts(contact_ids)
+                deleted: BatchResult = await client.delete_contacts(contact_ids)
+                remaining: int = len(await (await client.get("contacts")).json())
+            finally:
+                await client.delete("users/me")
+            return {"added": added, "listed": listed, "fetched": fetched, "deleted": deleted, "remaining": remaining}
+
+        async def run() -> dict[str, object]:
+            async with async_api_client(app_config.base_url()) as client:
+                return await scenario(client)
+
+        with allure.step(f"Add, fetch and delete {CONTACT_COUNT} contacts in concurrent batches"):
+            outcome: dict[str, object] = run_async(run())
+        for name in ("added", "fetched", "deleted"):
+            allure.attach(outcome[name].report(), name=f"Batch: {name}", attachment_type=allure.attachment_type.TEXT)
+
+        added: BatchResult = outcome["added"]
+        assert [failure.index for failure in added.failures] == [CONTACT_COUNT], added.report()
+        assert "Email is invalid" in added.failures[0].error, "Validation error not reported for the invalid contact"
+        assert len(outcome["listed"]) == CONTACT_COUNT, "Not every added contact is in the contact list"
+        CONTACT.assert_valid(outcome["listed"])
+        assert outcome["fetched"].ok, outcome["fetched"].report()
+        assert outcome["deleted"].ok, outcome["deleted"].report()
+        assert outcome["remaining"] == 0, "Contacts left after the delete batch"
@@ -1,8 +1,17 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import allure
 import pytest
-from playwright.sync_api import expect, APIResponse
+from playwright.sync_api import APIResponse
 
+from utils import config as app_config
+from utils.api import APIClient
+from utils.api_metrics import api_metrics
 from utils.file_handler import get_json
+from utils.schemas import AUTH, CONTACT, USER
+from utils.tokens import TokenManager
+from utils.transport import HttpResponse, Transport, expect_response
+from utils.workers import unique_email
 
 
 @allure.epic("Contact List API Testing")
@@ -13,19 +22,23 @@ class TestContactListAPI:
     This suite includes tests for user registration, user login, adding, updating, retrieving, and deleting contacts.
 
     Each test case is documented to ensure that the API interactions are valid and the responses are correct.
+    Every test gets the users and contacts it needs from the factory fixtures, so the tests run in any order, alone
+    or in parallel.
     """
 
     @allure.story("User Registration")
     @pytest.mark.api
     @pytest.mark.parametrize("registration_credentials", get_json("resources/registration_data.jsonc"))
-    def test_register_user(self, api_client, registration_credentials: dict[str, object]):
+    def test_register_user(self, api_client, user_factory, registration_credentials: dict[str, object]):
         """
         Test case for registering a new user.
 
-        This test registers a user by sending a POST request with the provided registration credentials.
+        This test registers a user by sending a POST request with the provided registration credentials, using an
+        email that is unique for the run and worker.
 
         Parameters:
             api_client (APIClient): The client used to send API requests.
+            user_factory (UserFactory): Deletes the registered user after the test.
             registration_credentials (dict): The credentials used to register a new user, containing:
                 - 'firstName': User's first name.
                 - 'lastName': User's last name.
@@ -34,9 +47,11 @@ class TestContactListAPI:
 
         Asserts:
             - Response status is OK (200-299).
-            - The response contains a user ID and a token.
+            - The response is a complete user with a token (AUTH schema).
         """
-        response: APIResponse = api_client.post("users", registration_credentials)
+        payload: dict[str, object] = {**registration_credentials,
+                                      "email": unique_email(str(registration_credentials.get("email")))}
+        response: APIResponse | HttpResponse = api_client.post("users", payload)
 
         try:
             response_data: dict[str, object] = response.json()
@@ -44,12 +59,9 @@ class TestContactListAPI:
             print("Exception raised while trying to json load the response_content.")
 
         # Assert response status is OK (200-299)
-        expect(response).to_be_ok()
-        # Check that user ID and token are present in the response
-        assert '_id' in response_data.get('user'), "User ID not found in the response"
-        assert 'token' in response_data, "Token not found in the response"
-        # Set token for further requests
-        api_client.set_token(response_data.get("token"))
+        expect_response(response).to_be_ok()
+        AUTH.assert_valid(response_data)
+        user_factory.adopt(response_data, str(payload["password"]))
 
     @allure.story("User Registration Failure (Email Already Exists)")
     @pytest.mark.api
@@ -72,17 +84,17 @@ class TestContactListAPI:
             "email": "test4@fake.com",  # Using an existing email for the negative test
             "password": "myPassword"
         }
-        response: APIResponse = api_client.post("users", payload)
+        response: APIResponse | HttpResponse = api_client.post("users", payload)
 
         # Assert response status is not OK (email conflict)
-        expect(response).not_to_be_ok()
+        expect_response(response).not_to_be_ok()
         response_data: dict[str, object] = response.json()
         # Assert the error message
         assert response_data.get('message') == 'Email address is already in use', "Error message mismatch"
 
     @allure.story("User Login")
     @pytest.mark.api
-    @pytest.mark.parametrize("login_credentials", get_json("resources/login_data.jsonc"))
+    @pytest.mark.dataset("login_credentials", "resources/login_data.jsonl")
     def test_login_user(self, api_client, login_credentials: dict[str, object]):
         """
         Test case for logging in a user.
@@ -97,15 +109,12 @@ class TestContactListAPI:
 
         Asserts:
             - Response status is OK (200-299).
-            - The response contains a token.
+            - The response is a complete user with a token (AUTH schema).
         """
-        response: APIResponse = api_client.post("users/login", login_credentials)
+        response: APIResponse | HttpResponse = api_client.post("users/login", login_credentials)
 
-        expect(response).to_be_ok()  # Validate status
-        response_data: dict[str, object] = response.json()
-        # Assert token presence
-        assert 'token' in response_data, "Token not found in the response"
-        api_client.set_token(response_data.get("token"))
+        expect_response(response).to_be_ok()  # Validate status
+        AUTH.assert_valid(response.json())
 
     @allure.story("User Login Failure (Incorrect Credentials)")
     @pytest.mark.api
@@ -122,24 +131,25 @@ class TestContactListAPI:
             - The response status is not OK (401 Unauthorized).
         """
         payload: dict[str, object] = {"email": "test4@fake.com", "password": "wrongPassword"}
-        response: APIResponse = api_client.post("users/login", payload)
+        response: APIResponse | HttpResponse = api_client.post("users/login", payload)
 
-        expect(response).not_to_be_ok()  # Check for failure status (401 Unauthorized)
+        expect_response(response).not_to_be_ok()  # Check for failure status (401 Unauthorized)
 
     @allure.story("Add New Contact")
     @pytest.mark.api
-    def test_add_contact(self, api_client):
+    def test_add_contact(self, user_client, contact_factory):
         """
         Test case for adding a new contact.
 
         This test adds a new contact using a POST request and validates the successful addition.
 
         Parameters:
-            api_client (APIClient): The client used to send API requests.
+            user_client (APIClient): The client authenticated as the worker's API user.
+            contact_factory (ContactFactory): Deletes the added contact after the test.
 
         Asserts:
             - Response status is OK (200-299).
-            - The response contains a contact ID.
+            - The response is a complete contact (CONTACT schema).
         """
         payload: dict[str, object] = {
             "firstName": "Amy",
@@ -154,23 +164,22 @@ class TestContactListAPI:
             "postalCode": "A1A1A1",
             "country": "USA"
         }
-        response: APIResponse = api_client.post("contacts", payload)
+        response: APIResponse | HttpResponse = user_client.post("contacts", payload)
 
-        expect(response).to_be_ok()  # Validate status code
-        response_data: dict[str, object] = response.json()
-        assert '_id' in response_data, "Contact ID not found in the response"
-        api_client.set_contact_id(response_data.get("_id"))  # Save for future tests
+        expect_response(response).to_be_ok()  # Validate status code
+        response_data: dict[str, object] = CONTACT.assert_valid(response.json())
+        contact_factory.adopt(str(response_data.get("_id")))
 
     @allure.story("Add Contact Failure (Invalid Email)")
     @pytest.mark.api
-    def test_add_contact_with_invalid_email(self, api_client):
+    def test_add_contact_with_invalid_email(self, user_client):
         """
         Test case for adding a contact with an invalid email.
 
         This test attempts to add a new contact with an invalid email format.
 
         Parameters:
-            api_client (APIClient): The client used to send API requests.
+            user_client (APIClient): The client authenticated as the worker's API user.
 
         Asserts:
             - Response status is not OK (failure due to invalid email).
@@ -188,45 +197,47 @@ class TestContactListAPI:
             "postalCode": "A1A1A1",
             "country": "USA"
         }
-        response: APIResponse = api_client.post("contacts", payload)
+        response: APIResponse | HttpResponse = user_client.post("contacts", payload)
 
-        expect(response).not_to_be_ok()  # Validate failure status
+        expect_response(response).not_to_be_ok()  # Validate failure status
 
     @allure.story("Get All Contacts")
     @pytest.mark.api
-    def test_get_contact(self, api_client):
+    def test_get_contact(self, user_client, contact: dict[str, object]):
         """
         Test case for retrieving a contact by ID.
 
         This test fetches a contact using the contact ID and validates the response.
 
         Parameters:
-            api_client (APIClient): The client used to send API requests.
+            user_client (APIClient): The client authenticated as the worker's API user.
+            contact (dict): A contact of the user that belongs to this test.
 
         Asserts:
             - Response status is OK (200-299).
-            - The contact email is present in the response.
+            - The response is a complete contact (CONTACT schema) with the contact's email.
         """
-        response: APIResponse = api_client.get(f"contacts/{api_client.get_contact_id()}")
+        response: APIResponse | HttpResponse = user_client.get(f"contacts/{contact['_id']}")
 
-        expect(response).to_be_ok()  # Validate successful fetch
-        contact: dict[str, object] = response.json()
+        expect_response(response).to_be_ok()  # Validate successful fetch
+        contact: dict[str, object] = CONTACT.assert_valid(response.json())
         assert "amiller2@fake.com" in contact.get('email'), "Contact email not found"
 
     @allure.story("Update Contact")
     @pytest.mark.api
-    def test_update_contact(self, api_client):
+    def test_update_contact(self, user_client, contact: dict[str, object]):
         """
         Test case for updating a contact.
 
         This test updates a contact's details and validates the updated contact's data.
 
         Parameters:
-            api_client (APIClient): The client used to send API requests.
+            user_client (APIClient): The client authenticated as the worker's API user.
+            contact (dict): A contact of the user that belongs to this test.
 
         Asserts:
             - Response status is OK (200-299).
-            - The contact's email is updated.
+            - The response is a complete contact (CONTACT schema) with the updated email.
         """
         payload: dict[str, object] = {
             "firstName": "Amy",
@@ -241,22 +252,22 @@ class TestContactListAPI:
             "postalCode": "A1A1A1",
             "country": "Canada"
         }
-        response: APIResponse = api_client.put(f"contacts/{api_client.get_contact_id()}", payload)
+        response: APIResponse | HttpResponse = user_client.put(f"contacts/{contact['_id']}", payload)
 
-        expect(response).to_be_ok()  # Validate status
-        updated_contact: dict[str, object] = response.json()
+        expect_response(response).to_be_ok()  # Validate status
+        updated_contact: dict[str, object] = CONTACT.assert_valid(response.json())
         assert "amiller@fake.com" in updated_contact.get('email'), "Contact email not updated"
 
     @allure.story("Update Contact Failure (Invalid Contact ID)")
     @pytest.mark.api
-    def test_update_contact_with_invalid_id(self, api_client):
+    def test_update_contact_with_invalid_id(self, user_client):
         """
         Test case for updating a contact with an invalid contact ID.
 
         This test attempts to update a contact using an invalid contact ID.
 
         Parameters:
-            api_client (APIClient): The client used to send API requests.
+            user_client (APIClient): The client authenticated as the worker's API user.
 
         Asserts:
             - Response status is not OK (failure due to invalid contact ID).
@@ -274,45 +285,86 @@ class TestContactListAPI:
             "postalCode": "A1A1A1",
             "country": "Canada"
         }
-        response: APIResponse = api_client.put("contacts/invalid_id", payload)
+        response: APIResponse | HttpResponse = user_client.put("contacts/invalid_id", payload)
 
-        expect(response).not_to_be_ok()  # Validate failure due to invalid ID
+        expect_response(response).not_to_be_ok()  # Validate failure due to invalid ID
 
     @allure.story("Delete Contact")
     @pytest.mark.api
-    def test_delete_contact(self, api_client):
+    def test_delete_contact(self, user_client, contact: dict[str, object]):
         """
         Test case for deleting a contact.
 
         This test deletes a contact by ID and verifies successful deletion.
 
         Parameters:
-            api_client (APIClient): The client used to send API requests.
+            user_client (APIClient): The client authenticated as the worker's API user.
+            contact (dict): A contact of the user that belongs to this test.
 
         Asserts:
             - Response status is OK (200-299).
+            - The remaining contacts are complete (CONTACT schema) and don't include the deleted one.
         """
-        response: APIResponse = api_client.delete(f"contacts/{api_client.get_contact_id()}")
+        response: APIResponse | HttpResponse = user_client.delete(f"contacts/{contact['_id']}")
 
-        expect(response).to_be_ok()  # Validate deletion
+        expect_response(response).to_be_ok()  # Validate deletion
         # Verify deletion by fetching all contacts
-        response = api_client.get("contacts")
-        expect(response).to_be_ok()
+        response = user_client.get("contacts")
+        expect_response(response).to_be_ok()
+        listed_contacts: list[dict[str, object]] = CONTACT.assert_valid(response.json())
+        assert all(listed["_id"] != contact["_id"] for listed in listed_contacts), "Deleted contact is still listed"
 
     @allure.story("Delete Contact Failure (Invalid Contact ID)")
     @pytest.mark.api
-    def test_delete_contact_with_invalid_id(self, api_client):
+    def test_delete_contact_with_invalid_id(self, user_client):
         """
         Test case for attempting to delete a contact with an invalid ID.
 
         This test tries to delete a contact using an invalid contact ID.
 
         Parameters:
-            api_client (APIClient): The client used to send API requests.
+            user_client (APIClient): The client authenticated as the worker's API user.
 
         Asserts:
             - Response status is not OK (failure due to invalid contact ID).
         """
-        response: APIResponse = api_client.delete("contacts/invalid_id")
+        response: APIResponse | HttpResponse = user_client.delete("contacts/invalid_id")
 
-        expect(response).not_to_be_ok()  # Validate failure due to invalid ID
+        expect_response(response).not_to_be_ok()  # Validate failure due to invalid ID
+
+    @allure.story("Client Shared by Threads")
+    @pytest.mark.api
+    def test_client_shared_by_threads(self, api_transport: Transport, user_factory):
+        """
+        Test case for sending requests from a thread pool through one APIClient.
+
+        This test authenticates a client without a token, with a token manager of its own and no shared file, and
+        sends concurrent requests through it from several threads. It needs a thread-safe --api-transport.
+
+        Parameters:
+            api_transport (Transport): The transport of the client.
+            user_factory (UserFactory): Registers the user the client authenticates as.
+
+        Asserts:
+            - Every response is OK (200-299) and the user is complete (USER schema).
+            - The threads waited for a single login instead of each logging in.
+            - Every request was recorded in the API request metrics.
+        """
+        if not api_transport.thread_safe:
+            pytest.skip(f"The '{api_transport.name}' transport isn't thread-safe, "
+                        "use --api-transport=requests or async")
+        user = user_factory.create()
+        tokens = TokenManager(path=None)
+        client = APIClient(api_transport, app_config.base_url(), tokens=tokens)
+        client.authenticate(user.email, user.password)
+        recorded: int = len(api_metrics.records)
+
+        with ThreadPoolExecutor(8) as executor:
+            responses: list[APIResponse | HttpResponse] = list(executor.map(lambda _: client.get("users/me"),
+                                                                            range(40)))
+
+        for response in responses:
+            expect_response(response).to_be_ok()
+        USER.assert_valid([response.json() for response in responses])
+        assert tokens.logins == 1, f"Expected a single login, got {tokens.logins}"
+        assert len(api_metrics.records) - recorded == 41, "Not every request was recorded"
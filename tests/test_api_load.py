@@ -0,0 +1,55 @@
+import json
+
+import allure
+import pytest
+
+from utils import config as app_config
+from utils.async_api import run_async
+from utils.load import LoadResult, load_results, run_load
+
+MAX_ERROR_RATE: float = 0.01
+
+
+@allure.epic("Contact List API Testing")
+class TestContactListAPILoad:
+    """
+    Load test of the Contact List API.
+
+    Virtual users replay the register, login, add, get, update and delete flow of test_api_contact_list.py, each with
+    an account of their own. The test only runs with --load-concurrency (closed loop) or --load-rps (open loop).
+    """
+
+    @allure.story("Contact Lifecycle under Load")
+    @pytest.mark.api
+    @pytest.mark.load
+    def test_contact_lifecycle_load(self, request):
+        """
+        Test case for measuring the API's throughput, latency and error rate under load.
+
+        The results are written to --load-report, attached to the Allure report and printed at the end of the run.
+
+        Parameters:
+            request: The pytest request, to read the load options.
+
+        Asserts:
+            - Every step of the scenario was sent.
+            - At most 1% of the requests failed.
+        """
+        concurrency: int = request.config.getoption("--load-concurrency")
+        target_rps: float = request.config.getoption("--load-rps")
+        duration: float = request.config.getoption("--load-duration")
+
+        mode: str = f"{concurrency} virtual users" if concurrency else f"{target_rps:g} requests per second"
+        with allure.step(f"Generate load with {mode} for {duration:g}s"):
+            result: LoadResult = run_async(run_load(app_config.base_url(), duration, concurrency, target_rps))
+        load_results.append(result)
+        result.write_json(request.config.getoption("--load-report"))
+        allure.attach(json.dumps(result.to_dict(), indent=2), name="Load report",
+                      attachment_type=allure.attachment_type.JSON)
+        allure.attach(str(result), name="Load summary", attachment_type=allure.attachment_type.TEXT)
+
+        for name, stats in result.operations.items():
+            assert stats.count, f"No '{name}' request was sent"
+        total = result.total
+        assert total.errors <= MAX_ERROR_RATE * total.count, \
+            f"{total.errors} of {total.count} requests failed, last error: {total.last_error}"
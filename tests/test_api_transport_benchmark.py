@@ -0,0 +1,46 @@
+import allure
+import pytest
+
+from utils import config as app_config
+from utils.factories import ApiUser
+from utils.transport import TRANSPORTS, Transport, TransportBenchmark, benchmark_transport, create_transport, \
+    transport_benchmarks
+
+REQUESTS: int = 200
+THREADS: int = 8
+
+
+@pytest.mark.benchmark
+@pytest.mark.api
+@allure.title("API transports benchmark")
+@allure.description("Benchmark of the per-request overhead and the throughput of every API transport")
+@pytest.mark.parametrize("transport_name", TRANSPORTS)
+def test_api_transport_benchmark(request, api_user: ApiUser, transport_name: str):
+    """
+    Benchmark of one API transport.
+
+    The transport sends REQUESTS authenticated GET requests to 'users/me' one after the other, then REQUESTS more
+    from THREADS threads if it is thread-safe. The latencies and the throughput are attached to the report and,
+    together with the other transports, printed in the "api transports" section of the terminal summary. Run it
+    against the local app (`-m benchmark --local-app`) to measure the client side rather than the network.
+
+    Parameters:
+        request: The pytest request, to get the Playwright request context of the 'playwright' transport.
+        api_user (ApiUser): The user whose token the requests send.
+        transport_name (str): The transport to measure.
+
+    Asserts:
+        - The requests are answered with 200.
+    """
+    transport: Transport = create_transport(transport_name, request.getfixturevalue("api_request_context")
+                                            if transport_name == "playwright" else None)
+    url: str = f"{app_config.base_url()}/users/me"
+    headers: dict[str, str] = {"Content-Type": "application/json", "Authorization": f"Bearer {api_user.token}"}
+    try:
+        assert transport.request("GET", url, headers).status == 200, "The benchmark request isn't answered"
+        with allure.step(f"Send {REQUESTS} requests sequentially, then from {THREADS} threads"):
+            result: TransportBenchmark = benchmark_transport(transport, url, headers, REQUESTS, THREADS)
+    finally:
+        transport.close()
+    transport_benchmarks.append(result)
+    allure.attach(str(result), name="Transport cost", attachment_type=allure.attachment_type.TEXT)
@@ -0,0 +1,87 @@
+import allure
+import pytest
+from playwright.sync_api import Locator, expect
+
+from locators.contact_list_locators import ContactDetailsPageLocators, ContactListPageLocators
+from pages.contact_details_page import ContactDetailsPage
+from pages.contacts_list_page import ContactListPage
+from utils.contact_table import ContactRow
+from utils.scale import ScaleMetrics, Stopwatch, browser_memory, scale_results
+
+
+@pytest.fixture(scope="function")
+def login_credentials(scale_account: dict[str, object]):
+    """
+    Fixture to log the large-dataset tests in as the seeded scale account instead of the worker account.
+
+    Returns:
+        credentials (dict): The 'email' and 'password' of the scale account.
+    """
+    return {"email": scale_account["email"], "password": scale_account["password"]}
+
+
+@pytest.mark.scale
+@pytest.mark.live_backend
+@pytest.mark.user_interface
+@allure.title("Contact List with a large dataset")
+@allure.description("Test to measure how the contact list and its page objects scale with the number of contacts")
+def test_contact_list_scale(logged_in_setup, scale_account: dict[str, object], contact_count: int):
+    """
+    Test for rendering, finding and selecting a contact in a contact list with thousands of rows.
+
+    The account is seeded with `contact_count` contacts through concurrent API requests. The test measures the time
+    to render the whole list, to find the last contact by scraping all rows, with a text-filtered locator and in an
+    indexed snapshot of the table, and to open its details, as well as the page's memory once the list is rendered. The
+    measurements are attached to the report and printed at the end of the run.
+
+    Parameters:
+        logged_in_setup (Page): The fixture that provides a Playwright Page already logged in as the scale account.
+        scale_account (dict): The seeded account and the time its contacts took to add.
+        contact_count (int): The number of contacts, from --scale-sizes.
+
+    Asserts:
+        - Every contact is rendered in the contact list.
+        - All lookups find the last contact.
+        - Selecting the contact opens its details.
+    """
+    page = logged_in_setup
+    contact_list_page: ContactListPage = ContactListPage(page)
+    metrics = ScaleMetrics(contact_count, seed_seconds=float(scale_account["seed_seconds"]))
+    # Scale the timeouts with the dataset, rendering 100k rows takes far longer than the default
+    timeout: float = max(contact_list_page.wait_timeout, contact_count * 2.0)
+    target_email: str = f"scale{contact_count - 1}@fake.com"
+
+    with Stopwatch() as render:
+        contact_list_page.open()
+        contact_list_page.wait_for_contacts(contact_count, timeout=timeout)
+    metrics.render_seconds = render.seconds
+
+    memory: dict[str, float] = browser_memory(page)
+    metrics.heap_bytes, metrics.dom_nodes = memory["JSHeapUsedSize"], memory["Nodes"]
+
+    with Stopwatch() as scan:
+        rows: list[str] = page.locator(ContactListPageLocators.contacts_table).all_inner_texts()
+        scanned_index: int = next(index for index, row in enumerate(rows) if target_email in row)
+    metrics.scan_seconds = scan.seconds
+
+    with Stopwatch() as locate:
+        row: Locator = page.locator(ContactListPageLocators.contacts_table).filter(has_text=target_email)
+        expect(row).to_have_count(1, timeout=timeout)
+    metrics.locate_seconds = locate.seconds
+
+    with Stopwatch() as index:
+        indexed_row: ContactRow | None = contact_list_page.find_contact(email=target_email)
+    metrics.index_seconds = index.seconds
+
+    with Stopwatch() as select:
+        row.click(timeout=timeout)
+        contact_details_page = ContactDetailsPage(page)
+        contact_details_page.wait_for_page(contact_details_page.path, timeout=timeout)
+        expect(page.locator(ContactDetailsPageLocators.email)).to_have_text(target_email, timeout=timeout)
+    metrics.select_seconds = select.seconds
+
+    scale_results.append(metrics)
+    allure.attach(str(metrics), name="Scale metrics", attachment_type=allure.attachment_type.TEXT)
+    assert len(rows) == contact_count, f"Expected {contact_count} rows, found {len(rows)}"
+    assert scanned_index == contact_count - 1, "The scan found the wrong contact"
+    assert indexed_row is not None and indexed_row.index == contact_count - 1, "The index found the wrong contact"
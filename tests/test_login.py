@@ -3,12 +3,11 @@ import pytest
 
 from pages.contacts_list_page import ContactListPage
 from pages.home_page import HomePage
-from utils.file_handler import get_json
 
 
 @allure.title("Login with valid credentials")
 @allure.description("Test to perform login scenario with valid credentials.")
-@pytest.mark.parametrize("login_credentials", get_json("resources/login_data.jsonc"))
+@pytest.mark.dataset("login_credentials", "resources/login_data.jsonl")
 @pytest.mark.user_interface
 def test_login_with_valid_credentials(setup, login_credentials: dict[str, object]):
     """
@@ -0,0 +1,245 @@
+import allure
+import pytest
+from playwright.sync_api import Page
+
+from pages.add_contact_page import AddContactPage
+from pages.contact_details_page import ContactDetailsPage
+from pages.contacts_list_page import ContactListPage
+from pages.home_page import HomePage
+from utils import config as app_config
+from utils.api import APIClient
+from utils.benchmarks import Comparison, operation_benchmarks
+from utils.factories import CONTACT_DEFAULTS, ApiUser, UserFactory
+
+API_WARMUP: int = 3
+API_REPETITIONS: int = 30
+UI_WARMUP: int = 2
+UI_REPETITIONS: int = 10
+
+
+def _check(comparison: Comparison):
+    """
+    Fails the benchmark on a regression, unless this run stores the new baselines.
+
+    Args:
+        comparison (Comparison): The operation compared with its baseline.
+    """
+    if comparison.regressed and not operation_benchmarks.save:
+        pytest.fail(f"Regression against the baseline:\n{comparison}")
+
+
+def _add_contact(client: APIClient) -> str:
+    """
+    Adds a contact through the API, outside of the measured runs.
+
+    Args:
+        client (APIClient): A client authenticated as the contact's owner.
+
+    Returns:
+        str: The contact's id.
+    """
+    response = client.post("contacts", CONTACT_DEFAULTS)
+    assert response.ok, f"The contact isn't added: {response.text()}"
+    return str(response.json()["_id"])
+
+
+def _log_in(page: Page, user: ApiUser) -> ContactListPage:
+    """
+    Logs in through the UI, outside of the measured runs.
+
+    Args:
+        page (Page): A page on the home page.
+        user (ApiUser): The user to log in as.
+
+    Returns:
+        ContactListPage: The contact list the login leads to.
+    """
+    contact_list_page: ContactListPage = HomePage(page).login_with_credential(user.email, user.password)
+    contact_list_page.is_logged_in()
+    return contact_list_page
+
+
+@pytest.mark.benchmark
+@pytest.mark.local_app
+@pytest.mark.api
+@allure.title("APIClient benchmark")
+@allure.description("Benchmark of every APIClient verb against its stored baseline")
+@pytest.mark.parametrize("verb", ("get", "post", "put", "delete"))
+def test_api_client_benchmark(user_factory: UserFactory, verb: str):
+    """
+    Benchmark of one APIClient verb on a contact of a user of the test's own.
+
+    The request is sent API_WARMUP times, then timed API_REPETITIONS times; every DELETE gets a contact added before
+    it, untimed. The statistics are compared with the baseline of the --api-transport and printed in the "operation
+    benchmarks" section of the terminal summary. Like every operation benchmark it only runs against the local app
+    (`-m benchmark --local-app`), so the baselines never mix in the network to the hosted app; run it on one worker.
+
+    Parameters:
+        user_factory (UserFactory): Registers the user whose contacts the requests work on.
+        verb (str): The APIClient method to measure.
+
+    Asserts:
+        - The requests succeed.
+        - The median isn't significantly slower than the baseline.
+    """
+    client: APIClient = user_factory.client(user_factory.create())
+    contact_id: str = _add_contact(client)
+    operations = {
+        "get": (lambda: client.get(f"contacts/{contact_id}"), None),
+        "post": (lambda: client.post("contacts", CONTACT_DEFAULTS), None),
+        "put": (lambda: client.put(f"contacts/{contact_id}", {**CONTACT_DEFAULTS, "city": "Montreal"}), None),
+        "delete": (lambda added_id: client.delete(f"contacts/{added_id}"), lambda: _add_contact(client)),
+    }
+    send, prepare = operations[verb]
+
+    def operation(*arguments):
+        response = send(*arguments)
+        assert response.ok, f"{verb.upper()} failed: {response.status} {response.text()}"
+
+    # Each transport has baselines of its own
+    name: str = f"APIClient.{verb}[{user_factory.transport.name}]"
+    _check(operation_benchmarks.measure(name, operation, prepare, API_WARMUP, API_REPETITIONS))
+
+
+@pytest.mark.benchmark
+@pytest.mark.local_app
+@pytest.mark.live_backend
+@pytest.mark.user_interface
+@allure.title("HomePage.login_with_credential benchmark")
+@allure.description("Benchmark of logging in through the login form against its stored baseline")
+def test_login_benchmark(setup, user_factory: UserFactory):
+    """
+    Benchmark of logging in, until the contact list is shown.
+
+    Every run starts on the home page of a logged-out context. The statistics are compared with the baseline and
+    printed in the "operation benchmarks" section of the terminal summary.
+
+    Parameters:
+        setup (Page): The Playwright page instance provided by the test setup.
+        user_factory (UserFactory): Registers the user to log in as.
+
+    Asserts:
+        - The median isn't significantly slower than the baseline.
+    """
+    page: Page = setup
+    user: ApiUser = user_factory.create()
+
+    def log_out() -> HomePage:
+        page.context.clear_cookies()
+        page.goto(app_config.base_url())
+        return HomePage(page)
+
+    _check(operation_benchmarks.measure(
+        "HomePage.login_with_credential",
+        lambda home_page: home_page.login_with_credential(user.email, user.password).is_logged_in(),
+        log_out, UI_WARMUP, UI_REPETITIONS))
+
+
+@pytest.mark.benchmark
+@pytest.mark.local_app
+@pytest.mark.live_backend
+@pytest.mark.user_interface
+@allure.title("AddContactPage.add_new_contact benchmark")
+@allure.description("Benchmark of adding a contact through the form against its stored baseline")
+def test_add_new_contact_benchmark(setup, user_factory: UserFactory):
+    """
+    Benchmark of filling in and submitting the Add Contact form, until the contact list has reloaded.
+
+    Every run starts on a freshly opened Add Contact page. The statistics are compared with the baseline and printed
+    in the "operation benchmarks" section of the terminal summary.
+
+    Parameters:
+        setup (Page): The Playwright page instance provided by the test setup.
+        user_factory (UserFactory): Registers the user the contacts are added to.
+
+    Asserts:
+        - The median isn't significantly slower than the baseline.
+    """
+    contact_list_page: ContactListPage = _log_in(setup, user_factory.create())
+
+    def open_form() -> AddContactPage:
+        contact_list_page.open()
+        add_contact_page: AddContactPage = contact_list_page.click_add_new_contact()
+        add_contact_page.is_page_loaded()
+        return add_contact_page
+
+    _check(operation_benchmarks.measure(
+        "AddContactPage.add_new_contact",
+        lambda add_contact_page: add_contact_page.add_new_contact(
+            first_name="Bench", last_name="Mark", email="bench.mark@fake.com", phone="8005554242",
+            birthdate="1992-02-02", country="USA", city="Washington", address_street_1="13 School St.",
+            address_street_2="Apt. 5", state_province="QC", postal_code="A1A1A1"),
+        open_form, UI_WARMUP, UI_REPETITIONS))
+
+
+@pytest.mark.benchmark
+@pytest.mark.local_app
+@pytest.mark.live_backend
+@pytest.mark.user_interface
+@allure.title("ContactListPage.select_contact_by_index benchmark")
+@allure.description("Benchmark of opening a contact from the list against its stored baseline")
+def test_select_contact_by_index_benchmark(setup, user_factory: UserFactory):
+    """
+    Benchmark of selecting the first contact of the list, until its details page is shown.
+
+    Every run starts on the freshly loaded contact list. The statistics are compared with the baseline and printed
+    in the "operation benchmarks" section of the terminal summary.
+
+    Parameters:
+        setup (Page): The Playwright page instance provided by the test setup.
+        user_factory (UserFactory): Registers the user whose contact is selected.
+
+    Asserts:
+        - The median isn't significantly slower than the baseline.
+    """
+    user: ApiUser = user_factory.create()
+    _add_contact(user_factory.client(user))
+    contact_list_page: ContactListPage = _log_in(setup, user)
+
+    def open_list() -> ContactListPage:
+        contact_list_page.open()
+        contact_list_page.wait_for_contacts(1)
+        return contact_list_page
+
+    _check(operation_benchmarks.measure(
+        "ContactListPage.select_contact_by_index",
+        lambda list_page: list_page.select_contact_by_index(0).is_page_loaded(),
+        open_list, UI_WARMUP, UI_REPETITIONS))
+
+
+@pytest.mark.benchmark
+@pytest.mark.local_app
+@pytest.mark.live_backend
+@pytest.mark.user_interface
+@allure.title("ContactDetailsPage.delete_contact benchmark")
+@allure.description("Benchmark of deleting a contact from its details page against its stored baseline")
+def test_delete_contact_benchmark(setup, user_factory: UserFactory):
+    """
+    Benchmark of deleting a contact and confirming the dialog, until the delete request is answered.
+
+    Every run gets a contact added through the API and starts on its details page. The statistics are compared
+    with the baseline and printed in the "operation benchmarks" section of the terminal summary.
+
+    Parameters:
+        setup (Page): The Playwright page instance provided by the test setup.
+        user_factory (UserFactory): Registers the user whose contacts are deleted.
+
+    Asserts:
+        - The median isn't significantly slower than the baseline.
+    """
+    user: ApiUser = user_factory.create()
+    client: APIClient = user_factory.client(user)
+    contact_list_page: ContactListPage = _log_in(setup, user)
+
+    def open_contact() -> ContactDetailsPage:
+        _add_contact(client)
+        contact_list_page.open()
+        contact_list_page.wait_for_contacts(1)
+        contact_details_page: ContactDetailsPage = contact_list_page.select_contact_by_index(0)
+        contact_details_page.is_page_loaded()
+        return contact_details_page
+
+    _check(operation_benchmarks.measure(
+        "ContactDetailsPage.delete_contact",
+        lambda contact_details_page: contact_details_page.delete_contact(),
+        open_contact, UI_WARMUP, UI_REPETITIONS))
@@ -6,8 +6,10 @@ from pages.contacts_list_page import ContactListPage
 from pages.home_page import HomePage
 from pages.registration_page import RegistrationPage
 from utils.file_handler import get_json
+from utils.workers import unique_email
 
 
+@pytest.mark.live_backend
 @pytest.mark.user_interface
 @allure.title("Registration New User")
 @allure.description("Test to perform registration scenario")
@@ -45,7 +47,7 @@ def test_registration(setup):
         contact_list_page: ContactListPage = registration_page.register_user(
             str(user.get("firstName")),
             str(user.get("lastName")),
-            str(user.get("email")),
+            unique_email(str(user.get("email"))),
             str(user.get("password"))
         )
         contact_list_page.is_logged_in()
@@ -0,0 +1,52 @@
+import allure
+import pytest
+from playwright.sync_api import Page, expect
+
+from locators.contact_list_locators import RegistrationPageLocators
+from pages.home_page import HomePage
+from pages.registration_page import RegistrationPage
+from utils.text_input import TypingRecorder, TypingStrategy, typing_recorder
+
+REPETITIONS: int = 5
+FIELDS: dict[str, str] = {
+    RegistrationPageLocators.first_name_input: "Benchmark",
+    RegistrationPageLocators.last_name_input: "Typing-Strategies",
+    RegistrationPageLocators.email_input: "typing.benchmark+strategies@fake.com",
+    RegistrationPageLocators.password_input: "myBenchmarkPassword",
+}
+
+
+@pytest.mark.benchmark
+@pytest.mark.user_interface
+@allure.title("Typing strategies benchmark")
+@allure.description("Benchmark of the per-field cost of every typing strategy on the registration form")
+@pytest.mark.parametrize("strategy", list(TypingStrategy), ids=[strategy.value for strategy in TypingStrategy])
+def test_typing_strategy_benchmark(setup, strategy: TypingStrategy):
+    """
+    Benchmark of entering the registration fields with one typing strategy.
+
+    Every field is cleared and typed into REPETITIONS times. The average cost per field and per character is
+    attached to the report and, together with the other strategies, printed in the "typing" section of the terminal
+    summary. Run it with `-m benchmark --browser-profile=fast`, slow motion would dominate the measurements.
+
+    Parameters:
+        setup (Page): The Playwright page instance provided by the test setup.
+        strategy (TypingStrategy): The strategy to measure.
+
+    Asserts:
+        - Every field holds the typed text.
+    """
+    page: Page = setup
+    registration_page: RegistrationPage = HomePage(page).click_sign_in()
+    registration_page.is_page_loaded()
+    recorded: int = len(typing_recorder.records)
+
+    for _ in range(REPETITIONS):
+        for selector, text in FIELDS.items():
+            registration_page.fill_input(selector, "")
+            registration_page.type_text(selector, text, strategy)
+            expect(page.locator(selector)).to_have_value(text)
+
+    measurements = TypingRecorder()
+    measurements.records = typing_recorder.records[recorded:]
+    allure.attach(measurements.summary(), name="Typing cost", attachment_type=allure.attachment_type.TEXT)
@@ -0,0 +1,234 @@
+import glob
+import os
+import threading
+from collections import Counter
+from dataclasses import dataclass
+
+import allure_commons
+from allure_commons.model2 import ExecutableItem, Parameter, Status, TestStepResult
+
+STEP_MODES: tuple[str, ...] = ("full", "compact")
+
+# How many distinct step titles a summary step lists
+SUMMARY_TITLES: int = 20
+
+
+class SummaryStep(TestStepResult):
+    """
+    A step standing for passing steps that were collapsed, with their count and time per title.
+
+    Its name and parameters are built from the counts when the test result is written, not on every collapsed step.
+
+    Attributes:
+        counts (Counter): The collapsed steps per title.
+        milliseconds (Counter): The time of the collapsed steps per title.
+    """
+
+    def __init__(self, start: int | None):
+        self.counts: Counter = Counter()
+        self.milliseconds: Counter = Counter()
+        super().__init__(status=Status.PASSED, start=start)
+
+    @property
+    def name(self) -> str:
+        count: int = sum(self.counts.values())
+        return f"{count} passed step{'' if count == 1 else 's'}"
+
+    @name.setter
+    def name(self, value: str):
+        pass  # Always derived from the counts
+
+    @property
+    def parameters(self) -> list[Parameter]:
+        parameters: list[Parameter] = [Parameter(name=title, value=f"{count}x, {self.milliseconds[title]}ms")
+                                       for title, count in self.counts.most_common(SUMMARY_TITLES)]
+        if len(self.counts) > SUMMARY_TITLES:
+            parameters.append(Parameter(name="...", value=f"{len(self.counts) - SUMMARY_TITLES} more"))
+        return parameters
+
+    @parameters.setter
+    def parameters(self, value: list[Parameter]):
+        pass  # Always derived from the counts
+
+
+class StepCollapser:
+    """
+    Collapses the passing steps of the Allure report into summary steps, keeping failing branches in full.
+
+    Allure keeps the steps of a test in memory until the test ends. This plugin notes the parent of every step
+    before the Allure listener records it and the step itself before the listener stops it, through the reporter's
+    public API, and looks at the step again once the listener has stopped it: when it passed without attachments
+    and everything below it was collapsed, it is removed from its parent and counted in a summary step instead ("42
+    passed steps", listing each title with its count and time). Consecutive passing steps share one summary, so the
+    order of the kept steps is preserved. A failing step and its ancestors are kept, with the summaries of the steps
+    that passed before the failure.
+
+    Steps of other threads share the parent that was open in the main thread, and may stop in any order, so the
+    step is looked up in its parent by identity and the parent's steps are only changed under a lock.
+
+    Attributes:
+        recorded (int): The steps started while installed.
+        collapsed (int): The steps removed into summaries.
+    """
+
+    def __init__(self):
+        """
+        Initializes the StepCollapser.
+        """
+        self.recorded: int = 0
+        self.collapsed: int = 0
+        self._reporter = None
+        self._parents: dict[object, ExecutableItem] = {}
+        self._steps: dict[object, TestStepResult] = {}
+        self._lock = threading.Lock()
+        self._stopping = _StoppingSteps(self)
+
+    @property
+    def installed(self) -> bool:
+        return self._reporter is not None
+
+    def install(self, listener):
+        """
+        Starts collapsing the steps the Allure listener records.
+
+        Args:
+            listener: allure-pytest's AllureListener, whose reporter holds the open tests and steps.
+        """
+        if not self.installed:
+            self._reporter = listener.allure_logger
+            allure_commons.plugin_manager.register(self)
+            allure_commons.plugin_manager.register(self._stopping)
+
+    def uninstall(self):
+        """
+        Stops collapsing steps; the steps recorded from now on are kept in full.
+        """
+        if self.installed:
+            allure_commons.plugin_manager.unregister(self._stopping)
+            allure_commons.plugin_manager.unregister(self)
+            self._reporter = None
+            self._parents.clear()
+            self._steps.clear()
+
+    @allure_commons.hookimpl(tryfirst=True)
+    def start_step(self, uuid, title, params):
+        with self._lock:
+            self.recorded += 1
+        # Before the listener records the step, the innermost open test, fixture or step is its parent
+        parent: ExecutableItem | None = self._reporter.get_last_item(ExecutableItem)
+        if parent is not None:
+            self._parents[uuid] = parent
+
+    def note_step(self, uuid):
+        """
+        Keeps the step that is about to stop, while the reporter still holds it.
+
+        Args:
+            uuid: The step's uuid.
+        """
+        step: TestStepResult | None = self._reporter.get_item(uuid)
+        if step is not None:
+            self._steps[uuid] = step
+
+    @allure_commons.hookimpl(trylast=True)
+    def stop_step(self, uuid, exc_type, exc_val, exc_tb):
+        parent: ExecutableItem | None = self._parents.pop(uuid, None)
+        step: TestStepResult | None = self._steps.pop(uuid, None)
+        if parent is None or step is None:
+            return  # A step outside of any test
+        if step.status != Status.PASSED or step.attachments or \
+                not all(isinstance(child, SummaryStep) for child in step.steps):
+            return
+        with self._lock:
+            # Usually the parent's last step, unless steps of other threads were recorded since it started
+            index: int | None = next((index for index in range(len(parent.steps) - 1, -1, -1)
+                                      if parent.steps[index] is step), None)
+            if index is None:
+                return
+            del parent.steps[index]
+            self.collapsed += 1
+            before: TestStepResult | None = parent.steps[index - 1] if index else None
+            after: TestStepResult | None = parent.steps[index] if index < len(parent.steps) else None
+            if isinstance(before, SummaryStep):
+                summary: SummaryStep = before
+                if isinstance(after, SummaryStep):
+                    # The step was all that kept two summaries apart
+                    del parent.steps[index]
+                    summary.counts.update(after.counts)
+                    summary.milliseconds.update(after.milliseconds)
+                    summary.stop = max(summary.stop or 0, after.stop or 0)
+            elif isinstance(after, SummaryStep):
+                summary = after
+                summary.start = min(summary.start or step.start, step.start or summary.start)
+            else:
+                summary = SummaryStep(step.start)
+                parent.steps.insert(index, summary)
+            # The step's own title, then whatever was collapsed below it
+            summary.counts[step.name] += 1
+            summary.milliseconds[step.name] += (step.stop or 0) - (step.start or 0)
+            for child in step.steps:
+                summary.counts.update(child.counts)
+                summary.milliseconds.update(child.milliseconds)
+            summary.stop = max(summary.stop or 0, step.stop or 0)
+
+    def summary(self, results_dir: str | None) -> str:
+        """
+        Builds a human-readable summary of the collapsed steps and the size of the Allure results.
+
+        Args:
+            results_dir (str | None): The Allure results directory.
+
+        Returns:
+            str: The summary text.
+        """
+        files: list[str] = glob.glob(os.path.join(results_dir, "*-result.json")) if results_dir else []
+        size: int = sum(os.path.getsize(path) for path in files)
+        collapsed: str = (f"Collapsed {self.collapsed} of {self.recorded} steps into summaries, "
+                          if self.recorded else "Steps recorded in full, ")
+        return f"{collapsed}{len(files)} result files take {size / 2 ** 20:.2f} MiB"
+
+
+class _StoppingSteps:
+    """
+    Hands the StepCollapser every step before the Allure listener stops it and drops it from the reporter.
+
+    A plugin of its own, since the collapser's stop_step has to run after the listener's.
+    """
+
+    def __init__(self, collapser: StepCollapser):
+        self._collapser = collapser
+
+    @allure_commons.hookimpl(tryfirst=True)
+    def stop_step(self, uuid, exc_type, exc_val, exc_tb):
+        self._collapser.note_step(uuid)
+
+
+@dataclass
+class StepBenchmark:
+    """
+    The cost of recording the same steps in one step mode.
+
+    Attributes:
+        mode (str): One of STEP_MODES.
+        steps (int): The steps recorded.
+        seconds (float): The wall time of the steps, including their recording.
+        write_seconds (float): The time serializing them into the test result takes.
+        report_bytes (int): The size of those steps in the test result file.
+    """
+    mode: str
+    steps: int
+    seconds: float
+    write_seconds: float
+    report_bytes: int
+
+    def __str__(self) -> str:
+        return (f"{self.mode:<8} {self.steps} steps in {self.seconds * 1000:.0f}ms "
+                f"({self.seconds / self.steps * 1_000_000:.1f}µs per step), "
+                f"written in {self.write_seconds * 1000:.1f}ms, {self.report_bytes / 1024:.1f} KiB of report")
+
+
+# Configured from --allure-steps by conftest.py
+step_collapser = StepCollapser()
+
+# Filled by the step recording benchmark, printed in the terminal summary
+step_benchmarks: list[StepBenchmark] = []
@@ -0,0 +1,201 @@
+import json
+import os
+import re
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+
+from utils.histogram import HdrHistogram
+
+# Path segments that identify a single resource, replaced by a placeholder so that all requests to the same
+# endpoint are aggregated together
+ENDPOINT_TEMPLATES: list[tuple[re.Pattern, str]] = [
+    (re.compile(r"^contacts/[^/]+$"), "contacts/{id}"),
+]
+
+PERCENTILES: tuple[float, ...] = (50.0, 95.0, 99.0)
+
+
+def endpoint_template(endpoint: str) -> str:
+    """
+    Returns the template of an endpoint, with resource IDs replaced by placeholders.
+
+    Args:
+        endpoint (str): The endpoint a request was sent to, e.g. 'contacts/6756f925dece760013df73bd'.
+
+    Returns:
+        str: The endpoint's template, e.g. 'contacts/{id}'.
+
+    Example:
+        >>> endpoint_template("contacts/invalid_id")
+        'contacts/{id}'
+        >>> endpoint_template("users/login")
+        'users/login'
+    """
+    endpoint = endpoint.split("?", 1)[0].strip("/")
+    for pattern, template in ENDPOINT_TEMPLATES:
+        if pattern.match(endpoint):
+            return template
+    return endpoint
+
+
+@dataclass
+class RequestRecord:
+    """
+    A single request sent through the APIClient.
+
+    Attributes:
+        method (str): The HTTP method.
+        endpoint (str): The endpoint's template.
+        status (int): The response status.
+        request_bytes (int): The size of the request body.
+        response_bytes (int): The size of the response body.
+        seconds (float): The wall time from sending the request until the response arrived.
+    """
+    method: str
+    endpoint: str
+    status: int
+    request_bytes: int
+    response_bytes: int
+    seconds: float
+
+    def __str__(self) -> str:
+        return (f"{self.method:<6} {self.endpoint:<20} {self.status} {self.seconds * 1000:>8.1f}ms "
+                f"sent {self.request_bytes}B, received {self.response_bytes}B")
+
+
+@dataclass
+class EndpointStats:
+    """
+    The requests to one endpoint over the whole run.
+
+    Attributes:
+        histogram (HdrHistogram): The wall times in microseconds.
+        statuses (Counter): The number of responses per status.
+        request_bytes (int): The total size of the request bodies.
+        response_bytes (int): The total size of the response bodies.
+    """
+    histogram: HdrHistogram = field(default_factory=HdrHistogram)
+    statuses: Counter = field(default_factory=Counter)
+    request_bytes: int = 0
+    response_bytes: int = 0
+
+    def add(self, record: RequestRecord):
+        """
+        Adds a request to the endpoint's totals.
+
+        Args:
+            record (RequestRecord): The request.
+        """
+        self.histogram.record_value(int(record.seconds * 1_000_000))
+        self.statuses[record.status] += 1
+        self.request_bytes += record.request_bytes
+        self.response_bytes += record.response_bytes
+
+    def to_dict(self) -> dict[str, object]:
+        """
+        Summarizes the requests to the endpoint.
+
+        Returns:
+            dict[str, object]: The request count, the count per status, the byte totals and the wall times in
+                milliseconds.
+        """
+        latency: dict[str, float] = {"mean": round(self.histogram.mean / 1000, 3)}
+        for percentile in PERCENTILES:
+            latency[f"p{percentile:g}"] = round(self.histogram.value_at_percentile(percentile) / 1000, 3)
+        latency["max"] = round(self.histogram.max_value / 1000, 3)
+        return {
+            "requests": self.histogram.total_count,
+            "statuses": {str(status): count for status, count in sorted(self.statuses.items())},
+            "request_bytes": self.request_bytes,
+            "response_bytes": self.response_bytes,
+            "latency_ms": latency,
+        }
+
+
+class RequestMetrics:
+    """
+    Collects the requests sent through the APIClient, per test and aggregated per endpoint over the run.
+
+    Clients on a thread-safe transport record from several threads at once, so every access holds a lock.
+
+    Attributes:
+        records (list[RequestRecord]): The requests of the current test.
+        endpoints (dict[str, EndpointStats]): The totals of every 'METHOD endpoint' over the run.
+    """
+
+    def __init__(self):
+        self.records: list[RequestRecord] = []
+        self.endpoints: dict[str, EndpointStats] = {}
+        self._lock = threading.Lock()
+
+    def record(self, method: str, endpoint: str, status: int, request_bytes: int, response_bytes: int,
+               seconds: float):
+        """
+        Records a finished request.
+
+        Args:
+            method (str): The HTTP method.
+            endpoint (str): The endpoint the request was sent to, IDs are replaced by placeholders.
+            status (int): The response status.
+            request_bytes (int): The size of the request body.
+            response_bytes (int): The size of the response body.
+            seconds (float): The wall time of the request.
+        """
+        record = RequestRecord(method, endpoint_template(endpoint), status, request_bytes, response_bytes, seconds)
+        with self._lock:
+            self.records.append(record)
+            self.endpoints.setdefault(f"{record.method} {record.endpoint}", EndpointStats()).add(record)
+
+    def finish_test(self) -> str:
+        """
+        Clears the current test's requests for the next test.
+
+        Returns:
+            str: A report with one line per request.
+        """
+        with self._lock:
+            records, self.records = self.records, []
+        return "\n".join(str(record) for record in records)
+
+    def to_dict(self) -> dict[str, object]:
+        """
+        Builds the JSON report of the run.
+
+        Returns:
+            dict[str, object]: The summary of every endpoint, keyed by 'METHOD endpoint'.
+        """
+        with self._lock:
+            return {key: stats.to_dict() for key, stats in sorted(self.endpoints.items())}
+
+    def write_json(self, path: str):
+        """
+        Writes the JSON report of the run.
+
+        Args:
+            path (str): The file to write, its directory is created if needed.
+        """
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as file:
+            json.dump(self.to_dict(), file, indent=2)
+
+    def summary(self) -> str:
+        """
+        Builds a table of the run's endpoints.
+
+        Returns:
+            str: One line per endpoint with its request count, error responses and wall time percentiles.
+        """
+        lines: list[str] = []
+        for key, summary in self.to_dict().items():
+            latency: dict[str, float] = summary["latency_ms"]
+            errors: int = sum(count for status, count in summary["statuses"].items() if int(status) >= 400)
+            lines.append(f"{key:<28} {summary['requests']:>6} req {errors:>5} err  p50 {latency['p50']:>8.1f}ms  "
+                         f"p95 {latency['p95']:>8.1f}ms  p99 {latency['p99']:>8.1f}ms")
+        return "\n".join(lines)
+
+
+# Shared by every APIClient of the process; conftest.py reports the current test's requests after each test and
+# writes the run's totals at the end
+api_metrics = RequestMetrics()
@@ -0,0 +1,165 @@
+import hashlib
+import os
+import sys
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+import allure
+from playwright.sync_api import Page
+
+
+@dataclass
+class FailureArtifact:
+    """
+    The screenshot and DOM snapshot of one failure, with the context every layer that handled it added.
+
+    Attributes:
+        url (str): The page's URL when it was captured.
+        screenshot (bytes): The PNG screenshot, empty if it couldn't be taken.
+        dom (str): The page's HTML, empty if it couldn't be read.
+        context (list[str]): What each layer was doing, innermost first.
+    """
+    url: str
+    screenshot: bytes = b""
+    dom: str = ""
+    context: list[str] = field(default_factory=list)
+
+
+class FailureArtifacts:
+    """
+    Captures at most one screenshot and DOM snapshot per failure.
+
+    Page objects catch an error, capture and re-raise it at every layer (field, form, flow), and the test report
+    captures once more. The first capture of an error takes the screenshot; the layers the same error (or an error
+    raised while handling it) passes through later only add their context. A capture for a new error on a page
+    whose URL and DOM didn't change since an earlier capture is merged the same way.
+
+    The artifacts are attached to the Allure report once, when the test's report is made (attachments have to be
+    made from the test's thread). Copies for the 'allure-results/screenshots' directory are written by a background
+    thread.
+
+    Attributes:
+        artifacts (list[FailureArtifact]): The artifacts of the current test.
+    """
+
+    def __init__(self):
+        self.artifacts: list[FailureArtifact] = []
+        self._by_error: dict[int, FailureArtifact] = {}
+        self._by_state: dict[tuple[int, str, str], FailureArtifact] = {}
+        self._errors: list[BaseException] = []  # Keeps the errors alive, so their ids can't be reused
+        self._writer: ThreadPoolExecutor | None = None
+        self._writes: list[Future] = []
+
+    @staticmethod
+    def _error_chain(error: BaseException | None) -> list[BaseException]:
+        """
+        Returns an error and the errors it was raised while handling or from.
+
+        Args:
+            error (BaseException | None): The error.
+
+        Returns:
+            list[BaseException]: The error followed by its causes and contexts.
+        """
+        chain: list[BaseException] = []
+        while error is not None and error not in chain:
+            chain.append(error)
+            error = error.__cause__ or error.__context__
+        return chain
+
+    def capture(self, page: Page, context: str, error: BaseException | None = None):
+        """
+        Captures the page for a failure, or adds context to the capture the failure already has.
+
+        Args:
+            page (Page): The page the failure happened on.
+            context (str): What the caller was doing, e.g. 'Failed to insert first name'.
+            error (BaseException | None): The failure, defaults to the exception being handled.
+        """
+        error = error or sys.exc_info()[1]
+        chain: list[BaseException] = self._error_chain(error)
+        artifact: FailureArtifact | None = next((self._by_error[id(link)] for link in chain
+                                                 if id(link) in self._by_error), None)
+        if artifact is None:
+            try:
+                url, dom = page.url, page.content()
+            except Exception as e:
+                url, dom = "", ""
+                context = f"{context} (DOM snapshot failed: {e})"
+            state: tuple[int, str, str] = (id(page), url, hashlib.sha1(dom.encode()).hexdigest())
+            artifact = self._by_state.get(state) if dom else None
+            if artifact is None:
+                artifact = FailureArtifact(url, dom=dom)
+                try:
+                    artifact.screenshot = page.screenshot()
+                except Exception as e:
+                    context = f"{context} (screenshot failed: {e})"
+                self.artifacts.append(artifact)
+                if dom:
+                    self._by_state[state] = artifact
+        artifact.context.append(context)
+        for link in chain:
+            self._by_error[id(link)] = artifact
+            self._errors.append(link)
+
+    def _write(self, path: str, data: bytes | str):
+        """
+        Writes a file in the background.
+
+        Args:
+            path (str): The file to write, its directory is created if needed.
+            data (bytes | str): The content.
+        """
+        def write():
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            with open(path, "wb") as file:
+                file.write(data.encode() if isinstance(data, str) else data)
+
+        if self._writer is None:
+            self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="failure-artifacts")
+        self._writes.append(self._writer.submit(write))
+
+    def finish_test(self, test_name: str, directory: str | None = None):
+        """
+        Attaches the current test's artifacts to the Allure report and clears them for the next test.
+
+        Args:
+            test_name (str): The test's name, used for the files in `directory`.
+            directory (str | None): A directory to also write the screenshots and DOM snapshots to, in the
+                background.
+        """
+        for index, artifact in enumerate(self.artifacts):
+            suffix: str = f"-{index + 1}" if len(self.artifacts) > 1 else ""
+            allure.attach("\n".join([f"URL: {artifact.url}", *artifact.context]), name=f"Failure context{suffix}",
+                          attachment_type=allure.attachment_type.TEXT)
+            if artifact.screenshot:
+                allure.attach(artifact.screenshot, name=f"Screenshot on Failure{suffix}",
+                              attachment_type=allure.attachment_type.PNG)
+                if directory:
+                    self._write(os.path.join(directory, f"{test_name}{suffix}.png"), artifact.screenshot)
+            if artifact.dom:
+                allure.attach(artifact.dom, name=f"DOM on Failure{suffix}", attachment_type=allure.attachment_type.HTML)
+                if directory:
+                    self._write(os.path.join(directory, f"{test_name}{suffix}.html"), artifact.dom)
+        self.artifacts = []
+        self._by_error = {}
+        self._by_state = {}
+        self._errors = []
+
+    def close(self):
+        """
+        Waits for the background writes to finish.
+
+        Raises:
+            Exception: If a file couldn't be written.
+        """
+        if self._writer is not None:
+            self._writer.shutdown(wait=True)
+            self._writer = None
+        writes, self._writes = self._writes, []
+        for write in writes:
+            write.result()
+
+
+# Shared by every page object of the process; conftest.py attaches the artifacts when a test's report is made
+failure_artifacts = FailureArtifacts()
@@ -0,0 +1,342 @@
+import asyncio
+import threading
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import AsyncIterator, TypeVar
+
+from playwright.async_api import APIRequestContext, APIResponse, async_playwright
+
+
+T = TypeVar("T")
+
+
+@dataclass
+class BatchFailure:
+    """
+    A call of a batch that raised, timed out or got an error response.
+
+    Attributes:
+        index (int): The position of the call in the batch.
+        error (str): The exception, or the status and body of the error response.
+    """
+    index: int
+    error: str
+
+
+@dataclass
+class BatchResult:
+    """
+    The outcome of a batch of concurrent calls.
+
+    Attributes:
+        results (list[object]): The result of every call in batch order, None for the calls that raised or timed out.
+        failures (list[BatchFailure]): The calls that failed.
+        elapsed_seconds (float): The wall-clock time of the whole batch.
+    """
+    results: list[object] = field(default_factory=list)
+    failures: list[BatchFailure] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return not self.failures
+
+    @property
+    def succeeded(self) -> list[object]:
+        """
+        Returns the results of the calls that succeeded.
+
+        Returns:
+            list[object]: The successful results in batch order.
+        """
+        failed: set[int] = {failure.index for failure in self.failures}
+        return [result for index, result in enumerate(self.results) if index not in failed]
+
+    def report(self) -> str:
+        """
+        Builds a human-readable summary of the batch, listing every failure.
+
+        Returns:
+            str: The report text.
+        """
+        lines: list[str] = [f"{len(self.results)} calls, {len(self.failures)} failed, "
+                            f"{self.elapsed_seconds:.3f}s"]
+        lines.extend(f"  #{failure.index}: {failure.error}" for failure in self.failures)
+        return "\n".join(lines)
+
+    def raise_for_failures(self, description: str):
+        """
+        Raises if any call of the batch failed.
+
+        Args:
+            description (str): What the batch did, used in the error message.
+
+        Raises:
+            Exception: If the batch has failures.
+        """
+        if self.failures:
+            raise Exception(f"Error in batch '{description}': {self.report()}")
+
+
+async def gather_limited(calls: Iterable[Callable[[], Awaitable[T]]], concurrency: int = 50,
+                         timeout: float | None = None) -> BatchResult:
+    """
+    Runs the calls concurrently with at most `concurrency` of them in flight.
+
+    Unlike `asyncio.gather`, a failing call doesn't cancel the others: exceptions, timeouts and API responses with an
+    error status are collected as failures of the returned BatchResult.
+
+    Args:
+        calls (Iterable[Callable[[], Awaitable[T]]]): Functions returning the awaitable of each call, so that no call
+            starts before it gets a slot.
+        concurrency (int): The maximum number of calls in flight.
+        timeout (float | None): Seconds each call may take once started, None for no limit.
+
+    Returns:
+        BatchResult: The results and failures in batch order.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    calls = list(calls)
+    batch = BatchResult(results=[None] * len(calls))
+
+    async def run(index: int, call: Callable[[], Awaitable[T]]):
+        async with semaphore:
+            try:
+                result = await asyncio.wait_for(call(), timeout)
+            except asyncio.TimeoutError:
+                batch.failures.append(BatchFailure(index, f"Timed out after {timeout}s"))
+                return
+            except Exception as e:
+                batch.failures.append(BatchFailure(index, f"{type(e).__name__}: {e}"))
+                return
+        if isinstance(result, APIResponse) and not result.ok:
+            batch.failures.append(BatchFailure(index, f"Status {result.status}: {await result.text()}"))
+        batch.results[index] = result
+
+    start = time.perf_counter()
+    await asyncio.gather(*(run(index, call) for index, call in enumerate(calls)))
+    batch.elapsed_seconds = time.perf_counter() - start
+    batch.failures.sort(key=lambda failure: failure.index)
+    return batch
+
+
+class AsyncAPIClient:
+    """
+    The asyncio counterpart of APIClient, for setup and verification steps that send many requests.
+
+    It has the same request methods and the same token and contact ID handling as APIClient, and adds batch methods
+    that keep many requests in flight at once. Requests are not reported as Allure steps one by one; callers report
+    a batch as a whole.
+
+    Attributes:
+        request (APIRequestContext): The async Playwright request context.
+        base_url (str): The base URL for API requests.
+    """
+
+    def __init__(self, request_context: APIRequestContext, base_url: str):
+        """
+        Initializes the AsyncAPIClient with a request context and base URL.
+
+        Args:
+            request_context (APIRequestContext): The async Playwright API request context to handle requests.
+            base_url (str): The base URL for API requests.
+        """
+        self.request = request_context
+        self.base_url = base_url
+        self.token = None
+        self.contact_id = None
+
+    def set_token(self, token: str):
+        """
+        Set the token to be used for authentication in subsequent requests.
+
+        Args:
+            token (str): The token to authenticate API requests.
+        """
+        self.token = token
+
+    def set_contact_id(self, contact_id: str):
+        """
+        Set the contact ID for use in requests.
+
+        Args:
+            contact_id (str): The contact ID to use in API requests.
+        """
+        self.contact_id = contact_id
+
+    def get_contact_id(self):
+        """
+        Retrieves the current contact ID.
+
+        Returns:
+            str: The current contact ID.
+        """
+        return self.contact_id
+
+    def _headers(self) -> dict[str, str]:
+        """
+        Construct headers for API requests.
+
+        Returns:
+            dict: The headers dictionary including authorization if a token is set.
+        """
+        headers = {"Content-Type": "application/json"}
+        if self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+            headers["Cookie"] = f"token={self.token}"
+        return headers
+
+    async def post(self, endpoint: str, payload: dict) -> APIResponse:
+        """
+        Send a POST request to the specified endpoint with the provided payload.
+
+        Args:
+            endpoint (str): The endpoint to send the POST request to.
+            payload (dict): The data to send in the request body.
+
+        Returns:
+            APIResponse: The response from the API.
+        """
+        return await self.request.post(f"{self.base_url}/{endpoint}", headers=self._headers(), data=payload)
+
+    async def get(self, endpoint: str) -> APIResponse:
+        """
+        Send a GET request to the specified endpoint.
+
+        Args:
+            endpoint (str): The endpoint to send the GET request to.
+
+        Returns:
+            APIResponse: The response from the API.
+        """
+        return await self.request.get(f"{self.base_url}/{endpoint}", headers=self._headers())
+
+    async def put(self, endpoint: str, payload: dict) -> APIResponse:
+        """
+        Send a PUT request to the specified endpoint with the provided payload.
+
+        Args:
+            endpoint (str): The endpoint to send the PUT request to.
+            payload (dict): The data to send in the request body.
+
+        Returns:
+            APIResponse: The response from the API.
+        """
+        return await self.request.put(f"{self.base_url}/{endpoint}", headers=self._headers(), data=payload)
+
+    async def delete(self, endpoint: str) -> APIResponse:
+        """
+        Send a DELETE request to the specified endpoint.
+
+        Args:
+            endpoint (str): The endpoint to send the DELETE request to.
+
+        Returns:
+            APIResponse: The response from the API.
+        """
+        return await self.request.delete(f"{self.base_url}/{endpoint}", headers=self._headers())
+
+    async def add_contacts(self, contacts: list[dict[str, object]], concurrency: int = 50,
+                           timeout: float | None = 30.0) -> BatchResult:
+        """
+        Adds many contacts concurrently.
+
+        Args:
+            contacts (list[dict[str, object]]): The contact payloads.
+            concurrency (int): The maximum number of requests in flight.
+            timeout (float | None): Seconds each request may take.
+
+        Returns:
+            BatchResult: The responses in the order of `contacts`.
+        """
+        return await gather_limited([lambda contact=contact: self.post("contacts", contact) for contact in contacts],
+                                    concurrency, timeout)
+
+    async def get_contacts(self, contact_ids: list[str], concurrency: int = 50,
+                           timeout: float | None = 30.0) -> BatchResult:
+        """
+        Fetches many contacts concurrently.
+
+        Args:
+            contact_ids (list[str]): The IDs of the contacts.
+            concurrency (int): The maximum number of requests in flight.
+            timeout (float | None): Seconds each request may take.
+
+        Returns:
+            BatchResult: The responses in the order of `contact_ids`.
+        """
+        return await gather_limited([lambda contact_id=contact_id: self.get(f"contacts/{contact_id}")
+                                     for contact_id in contact_ids], concurrency, timeout)
+
+    async def delete_contacts(self, contact_ids: list[str], concurrency: int = 50,
+                              timeout: float | None = 30.0) -> BatchResult:
+        """
+        Deletes many contacts concurrently.
+
+        Args:
+            contact_ids (list[str]): The IDs of the contacts.
+            concurrency (int): The maximum number of requests in flight.
+            timeout (float | None): Seconds each request may take.
+
+        Returns:
+            BatchResult: The responses in the order of `contact_ids`.
+        """
+        return await gather_limited([lambda contact_id=contact_id: self.delete(f"contacts/{contact_id}")
+                                     for contact_id in contact_ids], concurrency, timeout)
+
+
+@asynccontextmanager
+async def async_api_client(base_url: str, token: str | None = None) -> AsyncIterator[AsyncAPIClient]:
+    """
+    Starts an async Playwright instance and yields a client on a new request context.
+
+    Args:
+        base_url (str): The base URL for API requests.
+        token (str | None): A token to authenticate the client with.
+
+    Yields:
+        AsyncAPIClient: The client, disposed of when the block exits.
+    """
+    async with async_playwright() as playwright:
+        request_context: APIRequestContext = await playwright.request.new_context()
+        client = AsyncAPIClient(request_context, base_url)
+        if token:
+            client.set_token(token)
+        try:
+            yield client
+        finally:
+            await request_context.dispose()
+
+
+def run_async(coroutine: Awaitable[T]) -> T:
+    """
+    Runs a coroutine to completion from synchronous test code.
+
+    The sync Playwright API keeps an event loop running on the test thread, so the coroutine runs on a new event loop
+    in a helper thread instead.
+
+    Args:
+        coroutine (Awaitable[T]): The coroutine to run.
+
+    Returns:
+        T: The coroutine's result.
+
+    Raises:
+        Exception: Whatever the coroutine raised.
+    """
+    outcome: dict[str, object] = {}
+
+    def run():
+        try:
+            outcome["result"] = asyncio.run(coroutine)
+        except BaseException as e:
+            outcome["error"] = e
+
+    thread = threading.Thread(target=run, name="async-api-client")
+    thread.start()
+    thread.join()
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["result"]
@@ -0,0 +1,208 @@
+import hashlib
+import json
+import os
+import time
+from urllib.parse import urlparse
+
+import allure
+from playwright.sync_api import APIResponse, Browser
+
+from utils.api import APIClient
+from utils.tokens import TokenManager, token_expiry
+
+
+class AuthStateCache:
+    """
+    Caches one authenticated Playwright storage state per credential set.
+
+    The first request for a credential set logs in (through the API by default) and writes the resulting storage
+    state to `<cache_dir>/<worker>/<key>.json`. Later browser contexts are created with that file so they start
+    already authenticated. A cached state is refreshed transparently when its token expires, when it is older than
+    `ttl_seconds`, or when it is invalidated after the application rejected it.
+
+    Attributes:
+        api_client (APIClient): The client used for API logins.
+        base_url (str): The base URL of the application, used for the cookie domain.
+        cache_dir (str): The directory holding this worker's storage state files.
+        ttl_seconds (float): Maximum age of a state whose token carries no expiry claim.
+    """
+
+    # Refresh tokens this many seconds before they actually expire
+    EXPIRY_MARGIN_SECONDS: float = 60.0
+
+    def __init__(self, api_client: APIClient, base_url: str, cache_dir: str = ".auth", ttl_seconds: float = 3600.0):
+        """
+        Initializes the AuthStateCache.
+
+        Args:
+            api_client (APIClient): The client used for API logins.
+            base_url (str): The base URL of the application.
+            cache_dir (str): The root directory of the storage state files.
+            ttl_seconds (float): Maximum age of a state whose token carries no expiry claim.
+        """
+        self.api_client = api_client
+        self.base_url = base_url
+        self.cache_dir = os.path.join(cache_dir, os.environ.get("PYTEST_XDIST_WORKER", "main"))
+        self.ttl_seconds = ttl_seconds
+        self._expiries: dict[str, float] = {}
+        self.logins: int = 0
+        self.hits: int = 0
+
+    @staticmethod
+    def _key(email: str, password: str) -> str:
+        return hashlib.sha256(f"{email}\0{password}".encode()).hexdigest()[:16]
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def _is_fresh(self, key: str) -> bool:
+        """
+        Checks whether the cached state for the key exists and its token is still valid.
+
+        Args:
+            key (str): The credential key.
+
+        Returns:
+            bool: True if the state can be reused.
+        """
+        path: str = self._path(key)
+        if not os.path.exists(path):
+            return False
+        if key not in self._expiries:
+            # State persisted by a previous run: derive its expiry from the stored token or the file age
+            with open(path, "r") as file:
+                state: dict[str, object] = json.load(file)
+            tokens: list[str] = [cookie["value"] for cookie in state.get("cookies", []) if cookie["name"] == "token"]
+            expiry: float | None = token_expiry(tokens[0]) if tokens else None
+            self._expiries[key] = expiry if expiry is not None else os.path.getmtime(path) + self.ttl_seconds
+        return self._expiries[key] - self.EXPIRY_MARGIN_SECONDS > time.time()
+
+    def _login_via_api(self, email: str, password: str) -> str:
+        """
+        Returns a session token from the client's token manager, which logs in only if no worker holds a valid token
+        for the credentials.
+
+        Args:
+            email (str): The user's email.
+            password (str): The user's password.
+
+        Returns:
+            str: The token.
+        """
+        tokens: TokenManager = self.api_client.tokens
+        return tokens.token(tokens.key(self.api_client.base_url, email, password),
+                            lambda: self._post_login(email, password))
+
+    @allure.step("Log in through the API as {email}")
+    def _post_login(self, email: str, password: str) -> str:
+        """
+        Logs in through the login endpoint and returns the session token.
+
+        Args:
+            email (str): The user's email.
+            password (str): The user's password.
+
+        Returns:
+            str: The token returned by the API.
+
+        Raises:
+            Exception: If the login request fails.
+        """
+        response: APIResponse = self.api_client.post("users/login", {"email": email, "password": password})
+        if not response.ok:
+            raise Exception(f"API login failed for email: {email}. Status {response.status}: {response.text()}")
+        return str(response.json().get("token"))
+
+    def _storage_state_for_token(self, token: str, expiry: float | None) -> dict[str, object]:
+        """
+        Builds a storage state equivalent to the one the application creates after a UI login.
+
+        Args:
+            token (str): The session token.
+            expiry (float | None): The token expiry, used as the cookie expiry.
+
+        Returns:
+            dict[str, object]: The storage state.
+        """
+        url = urlparse(self.base_url)
+        return {
+            "cookies": [{
+                "name": "token",
+                "value": token,
+                "domain": url.hostname,
+                "path": "/",
+                "expires": expiry if expiry is not None else -1,
+                "httpOnly": False,
+                "secure": url.scheme == "https",
+                "sameSite": "Lax",
+            }],
+            "origins": [],
+        }
+
+    @allure.step("Log in through the UI as {email}")
+    def _login_via_ui(self, browser: Browser, email: str, password: str, path: str):
+        """
+        Logs in through the login form in a throwaway context and saves its storage state.
+
+        Args:
+            browser (Browser): The browser used for the login.
+            email (str): The user's email.
+            password (str): The user's password.
+            path (str): The file the storage state is written to.
+        """
+        # Imported here, the page objects are only needed for UI logins
+        from pages.home_page import HomePage
+
+        context = browser.new_context()
+        try:
+            page = context.new_page()
+            page.goto(self.base_url)
+            HomePage(page).login_with_credential(email, password).is_logged_in()
+            context.storage_state(path=path)
+        finally:
+            context.close()
+
+    def storage_state(self, email: str, password: str, browser: Browser | None = None) -> str:
+        """
+        Returns the path of an authenticated storage state for the credentials, logging in if needed.
+
+        Args:
+            email (str): The user's email.
+            password (str): The user's password.
+            browser (Browser | None): When given, the login goes through the UI in this browser instead of the API.
+
+        Returns:
+            str: The path of the storage state file, to be passed as `storage_state` to `Browser.new_context`.
+        """
+        key: str = self._key(email, password)
+        path: str = self._path(key)
+        if self._is_fresh(key):
+            self.hits += 1
+            return path
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.logins += 1
+        if browser is not None:
+            self._login_via_ui(browser, email, password, path)
+            self._expiries[key] = time.time() + self.ttl_seconds
+        else:
+            token: str = self._login_via_api(email, password)
+            expiry: float | None = token_expiry(token)
+            with open(path, "w") as file:
+                json.dump(self._storage_state_for_token(token, expiry), file)
+            self._expiries[key] = expiry if expiry is not None else time.time() + self.ttl_seconds
+        return path
+
+    def invalidate(self, email: str, password: str):
+        """
+        Drops the cached state for the credentials, forcing a new login on the next request.
+
+        Args:
+            email (str): The user's email.
+            password (str): The user's password.
+        """
+        key: str = self._key(email, password)
+        self.api_client.tokens.forget(self.api_client.tokens.key(self.api_client.base_url, email, password))
+        self._expiries.pop(key, None)
+        if os.path.exists(self._path(key)):
+            os.remove(self._path(key))
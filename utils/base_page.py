@@ -1,5 +1,18 @@
+import re
+import time
+from contextlib import contextmanager
+from typing import Iterator
+from urllib.parse import urlparse
+
 import allure
-from playwright.sync_api import Page, Locator
+from playwright.sync_api import Page, Locator, Response
+
+from utils import config
+from utils.artifacts import failure_artifacts
+from utils.forms import FILL_FORM_SCRIPT, TYPE_KEYS_SCRIPT
+from utils.locator_registry import LocatorRegistry, locator_profiler, locator_registry
+from utils.text_input import TypingStrategy, forced_strategy, strategy_cache, typing_recorder
+from utils.waits import wait_recorder, WAIT_FOR_DOM_SCRIPT
 
 
 class BasePage:
@@ -10,7 +23,13 @@ class BasePage:
 
     Attributes:
         page (Page): The Playwright page object used for browser interaction.
+        path (str): The URL path of the page, relative to the configured base URL.
+        locators (tuple[type, ...]): The locator classes of the page, whose Locators are created up front.
+        wait_timeout (float): Default timeout of the wait methods in milliseconds.
     """
+    path: str = "/"
+    locators: tuple[type, ...] = ()
+    wait_timeout: float = 10_000
 
     def __init__(self, page: Page):
         """
@@ -20,6 +39,31 @@ class BasePage:
             page (Page): The Playwright page object to interact with the web page.
         """
         self.page = page
+        self.locator_registry: LocatorRegistry = locator_registry(page)
+        self.locator_registry.compile(*self.locators)
+
+    @property
+    def url(self) -> str:
+        """
+        The absolute URL of the page for the configured base URL.
+
+        Returns:
+            str: The page URL.
+        """
+        return config.url(self.path)
+
+    def locator(self, selector: str, index: int | None = None) -> Locator:
+        """
+        Returns the cached Locator of a selector, shared by all page objects of the page.
+
+        Args:
+            selector (str): The CSS or XPath selector.
+            index (int | None): The 0-based index of the element among the matches, None for the selector itself.
+
+        Returns:
+            Locator: The Locator.
+        """
+        return self.locator_registry.get(selector, index)
 
     def navigate(self, url: str):
         """
@@ -42,12 +86,82 @@ class BasePage:
             Exception: If the input field cannot be located or filled.
         """
         try:
-            input_field: Locator = self.page.locator(selector)
-            input_field.fill(str(value), timeout=300)
+            input_field: Locator = self.locator(selector)
+            with locator_profiler.action(selector, input_field):
+                input_field.fill(str(value), timeout=300)
         except Exception as e:
             self._attach_screenshot(f"Failed to fill input: {selector}")
             raise Exception(f"Error filling input field with selector '{selector}': {str(e)}")
 
+    def type_text(self, selector: str, text: str, strategy: TypingStrategy | None = None):
+        """
+        Enters text into an input field with the cheapest strategy that still fires the events the page listens to.
+
+        Without an explicit strategy the one forced with --typing-strategy is used, or the field's key event
+        listeners decide (see `utils.text_input.detect_strategy`). The time every field took is recorded per strategy.
+
+        Args:
+            selector (str): The CSS selector of the input field.
+            text (str): The text to enter.
+            strategy (TypingStrategy | None): The strategy to use instead of the forced or detected one.
+
+        Raises:
+            Exception: If the input field cannot be located or typed into.
+        """
+        try:
+            strategy = strategy or forced_strategy() or strategy_cache.strategy(self.page, selector)
+            input_field: Locator = self.locator(selector)
+            start: float = time.perf_counter()
+            with locator_profiler.action(selector, input_field):
+                if strategy is TypingStrategy.FILL:
+                    input_field.fill(text, timeout=self.wait_timeout)
+                elif strategy is TypingStrategy.BATCHED:
+                    input_field.evaluate(TYPE_KEYS_SCRIPT, text, timeout=self.wait_timeout)
+                else:
+                    input_field.press_sequentially(text, timeout=self.wait_timeout)
+            typing_recorder.record(strategy, selector, len(text), time.perf_counter() - start)
+        except Exception as e:
+            self._attach_screenshot(f"Failed to type into input: {selector}")
+            raise Exception(f"Error typing into input field with selector '{selector}': {str(e)}")
+
+    def fill_form(self, selectors: dict[str, str], values: dict[str, str | int | float | None],
+                  timeout: float | None = None):
+        """
+        Fills several input fields in a single round trip to the browser.
+
+        The fields are filled together once all of them are visible and editable, with the same 'input' and
+        'change' events as typing. Fields whose value is None are left untouched. Every field that fails gets its own
+        Allure attachment with the value and the error.
+
+        Args:
+            selectors (dict[str, str]): The selector of every field by name, e.g. AddContactPageLocators.contact_form.
+            values (dict[str, str | int | float | None]): The value of every field to fill, by name.
+            timeout (float | None): Milliseconds to wait for the fields to become editable, defaults to
+                `wait_timeout`.
+
+        Raises:
+            Exception: If a field has no selector, or can't be found, become editable or be filled.
+
+        Example:
+            >>> self.fill_form(AddContactPageLocators.contact_form, {"first_name": "Amy", "last_name": "Miller"})
+        """
+        unknown: list[str] = [name for name in values if name not in selectors]
+        if unknown:
+            raise Exception(f"No selector for form fields: {', '.join(unknown)}")
+        fields: list[list[str]] = [[name, selectors[name], str(value)] for name, value in values.items()
+                                   if value is not None]
+        failures: list[dict[str, str]] = self.page.evaluate(FILL_FORM_SCRIPT,
+                                                            [fields, timeout or self.wait_timeout])
+        if not failures:
+            return
+        for failure in failures:
+            allure.attach(f"Value: {values[failure['name']]}\nSelector: {failure['selector']}\n"
+                          f"Error: {failure['error']}", name=f"Failed to enter {failure['name'].replace('_', ' ')}",
+                          attachment_type=allure.attachment_type.TEXT)
+        self._attach_screenshot("Failed to fill form")
+        raise Exception("Error filling form fields: " + "; ".join(f"{failure['name']} ({failure['error']})"
+                                                                  for failure in failures))
+
     def click(self, selector: str):
         """
         Clicks on an element specified by the selector.
@@ -59,7 +173,10 @@ class BasePage:
             Exception: If the element cannot be located or clicked.
         """
         try:
-            self.page.click(selector)
+            # The first match, like Page.click, while Locator actions require a single match
+            element: Locator = self.locator(selector, 0)
+            with locator_profiler.action(selector, element):
+                element.click()
         except Exception as e:
             self._attach_screenshot(f"Failed to click element: {selector}")
             raise Exception(f"Error clicking element with selector '{selector}': {str(e)}")
@@ -76,23 +193,117 @@ class BasePage:
             Exception: If the element at the specified index cannot be located or clicked.
         """
         try:
-            self.page.locator(selector).nth(index).click()
+            element: Locator = self.locator(selector, index)
+            with locator_profiler.action(selector, element):
+                element.click()
         except Exception as e:
             self._attach_screenshot(f"Failed to click element at index {index}: {selector}")
             raise Exception(f"Error clicking element with selector '{selector}' at index {index}: {str(e)}")
 
-    def _attach_screenshot(self, name: str):
+    @staticmethod
+    def _endpoint_pattern(endpoint: str) -> re.Pattern:
         """
-        Helper method to attach screenshots to Allure reports for debugging purposes.
+        Compiles an endpoint template such as 'contacts/{id}' into a regex matching the request path.
 
         Args:
-            name (str): The name or description of the screenshot to be displayed in the report.
+            endpoint (str): The endpoint relative to the base URL, with '{name}' placeholders for path parameters.
 
-        Notes:
-            Screenshots are taken at the point of failure and attached to the Allure report as PNG files.
+        Returns:
+            re.Pattern: The compiled pattern.
         """
-        try:
-            screenshot_path = self.page.screenshot()
-            allure.attach(screenshot_path, name=name, attachment_type=allure.attachment_type.PNG)
-        except Exception as e:
-            raise Exception(f"Error capturing screenshot: {str(e)}")
+        base_path: str = urlparse(config.base_url()).path.rstrip("/")
+        parts: list[str] = re.split(r"\{[^/}]+}", endpoint.strip("/"))
+        return re.compile(f"^{re.escape(base_path)}/" + "[^/]+".join(re.escape(part) for part in parts) + "$")
+
+    @contextmanager
+    def expect_api_response(self, endpoint: str, method: str = "GET", baseline_seconds: float = 0.0,
+                            timeout: float | None = None, page_path: str | None = None) -> Iterator[object]:
+        """
+        Waits for the response of a specific API call triggered by the wrapped actions.
+
+        The listener is registered before the actions run, so a fast response can't be missed. Only the time spent
+        waiting after the actions is recorded.
+
+        Args:
+            endpoint (str): The endpoint template, e.g. 'contacts' or 'contacts/{id}'.
+            method (str): The HTTP method of the request.
+            baseline_seconds (float): The fixed sleep this wait replaces, for the savings report.
+            timeout (float | None): Timeout in milliseconds, defaults to `wait_timeout`.
+            page_path (str | None): Only match requests sent by this page, e.g. '/editContact', not by the page the
+                actions navigate away from.
+
+        Yields:
+            EventInfo: The Playwright event info, whose `value` is the matched response.
+
+        Example:
+            >>> with self.expect_api_response("contacts", "POST"):
+            ...     self.click(AddContactPageLocators.submit_button)
+        """
+        pattern: re.Pattern = self._endpoint_pattern(endpoint)
+        frame_path: str | None = urlparse(config.url(page_path)).path if page_path is not None else None
+
+        def matches(response: Response) -> bool:
+            if frame_path is not None and urlparse(response.frame.url).path != frame_path:
+                return False
+            return response.request.method == method and pattern.match(urlparse(response.url).path) is not None
+
+        with self.page.expect_response(matches, timeout=timeout or self.wait_timeout) as response_info:
+            yield response_info
+            start: float = time.perf_counter()
+        wait_recorder.record("response", f"{method} {endpoint}", time.perf_counter() - start, baseline_seconds)
+
+    def wait_for_page(self, path: str, baseline_seconds: float = 0.0, timeout: float | None = None):
+        """
+        Waits until the browser has navigated to the given page.
+
+        Args:
+            path (str): The path of the page, e.g. '/contactList'.
+            baseline_seconds (float): The fixed sleep this wait replaces, for the savings report.
+            timeout (float | None): Timeout in milliseconds, defaults to `wait_timeout`.
+        """
+        start: float = time.perf_counter()
+        self.page.wait_for_url(config.url(path), timeout=timeout or self.wait_timeout)
+        wait_recorder.record("url", path, time.perf_counter() - start, baseline_seconds)
+
+    def _wait_for_dom(self, selector: str, condition: str, expected: object, baseline_seconds: float,
+                      timeout: float | None):
+        start: float = time.perf_counter()
+        self.page.evaluate(WAIT_FOR_DOM_SCRIPT, [selector, condition, expected, timeout or self.wait_timeout])
+        wait_recorder.record("dom", f"{condition} {selector}", time.perf_counter() - start, baseline_seconds)
+
+    def wait_for_elements(self, selector: str, count: int = 1, baseline_seconds: float = 0.0,
+                          timeout: float | None = None):
+        """
+        Waits until at least `count` elements match the selector, reacting to DOM mutations.
+
+        Args:
+            selector (str): The CSS selector of the elements.
+            count (int): The minimum number of matching elements.
+            baseline_seconds (float): The fixed sleep this wait replaces, for the savings report.
+            timeout (float | None): Timeout in milliseconds, defaults to `wait_timeout`.
+        """
+        self._wait_for_dom(selector, "count", count, baseline_seconds, timeout)
+
+    def wait_for_text(self, selector: str, baseline_seconds: float = 0.0, timeout: float | None = None):
+        """
+        Waits until the first element matching the selector has non-empty text, e.g. after data was rendered.
+
+        Args:
+            selector (str): The CSS selector of the elements.
+            baseline_seconds (float): The fixed sleep this wait replaces, for the savings report.
+            timeout (float | None): Timeout in milliseconds, defaults to `wait_timeout`.
+        """
+        self._wait_for_dom(selector, "text", None, baseline_seconds, timeout)
+
+    def _attach_screenshot(self, name: str):
+        """
+        Helper method to capture the page for the Allure report when an action fails.
+
+        Only the first layer that handles a failure takes a screenshot and DOM snapshot; the layers it passes through
+        afterwards add `name` as context to the same capture (see `utils.artifacts.FailureArtifacts`). The capture is
+        attached when the test's report is made.
+
+        Args:
+            name (str): What failed, shown in the failure context of the report.
+        """
+        failure_artifacts.capture(self.page, name)
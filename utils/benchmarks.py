@@ -0,0 +1,226 @@
+import json
+import os
+import statistics
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import allure
+
+# How much slower than its baseline an operation's median may get before it is a regression
+DEFAULT_TOLERANCE: float = 0.2
+
+# How many scaled median absolute deviations a change has to exceed to be more than noise
+NOISE_FACTOR: float = 3.0
+
+# Scales the median absolute deviation to the standard deviation of normally distributed samples
+MAD_SCALE: float = 1.4826
+
+
+@dataclass
+class OperationBenchmark:
+    """
+    The wall times of repeated runs of one operation, after its warmup runs.
+
+    Attributes:
+        name (str): The operation, e.g. 'APIClient.get'.
+        samples (list[float]): The wall time of every measured run, in seconds.
+        warmup (int): The runs before the measured ones, whose times were dropped.
+    """
+    name: str
+    samples: list[float]
+    warmup: int
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.samples)
+
+    @property
+    def mad(self) -> float:
+        """The median absolute deviation from the median, a spread that ignores a few outliers."""
+        median: float = self.median
+        return statistics.median(abs(sample - median) for sample in self.samples)
+
+    @property
+    def mean(self) -> float:
+        return statistics.fmean(self.samples)
+
+    @property
+    def p95(self) -> float:
+        ordered: list[float] = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+
+    def to_dict(self) -> dict[str, object]:
+        """
+        Builds the baseline entry of the operation.
+
+        Returns:
+            dict[str, object]: The statistics, in seconds, and when they were measured.
+        """
+        return {"median": self.median, "mad": self.mad, "mean": self.mean, "p95": self.p95,
+                "min": min(self.samples), "runs": len(self.samples), "measured_at": time.time()}
+
+    def __str__(self) -> str:
+        return (f"{self.name:<40} median {self.median * 1000:8.2f}ms ± {self.mad * 1000:6.2f}ms  "
+                f"mean {self.mean * 1000:8.2f}ms  p95 {self.p95 * 1000:8.2f}ms  ({len(self.samples)} runs)")
+
+
+@dataclass
+class Comparison:
+    """
+    An operation's benchmark compared with its baseline.
+
+    Attributes:
+        benchmark (OperationBenchmark): The new measurements.
+        baseline (dict[str, object] | None): The stored baseline entry, None if the operation has none yet.
+        verdict (str): 'new', 'unchanged', 'faster' or 'slower'. Only 'slower' is a regression.
+        change (float): The relative change of the median, e.g. 0.25 for 25% slower.
+    """
+    benchmark: OperationBenchmark
+    baseline: dict[str, object] | None
+    verdict: str
+    change: float = 0.0
+
+    @property
+    def regressed(self) -> bool:
+        return self.verdict == "slower"
+
+    def __str__(self) -> str:
+        if self.baseline is None:
+            return f"{self.benchmark}  new"
+        return (f"{self.benchmark}  {self.verdict} ({self.change:+.0%} vs "
+                f"{float(self.baseline['median']) * 1000:.2f}ms)")
+
+
+class OperationBenchmarks:
+    """
+    Measures page object and APIClient operations and compares them with JSON baselines.
+
+    Every operation is run `warmup` times, then timed `repetitions` times, each run after an untimed `prepare` that
+    puts the application in the state the operation starts from (e.g. a contact to delete). The median of the runs
+    is compared with the operation's stored median: it is a regression when it is more than `tolerance` slower and
+    the difference is larger than NOISE_FACTOR times the spread of the runs, so a noisy operation has to slow down
+    by more than its usual jitter to be flagged.
+
+    The baselines are a JSON object keyed by operation name in `path`. They are only written when `save` is set,
+    e.g. on the commit a change is measured against.
+
+    Attributes:
+        path (str): The baseline file.
+        tolerance (float): How much slower the median may get, e.g. 0.2 for 20%.
+        save (bool): Whether the measurements of this run replace the baselines at the end of the session.
+        comparisons (list[Comparison]): The operations measured in this run.
+    """
+
+    def __init__(self, path: str = ".benchmarks/baseline.json", tolerance: float = DEFAULT_TOLERANCE,
+                 save: bool = False):
+        """
+        Initializes the OperationBenchmarks.
+
+        Args:
+            path (str): The baseline file.
+            tolerance (float): How much slower the median may get, e.g. 0.2 for 20%.
+            save (bool): Whether the measurements of this run replace the baselines at the end of the session.
+        """
+        self.path = path
+        self.tolerance = tolerance
+        self.save = save
+        self.comparisons: list[Comparison] = []
+        self._baselines: dict[str, dict[str, object]] | None = None
+
+    def baselines(self) -> dict[str, dict[str, object]]:
+        """
+        Reads the baseline file on first use.
+
+        Returns:
+            dict[str, dict[str, object]]: The baseline entries by operation name, empty if there is no file.
+        """
+        if self._baselines is None:
+            try:
+                with open(self.path, "r") as file:
+                    self._baselines = json.load(file)
+            except FileNotFoundError:
+                self._baselines = {}
+        return self._baselines
+
+    def measure(self, name: str, operation: Callable, prepare: Callable[[], object] | None = None,
+                warmup: int = 3, repetitions: int = 20) -> Comparison:
+        """
+        Times an operation and compares it with its baseline.
+
+        Args:
+            name (str): The operation, the key of its baseline.
+            operation (Callable): The operation. It is called with what `prepare` returned, or without arguments
+                if there is no `prepare`.
+            prepare (Callable[[], object] | None): Runs untimed before every run of the operation.
+            warmup (int): The runs before the measured ones.
+            repetitions (int): The measured runs.
+
+        Returns:
+            Comparison: The measurements and their verdict, also attached to the Allure report.
+        """
+        samples: list[float] = []
+        for run in range(warmup + repetitions):
+            arguments: tuple = (prepare(),) if prepare is not None else ()
+            start: float = time.perf_counter()
+            operation(*arguments)
+            if run >= warmup:
+                samples.append(time.perf_counter() - start)
+        comparison: Comparison = self.compare(OperationBenchmark(name, samples, warmup))
+        self.comparisons.append(comparison)
+        allure.attach(str(comparison), name=f"{name} benchmark", attachment_type=allure.attachment_type.TEXT)
+        return comparison
+
+    def compare(self, benchmark: OperationBenchmark) -> Comparison:
+        """
+        Compares measurements with the operation's baseline.
+
+        Args:
+            benchmark (OperationBenchmark): The measurements.
+
+        Returns:
+            Comparison: The verdict.
+        """
+        baseline: dict[str, object] | None = self.baselines().get(benchmark.name)
+        if baseline is None:
+            return Comparison(benchmark, None, "new")
+        base_median: float = float(baseline["median"])
+        difference: float = benchmark.median - base_median
+        change: float = difference / base_median if base_median else 0.0
+        noise: float = NOISE_FACTOR * MAD_SCALE * max(float(baseline["mad"]), benchmark.mad)
+        if abs(change) <= self.tolerance or abs(difference) <= noise:
+            return Comparison(benchmark, baseline, "unchanged", change)
+        return Comparison(benchmark, baseline, "slower" if difference > 0 else "faster", change)
+
+    def write(self):
+        """
+        Replaces the baselines of the operations measured in this run, keeping the others.
+
+        Run the benchmarks in a single process when saving, as parallel workers would each write their own.
+        """
+        baselines: dict[str, dict[str, object]] = dict(self.baselines())
+        for comparison in self.comparisons:
+            baselines[comparison.benchmark.name] = comparison.benchmark.to_dict()
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        temporary_path: str = f"{self.path}.{os.getpid()}.tmp"
+        with open(temporary_path, "w") as file:
+            json.dump(baselines, file, indent=2, sort_keys=True)
+        os.replace(temporary_path, self.path)
+        self._baselines = baselines
+
+    def summary(self) -> str:
+        """
+        Builds a human-readable summary of the operations measured in this run.
+
+        Returns:
+            str: The summary text.
+        """
+        regressions: int = sum(comparison.regressed for comparison in self.comparisons)
+        lines: list[str] = [str(comparison) for comparison in self.comparisons]
+        lines.append(f"{regressions} regressions beyond {self.tolerance:.0%} against {self.path}"
+                     + (", baselines saved" if self.save else ""))
+        return "\n".join(lines)
+
+
+# Configured from --benchmark-baseline, --benchmark-tolerance and --benchmark-save by conftest.py
+operation_benchmarks = OperationBenchmarks()
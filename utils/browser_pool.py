@@ -0,0 +1,210 @@
+import time
+from dataclasses import dataclass
+
+from playwright.sync_api import Playwright, Browser, BrowserContext, Page
+
+
+@dataclass(frozen=True)
+class BrowserProfile:
+    """
+    Launch and context options for a named browser configuration.
+
+    Attributes:
+        name (str): The profile name used on the command line.
+        headless (bool): Whether the browser runs without a visible window.
+        slow_mo (float): Milliseconds Playwright waits between operations.
+        args (tuple[str, ...]): Extra command line arguments passed to Chromium.
+        no_viewport (bool): Whether contexts use the window size instead of a fixed viewport.
+    """
+    name: str
+    headless: bool
+    slow_mo: float
+    args: tuple[str, ...] = ()
+    no_viewport: bool = False
+
+
+BROWSER_PROFILES: dict[str, BrowserProfile] = {
+    # Visual debugging: the original per-test configuration
+    "headed": BrowserProfile("headed", headless=False, slow_mo=500, args=("--start-maximized",), no_viewport=True),
+    # CI and local speed runs
+    "fast": BrowserProfile("fast", headless=True, slow_mo=0),
+}
+
+
+@dataclass
+class SessionTiming:
+    """
+    Timings recorded for a single test using a pooled browser.
+
+    Attributes:
+        test_name (str): The node id of the test.
+        launch_seconds (float): Time spent launching a browser for this test (0 when an existing one was reused).
+        context_seconds (float): Time spent creating the browser context and page.
+        teardown_seconds (float): Time spent closing the context (and the browser when it was recycled).
+        recycled (bool): Whether the browser was closed after this test by the recycle policy.
+    """
+    test_name: str
+    launch_seconds: float = 0.0
+    context_seconds: float = 0.0
+    teardown_seconds: float = 0.0
+    recycled: bool = False
+
+    def __str__(self) -> str:
+        return (f"launch={self.launch_seconds:.3f}s context={self.context_seconds:.3f}s "
+                f"teardown={self.teardown_seconds:.3f}s recycled={self.recycled}")
+
+
+class PooledSession:
+    """
+    An isolated browser context and page handed out by the BrowserPool for one test.
+
+    Attributes:
+        context (BrowserContext): The browser context owned by the test.
+        page (Page): The page opened in the context.
+        timing (SessionTiming): The timings recorded for the test.
+    """
+
+    def __init__(self, context: BrowserContext, page: Page, timing: SessionTiming):
+        self.context = context
+        self.page = page
+        self.timing = timing
+
+
+class BrowserPool:
+    """
+    Keeps a single browser running per worker and hands out a fresh context and page per test.
+
+    Launching Chromium is by far the most expensive part of a UI test setup. The pool launches it lazily,
+    reuses it across tests and only relaunches it after `recycle_after` tests to bound memory growth of
+    long-running browsers.
+
+    Attributes:
+        profile (BrowserProfile): The launch configuration used for every browser.
+        recycle_after (int): Number of tests after which the browser is closed and relaunched (0 disables it).
+        timings (list[SessionTiming]): Timings of every session handed out by the pool.
+    """
+
+    def __init__(self, playwright: Playwright, profile: BrowserProfile, recycle_after: int = 0):
+        """
+        Initializes the BrowserPool without launching a browser.
+
+        Args:
+            playwright (Playwright): The running Playwright instance.
+            profile (BrowserProfile): The launch configuration to use.
+            recycle_after (int): Number of tests after which the browser is relaunched (0 disables recycling).
+        """
+        self.playwright = playwright
+        self.profile = profile
+        self.recycle_after = recycle_after
+        self.timings: list[SessionTiming] = []
+        self._browser: Browser | None = None
+        self._tests_on_browser: int = 0
+        self._pending_launch_seconds: float = 0.0
+
+    @property
+    def browser(self) -> Browser:
+        """
+        The running browser, launched on first access.
+
+        A launch triggered here (e.g. by a fixture that needs the browser before the test's context exists) is
+        accounted to the next acquired session.
+
+        Returns:
+            Browser: The pooled browser.
+        """
+        if self._browser is None or not self._browser.is_connected():
+            start = time.perf_counter()
+            self._browser = self._launch()
+            self._tests_on_browser = 0
+            self._pending_launch_seconds += time.perf_counter() - start
+        return self._browser
+
+    def _launch(self) -> Browser:
+        """
+        Launches a Chromium browser with the pool's profile.
+
+        Returns:
+            Browser: The launched browser.
+        """
+        return self.playwright.chromium.launch(headless=self.profile.headless, slow_mo=self.profile.slow_mo,
+                                               args=list(self.profile.args))
+
+    def acquire(self, test_name: str, **context_options) -> PooledSession:
+        """
+        Creates an isolated browser context and page, launching the browser first if needed.
+
+        Args:
+            test_name (str): The node id of the test the session belongs to.
+            **context_options: Extra keyword arguments passed to `Browser.new_context`.
+
+        Returns:
+            PooledSession: The context, page and timing record for the test.
+        """
+        browser: Browser = self.browser
+        timing = SessionTiming(test_name, launch_seconds=self._pending_launch_seconds)
+        self._pending_launch_seconds = 0.0
+
+        if self.profile.no_viewport:
+            context_options.setdefault("no_viewport", True)
+        start = time.perf_counter()
+        context: BrowserContext = browser.new_context(**context_options)
+        page: Page = context.new_page()
+        timing.context_seconds = time.perf_counter() - start
+
+        self.timings.append(timing)
+        return PooledSession(context, page, timing)
+
+    def release(self, session: PooledSession):
+        """
+        Closes the session's context and recycles the browser when the policy requires it.
+
+        Args:
+            session (PooledSession): The session returned by `acquire`.
+        """
+        start = time.perf_counter()
+        try:
+            session.context.close()
+        finally:
+            self._tests_on_browser += 1
+            if self.recycle_after and self._tests_on_browser >= self.recycle_after:
+                self._close_browser()
+                session.timing.recycled = True
+            session.timing.teardown_seconds = time.perf_counter() - start
+
+    def _close_browser(self):
+        """
+        Closes the current browser, ignoring browsers that already disconnected.
+        """
+        if self._browser is not None and self._browser.is_connected():
+            self._browser.close()
+        self._browser = None
+        self._tests_on_browser = 0
+
+    def close(self):
+        """
+        Closes the browser at the end of the worker's session.
+        """
+        self._close_browser()
+
+    def summary(self) -> str:
+        """
+        Builds a human-readable summary of the pool's launch and teardown costs.
+
+        The saving is estimated as the average launch time multiplied by the number of tests that reused a
+        running browser instead of launching their own.
+
+        Returns:
+            str: The summary text.
+        """
+        tests = len(self.timings)
+        launches = [t.launch_seconds for t in self.timings if t.launch_seconds]
+        launch_total = sum(launches)
+        average_launch = launch_total / len(launches) if launches else 0.0
+        context_total = sum(t.context_seconds for t in self.timings)
+        teardown_total = sum(t.teardown_seconds for t in self.timings)
+        saved = average_launch * (tests - len(launches))
+        return (f"Browser pool ({self.profile.name}, recycle_after={self.recycle_after}): "
+                f"{tests} tests, {len(launches)} browser launches\n"
+                f"  launch total {launch_total:.2f}s (avg {average_launch:.2f}s), "
+                f"context total {context_total:.2f}s, teardown total {teardown_total:.2f}s\n"
+                f"  estimated launch time saved vs. one browser per test: {saved:.2f}s")
@@ -0,0 +1,45 @@
+import os
+
+DEFAULT_BASE_URL: str = "https://thinking-tester-contact-list.herokuapp.com"
+
+# The base URL of the application under test. conftest.py overrides it from --base-url (or the PYTEST_BASE_URL
+# environment variable) and points it at the bundled server when --local-app is used.
+_base_url: str = os.environ.get("PYTEST_BASE_URL", DEFAULT_BASE_URL).rstrip("/")
+
+
+def set_base_url(base_url: str):
+    """
+    Sets the base URL of the application under test.
+
+    Args:
+        base_url (str): The base URL, with or without a trailing slash.
+    """
+    global _base_url
+    _base_url = base_url.rstrip("/")
+
+
+def base_url() -> str:
+    """
+    Returns the base URL of the application under test.
+
+    Returns:
+        str: The base URL without a trailing slash.
+    """
+    return _base_url
+
+
+def url(path: str = "") -> str:
+    """
+    Builds an absolute URL of the application under test.
+
+    Args:
+        path (str): The path of the page or endpoint, e.g. '/contactList'.
+
+    Returns:
+        str: The absolute URL.
+
+    Example:
+        >>> url("/contactList")
+        'https://thinking-tester-contact-list.herokuapp.com/contactList'
+    """
+    return f"{_base_url}/{path.lstrip('/')}" if path else _base_url
@@ -0,0 +1,126 @@
+from dataclasses import dataclass
+
+# Reads the header and every row of the contacts table in one call. Uses textContent, which unlike innerText doesn't
+# force a layout, and includes the hidden cell with the contact's id.
+CONTACT_TABLE_SCRIPT: str = """
+(rowSelector) => {
+    const rows = Array.from(document.querySelectorAll(rowSelector));
+    const table = rows.length ? rows[0].closest('table') : null;
+    const headers = table ? Array.from(table.querySelectorAll('th'), th => th.textContent.trim()) : [];
+    return {headers, rows: rows.map(row => Array.from(row.cells, cell => cell.textContent.trim()))};
+}
+"""
+
+# The header of every column of a contact row, in the application's order
+COLUMNS: dict[str, str] = {
+    "Name": "name",
+    "Birthdate": "birthdate",
+    "Email": "email",
+    "Phone": "phone",
+    "Address": "address",
+    "City, State/Province, Postal Code": "city_line",
+    "Country": "country",
+}
+
+
+@dataclass
+class ContactRow:
+    """
+    One row of the contacts table.
+
+    Attributes:
+        index (int): The 0-based position of the row in the table.
+        contact_id (str): The contact's id, from the row's hidden cell, empty if the table has none.
+        name (str): The first and last name.
+        birthdate (str): The birthdate.
+        email (str): The email address.
+        phone (str): The phone number.
+        address (str): The street address.
+        city_line (str): The city, state or province and postal code.
+        country (str): The country.
+    """
+    index: int
+    contact_id: str = ""
+    name: str = ""
+    birthdate: str = ""
+    email: str = ""
+    phone: str = ""
+    address: str = ""
+    city_line: str = ""
+    country: str = ""
+
+
+class ContactTable:
+    """
+    A snapshot of the contacts table, indexed by email and by name.
+
+    Built from a single read of the table, after which every lookup is a dictionary access, however many contacts
+    the list has.
+
+    Attributes:
+        rows (list[ContactRow]): The rows in table order.
+    """
+
+    def __init__(self, rows: list[ContactRow]):
+        """
+        Initializes the ContactTable and indexes its rows.
+
+        Args:
+            rows (list[ContactRow]): The rows in table order.
+        """
+        self.rows = rows
+        self._by_email: dict[str, ContactRow] = {}
+        self._by_name: dict[str, list[ContactRow]] = {}
+        for row in rows:
+            self._by_email.setdefault(row.email.lower(), row)
+            self._by_name.setdefault(row.name, []).append(row)
+
+    @classmethod
+    def parse(cls, snapshot: dict[str, list]) -> "ContactTable":
+        """
+        Builds the table from the result of CONTACT_TABLE_SCRIPT.
+
+        The columns are matched by their header. A row with more cells than there are headers starts with the hidden
+        id cell.
+
+        Args:
+            snapshot (dict[str, list]): The 'headers' and the cell texts of the 'rows'.
+
+        Returns:
+            ContactTable: The indexed table.
+        """
+        fields: list[str | None] = [COLUMNS.get(header) for header in snapshot["headers"]]
+        rows: list[ContactRow] = []
+        for index, cells in enumerate(snapshot["rows"]):
+            row = ContactRow(index)
+            if len(cells) > len(fields):
+                row.contact_id, cells = cells[0], cells[1:]
+            for field, value in zip(fields, cells):
+                if field:
+                    setattr(row, field, value)
+            rows.append(row)
+        return cls(rows)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def find(self, email: str | None = None, name: str | None = None) -> ContactRow | None:
+        """
+        Finds a contact by email (case-insensitive) or, without an email, by its full name.
+
+        Args:
+            email (str | None): The contact's email address.
+            name (str | None): The contact's first and last name, e.g. 'Amy Miller'. The first row is returned if
+                several contacts have the name.
+
+        Returns:
+            ContactRow | None: The contact's row, None if it isn't listed.
+
+        Raises:
+            ValueError: If neither an email nor a name is given.
+        """
+        if email is not None:
+            return self._by_email.get(email.lower())
+        if name is not None:
+            return next(iter(self._by_name.get(name, [])), None)
+        raise ValueError("Give the email or the name of the contact")
@@ -0,0 +1,248 @@
+import json
+import mmap
+import os
+from array import array
+from collections.abc import Iterable
+
+from utils.resource_cache import CACHE_DIR
+
+# Bumped when the index layout changes, so indexes written by an older version are rebuilt
+INDEX_FORMAT: int = 1
+
+
+class Dataset:
+    """
+    A JSON Lines file of test records, read one record at a time.
+
+    The byte offset of every record is kept in an index file (`__jsoncache__/<name>.idx` next to the dataset), built
+    on first use and keyed by the dataset's modification time and size. The dataset itself is memory-mapped, so
+    reading a record only touches the pages it is on: a worker running a share of the tests reads only the records
+    of its share, and no process holds the whole dataset in memory.
+
+    Attributes:
+        path (str): The dataset file.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initializes the Dataset, building its index if it is missing or stale.
+
+        Args:
+            path (str): The JSON Lines file, one JSON object per line (blank lines are ignored).
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+        """
+        self.path = path
+        stat: os.stat_result = os.stat(path)
+        self._key: tuple[int, int] = (stat.st_mtime_ns, stat.st_size)
+        self._offsets: array = self._read_index() or self._build_index()
+        self._file = None
+        self._map: mmap.mmap | None = None
+
+    @property
+    def index_path(self) -> str:
+        directory, name = os.path.split(self.path)
+        return os.path.join(directory, CACHE_DIR, f"{name}.idx")
+
+    def _read_index(self) -> array | None:
+        """
+        Reads the index, if it was built from the current version of the dataset.
+
+        Returns:
+            array | None: The record offsets, None if the index is missing, stale or unreadable.
+        """
+        try:
+            with open(self.index_path, "rb") as file:
+                header: dict[str, object] = json.loads(file.readline())
+                if header.get("format") != INDEX_FORMAT or header.get("key") != list(self._key):
+                    return None
+                offsets: array = array("Q")
+                offsets.frombytes(file.read())
+                return offsets
+        except (OSError, ValueError, AttributeError):
+            return None
+
+    def _build_index(self) -> array:
+        """
+        Scans the dataset for the offset of every record and writes the index atomically, so a concurrent worker
+        never reads half of it. A failed write is ignored, the index is then just built again next time.
+
+        Returns:
+            array: The record offsets.
+        """
+        offsets: array = array("Q")
+        position: int = 0
+        with open(self.path, "rb") as file:
+            for line in file:
+                if line.strip():
+                    offsets.append(position)
+                position += len(line)
+        temporary: str = f"{self.index_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+            with open(temporary, "wb") as file:
+                file.write(json.dumps({"format": INDEX_FORMAT, "key": list(self._key)}).encode() + b"\n")
+                offsets.tofile(file)
+            os.replace(temporary, self.index_path)
+        except OSError:
+            try:
+                os.remove(temporary)
+            except OSError:
+                pass
+        return offsets
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def record(self, index: int) -> dict[str, object]:
+        """
+        Reads a single record.
+
+        Args:
+            index (int): The record's position in the dataset.
+
+        Returns:
+            dict[str, object]: The record.
+
+        Raises:
+            IndexError: If there is no such record.
+            ValueError: If the record is not valid JSON.
+        """
+        start: int = self._offsets[index]
+        if self._map is None:
+            self._file = open(self.path, "rb")
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        end: int = self._map.find(b"\n", start)
+        try:
+            return json.loads(self._map[start:end if end != -1 else len(self._map)])
+        except ValueError as e:
+            raise ValueError(f"Error decoding record {index} of {self.path}. Error: {str(e)}")
+
+    def close(self):
+        """
+        Unmaps the dataset.
+        """
+        if self._map is not None:
+            self._map.close()
+            self._file.close()
+            self._map = self._file = None
+
+
+class DatasetRecord:
+    """
+    A reference to one record of a dataset, the value a data-driven test is parametrized with at collection.
+
+    Only the path and index are kept. The fixture parametrized with the reference reads the record itself when it is
+    set up, see conftest.py.
+
+    Attributes:
+        path (str): The dataset file.
+        index (int): The record's position in the dataset.
+    """
+    __slots__ = ("path", "index")
+
+    def __init__(self, path: str, index: int):
+        self.path = path
+        self.index = index
+
+    def load(self) -> dict[str, object]:
+        """
+        Reads the record from its dataset.
+
+        Returns:
+            dict[str, object]: The record.
+        """
+        return open_dataset(self.path).record(self.index)
+
+    def __repr__(self) -> str:
+        return f"{os.path.basename(self.path)}[{self.index}]"
+
+
+_datasets: dict[str, Dataset] = {}
+
+
+def open_dataset(path: str) -> Dataset:
+    """
+    Returns the dataset of a file, opened once per process.
+
+    Args:
+        path (str): The JSON Lines file.
+
+    Returns:
+        Dataset: The dataset.
+    """
+    if path not in _datasets:
+        _datasets[path] = Dataset(path)
+    return _datasets[path]
+
+
+def close_datasets():
+    """
+    Unmaps every dataset opened by the process.
+    """
+    for dataset in _datasets.values():
+        dataset.close()
+    _datasets.clear()
+
+
+def parse_shard(shard: str) -> tuple[int, int]:
+    """
+    Parses a shard given as '<index>/<count>'.
+
+    Args:
+        shard (str): The shard, e.g. '2/4' for the second of four shards.
+
+    Returns:
+        tuple[int, int]: The zero-based shard index and the shard count.
+
+    Raises:
+        ValueError: If the shard is malformed or out of range.
+
+    Example:
+        >>> parse_shard("2/4")
+        (1, 4)
+    """
+    try:
+        index, count = (int(part) for part in shard.split("/"))
+    except ValueError:
+        raise ValueError(f"Invalid shard '{shard}', expected '<index>/<count>', e.g. '1/4'")
+    if not 1 <= index <= count:
+        raise ValueError(f"Invalid shard '{shard}', the index must be between 1 and {count}")
+    return index - 1, count
+
+
+def shard_records(path: str, shard: tuple[int, int] = (0, 1)) -> list[DatasetRecord]:
+    """
+    Returns references to the records of a dataset that belong to a shard, every `count`-th record starting at
+    `index`.
+
+    Args:
+        path (str): The JSON Lines file.
+        shard (tuple[int, int]): The zero-based shard index and the shard count.
+
+    Returns:
+        list[DatasetRecord]: The shard's records.
+    """
+    index, count = shard
+    return [DatasetRecord(path, position) for position in range(index, len(open_dataset(path)), count)]
+
+
+def write_dataset(path: str, records: Iterable[dict[str, object]]) -> int:
+    """
+    Writes records to a JSON Lines dataset one at a time, so generated datasets never have to fit in memory.
+
+    Args:
+        path (str): The JSON Lines file to write.
+        records (Iterable[dict[str, object]]): The records, e.g. a generator.
+
+    Returns:
+        int: The number of records written.
+    """
+    count: int = 0
+    with open(path, "w", encoding="utf-8") as file:
+        for record in records:
+            file.write(json.dumps(record, ensure_ascii=False))
+            file.write("\n")
+            count += 1
+    return count
@@ -0,0 +1,186 @@
+from dataclasses import dataclass
+
+import allure
+from playwright.sync_api import APIResponse
+
+from utils.api import APIClient
+from utils.transport import HttpResponse, Transport
+from utils.workers import unique_email
+
+# A valid contact, the base of every contact created by the ContactFactory
+CONTACT_DEFAULTS: dict[str, object] = {
+    "firstName": "Amy",
+    "lastName": "Miller",
+    "birthdate": "1992-02-02",
+    "email": "amiller2@fake.com",
+    "phone": "8005554242",
+    "street1": "13 School St.",
+    "street2": "Apt. 5",
+    "city": "Washington",
+    "stateProvince": "QC",
+    "postalCode": "A1A1A1",
+    "country": "USA",
+}
+
+# A valid user, registered with an email that is unique for the run, worker and call
+USER_DEFAULTS: dict[str, object] = {
+    "firstName": "Api",
+    "lastName": "User",
+    "email": "api-user@fake.com",
+    "password": "myPassword",
+}
+
+
+@dataclass
+class ApiUser:
+    """
+    A user registered through the API.
+
+    Attributes:
+        email (str): The user's email.
+        password (str): The user's password.
+        token (str): A token of the user.
+        user_id (str): The user's id.
+    """
+    email: str
+    password: str
+    token: str
+    user_id: str = ""
+
+
+class UserFactory:
+    """
+    Registers users on demand and deletes them again on cleanup.
+
+    Every user gets a unique email, so tests can create users in any order and on any worker.
+    """
+
+    def __init__(self, transport: Transport, base_url: str):
+        """
+        Initializes the UserFactory.
+
+        Args:
+            transport (Transport): The transport the clients send their requests with.
+            base_url (str): The base URL for API requests.
+        """
+        self.transport = transport
+        self.base_url = base_url
+        self._users: list[ApiUser] = []
+
+    def client(self, user: ApiUser | None = None) -> APIClient:
+        """
+        Creates a client of its own, authenticated as the user, so no state is shared with other tests. The client
+        gets the user's token from the token manager, which logs in again when the token expires or is rejected.
+
+        Args:
+            user (ApiUser | None): The user, None for an unauthenticated client.
+
+        Returns:
+            APIClient: The client.
+        """
+        client = APIClient(self.transport, self.base_url)
+        if user is not None:
+            client.authenticate(user.email, user.password, user.token)
+        return client
+
+    @allure.step("Create a user")
+    def create(self, **fields: object) -> ApiUser:
+        """
+        Registers a user.
+
+        Args:
+            **fields (object): Fields to use instead of USER_DEFAULTS. The email is made unique either way.
+
+        Returns:
+            ApiUser: The registered user.
+
+        Raises:
+            Exception: If the user can't be registered.
+        """
+        payload: dict[str, object] = {**USER_DEFAULTS, **fields}
+        payload["email"] = unique_email(str(payload["email"]))
+        response: APIResponse | HttpResponse = self.client().post("users", payload)
+        if not response.ok:
+            raise Exception(f"Error registering the user {payload['email']}: {response.text()}")
+        return self.adopt(response.json(), str(payload["password"]))
+
+    def adopt(self, registration: dict[str, object], password: str) -> ApiUser:
+        """
+        Takes over a user a test registered itself, so it is deleted on cleanup.
+
+        Args:
+            registration (dict[str, object]): The response of the registration, with the 'user' and its 'token'.
+            password (str): The user's password.
+
+        Returns:
+            ApiUser: The user.
+        """
+        user_data: dict[str, object] = registration["user"]
+        user = ApiUser(str(user_data["email"]), password, str(registration["token"]), str(user_data.get("_id", "")))
+        self._users.append(user)
+        return user
+
+    def cleanup(self):
+        """
+        Deletes every user the factory created or adopted, with their contacts. Users that are already gone are
+        ignored.
+        """
+        users, self._users = self._users, []
+        for user in reversed(users):
+            client: APIClient = self.client(user)
+            client.delete("users/me")
+            client.tokens.forget(client.tokens.key(self.base_url, user.email, user.password))
+
+
+class ContactFactory:
+    """
+    Adds contacts for a user on demand and deletes the ones still there on cleanup.
+    """
+
+    def __init__(self, client: APIClient):
+        """
+        Initializes the ContactFactory.
+
+        Args:
+            client (APIClient): A client authenticated as the user owning the contacts.
+        """
+        self.client = client
+        self._contact_ids: list[str] = []
+
+    @allure.step("Create a contact")
+    def create(self, **fields: object) -> dict[str, object]:
+        """
+        Adds a contact.
+
+        Args:
+            **fields (object): Fields to use instead of CONTACT_DEFAULTS.
+
+        Returns:
+            dict[str, object]: The contact as returned by the API, with its '_id'.
+
+        Raises:
+            Exception: If the contact can't be added.
+        """
+        response: APIResponse | HttpResponse = self.client.post("contacts", {**CONTACT_DEFAULTS, **fields})
+        if not response.ok:
+            raise Exception(f"Error adding a contact: {response.text()}")
+        contact: dict[str, object] = response.json()
+        self.adopt(str(contact["_id"]))
+        return contact
+
+    def adopt(self, contact_id: str):
+        """
+        Takes over a contact a test added itself, so it is deleted on cleanup.
+
+        Args:
+            contact_id (str): The contact's id.
+        """
+        self._contact_ids.append(contact_id)
+
+    def cleanup(self):
+        """
+        Deletes every contact the factory created or adopted. Contacts the test already deleted are ignored.
+        """
+        contact_ids, self._contact_ids = self._contact_ids, []
+        for contact_id in contact_ids:
+            self.client.delete(f"contacts/{contact_id}")
@@ -1,5 +1,6 @@
 import allure
-import json5
+
+from utils.resource_cache import resource_cache
 
 
 @allure.step("Get data from JSON file")
@@ -7,6 +8,9 @@ def get_json(filepath: str) -> list[dict[str, object]]:
     """
     Reads a JSON5 file and returns its contents as a list of dictionaries.
 
+    The file is parsed once per version and cached in memory and in a compiled sidecar file, see `ResourceCache`.
+    Every call returns its own copy of the data.
+
     Args:
         filepath (str): The path to the JSON5 file.
 
@@ -23,9 +27,8 @@ def get_json(filepath: str) -> list[dict[str, object]]:
         [{'email': 'user@example.com', 'password': 'password123'}]
     """
     try:
-        with open(filepath, 'r') as file:
-            file_data: list[dict[str, object]] = json5.load(file)
-            return file_data
+        file_data: list[dict[str, object]] = resource_cache.load(filepath)
+        return file_data
     except FileNotFoundError as e:
         raise FileNotFoundError(f"File not found: {filepath}. Error: {str(e)}")
     except ValueError as e:
@@ -0,0 +1,93 @@
+# Finds the native 'value' setter of a field. Setting the value through it instead of the property lets frameworks
+# that track the value see the change.
+VALUE_SETTER: str = """
+const valueSetter = (element) => {
+    for (let proto = Object.getPrototypeOf(element); proto; proto = Object.getPrototypeOf(proto)) {
+        const descriptor = Object.getOwnPropertyDescriptor(proto, 'value');
+        if (descriptor && descriptor.set) {
+            return descriptor.set;
+        }
+    }
+    return function (value) { this.value = value; };
+};
+"""
+
+# Fills every field of a form in one call. It waits until all fields are present, visible and editable (re-checking on
+# every DOM mutation), then sets each value through the native setter and dispatches 'input' and 'change' like a user
+# would. Resolves with the fields that failed.
+FILL_FORM_SCRIPT: str = """
+([fields, timeout]) => new Promise((resolve) => {
+    const problem = (selector) => {
+        const element = document.querySelector(selector);
+        if (!element) {
+            return 'not found';
+        }
+        if (!element.getClientRects().length) {
+            return 'not visible';
+        }
+        if (element.matches(':disabled') || element.readOnly) {
+            return 'not editable';
+        }
+        return null;
+    };
+    const pending = () => fields
+        .map(([name, selector]) => ({name, selector, error: problem(selector)}))
+        .filter(field => field.error);
+    """ + VALUE_SETTER + """
+    const fill = () => {
+        const failures = [];
+        for (const [name, selector, value] of fields) {
+            const element = document.querySelector(selector);
+            try {
+                element.focus();
+                valueSetter(element).call(element, value);
+                element.dispatchEvent(new Event('input', {bubbles: true}));
+                element.dispatchEvent(new Event('change', {bubbles: true}));
+                element.blur();
+            } catch (error) {
+                failures.push({name, selector, error: String(error)});
+            }
+        }
+        return failures;
+    };
+    if (!pending().length) {
+        return resolve(fill());
+    }
+    const observer = new MutationObserver(() => {
+        if (!pending().length) {
+            observer.disconnect();
+            clearTimeout(timer);
+            resolve(fill());
+        }
+    });
+    const timer = setTimeout(() => {
+        observer.disconnect();
+        resolve(pending().map(field => ({...field, error: `${field.error} after ${timeout}ms`})));
+    }, timeout);
+    observer.observe(document, {childList: true, subtree: true, attributes: true});
+})
+"""
+
+# Types a text into a field (passed in by `Locator.evaluate`) in one call: for every character it dispatches keydown,
+# keypress, beforeinput, input and keyup, appending the character in between unless a listener cancelled the key, and
+# 'change' at the end. The events are synthetic, so they reach page listeners but not the browser's own key handling.
+TYPE_KEYS_SCRIPT: str = """
+(element, text) => {
+    """ + VALUE_SETTER + """
+    const setValue = valueSetter(element);
+    element.focus();
+    for (const key of text) {
+        const init = {key, code: key.length === 1 ? `Key${key.toUpperCase()}` : key, bubbles: true, cancelable: true};
+        const accepted = element.dispatchEvent(new KeyboardEvent('keydown', init))
+            && element.dispatchEvent(new KeyboardEvent('keypress', init))
+            && element.dispatchEvent(new InputEvent('beforeinput', {data: key, inputType: 'insertText', bubbles: true,
+                                                                    cancelable: true}));
+        if (accepted) {
+            setValue.call(element, element.value + key);
+            element.dispatchEvent(new InputEvent('input', {data: key, inputType: 'insertText', bubbles: true}));
+        }
+        element.dispatchEvent(new KeyboardEvent('keyup', init));
+    }
+    element.dispatchEvent(new Event('change', {bubbles: true}));
+}
+"""
@@ -0,0 +1,206 @@
+import json
+import os
+import re
+from dataclasses import dataclass, field
+from urllib.parse import urlparse
+
+from playwright.sync_api import BrowserContext, Request
+
+HAR_MODES: tuple[str, ...] = ("off", "record", "replay", "replay-strict")
+
+
+@dataclass
+class HarSession:
+    """
+    The HAR file of one test and the requests it couldn't answer.
+
+    Attributes:
+        test_name (str): The node id of the test.
+        mode (str): 'record' or 'replay'.
+        path (str): The test's HAR file.
+        unmatched (list[str]): Requests to the application that weren't in the HAR file (strict replay only).
+    """
+    test_name: str
+    mode: str
+    path: str
+    unmatched: list[str] = field(default_factory=list)
+
+
+class HarRouter:
+    """
+    Records the application's traffic of every UI test to a HAR file, or replays a test from it.
+
+    Only requests to the application's origin (its pages, scripts and API) are recorded and replayed, one HAR file
+    per test. In replay the responses come from the file, without any network or backend latency. A request that
+    isn't in the file goes to the network, or in strict replay is aborted and reported, so the test fails instead
+    of silently running against a live backend.
+
+    A logged-in test's credentials and storage state are saved next to its HAR file when it is recorded, so its
+    replay starts from the same session without registering or logging in through the live backend. Requests
+    whose body differs between runs (e.g. registering a unique email) can't be matched by a replay; such tests are
+    marked 'live_backend' and skipped by a strict replay.
+
+    Attributes:
+        mode (str): One of HAR_MODES.
+        directory (str): Where the HAR files are stored.
+        sessions (list[HarSession]): The recorded or replayed tests.
+    """
+
+    def __init__(self, mode: str = "off", directory: str = "har"):
+        """
+        Initializes the HarRouter.
+
+        Args:
+            mode (str): One of HAR_MODES.
+            directory (str): Where the HAR files are stored.
+        """
+        self.mode = mode
+        self.directory = directory
+        self.sessions: list[HarSession] = []
+        self._active: dict[int, HarSession] = {}
+
+    def har_path(self, test_name: str) -> str:
+        """
+        Returns the HAR file of a test.
+
+        Args:
+            test_name (str): The node id of the test.
+
+        Returns:
+            str: The path, e.g. 'har/tests_test_login.py_test_login_with_valid_credentials_login_credentials0.har'.
+        """
+        return os.path.join(self.directory, re.sub(r"[^\w.-]+", "_", test_name).strip("_") + ".har")
+
+    def login_path(self, test_name: str) -> str:
+        """
+        Returns the file of a test's recorded login, next to its HAR file.
+
+        Args:
+            test_name (str): The node id of the test.
+
+        Returns:
+            str: The path, the HAR file's with '.login.json' instead of '.har'.
+        """
+        return self.har_path(test_name)[:-len(".har")] + ".login.json"
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode in ("replay", "replay-strict")
+
+    def save_login(self, test_name: str, credentials: dict[str, object], storage_state: str):
+        """
+        Saves the login a test is recorded with, when recording.
+
+        Args:
+            test_name (str): The node id of the test.
+            credentials (dict[str, object]): The 'email' and 'password' the test logged in with.
+            storage_state (str): The storage state file the test's context was created from.
+        """
+        if self.mode != "record":
+            return
+        with open(storage_state, "r") as file:
+            state: dict[str, object] = json.load(file)
+        os.makedirs(self.directory, exist_ok=True)
+        with open(self.login_path(test_name), "w") as file:
+            json.dump({"credentials": credentials, "storage_state": state}, file, indent=2)
+
+    def recorded_login(self, test_name: str) -> dict[str, object] | None:
+        """
+        Returns the login a test was recorded with, when replaying.
+
+        The cookies are made session cookies, since the recorded token is only ever checked against the HAR file
+        and an expired cookie would be dropped by the browser.
+
+        Args:
+            test_name (str): The node id of the test.
+
+        Returns:
+            dict[str, object] | None: The 'credentials' and 'storage_state' of the recording, None when not
+                replaying or, outside of strict replay, if the test has no recorded login.
+
+        Raises:
+            FileNotFoundError: In strict replay, if the test has no recorded login.
+        """
+        if not self.replaying:
+            return None
+        path: str = self.login_path(test_name)
+        if not os.path.exists(path):
+            if self.mode == "replay-strict":
+                raise FileNotFoundError(f"No recorded login for {test_name} ({path}), record it with --har=record")
+            return None
+        with open(path, "r") as file:
+            login: dict[str, object] = json.load(file)
+        for cookie in login["storage_state"].get("cookies", []):
+            cookie["expires"] = -1
+        return login
+
+    def install(self, context: BrowserContext, test_name: str, base_url: str) -> HarSession | None:
+        """
+        Starts recording or replaying a test's context.
+
+        Args:
+            context (BrowserContext): The test's browser context, before its first navigation.
+            test_name (str): The node id of the test.
+            base_url (str): The application's URL; requests to its origin are recorded and replayed.
+
+        Returns:
+            HarSession | None: The test's session, None when HAR mode is off.
+
+        Raises:
+            FileNotFoundError: In strict replay, if the test has no HAR file.
+        """
+        if self.mode == "off":
+            return None
+        path: str = self.har_path(test_name)
+        origin: str = "{0.scheme}://{0.netloc}".format(urlparse(base_url))
+        url: re.Pattern = re.compile(f"^{re.escape(origin)}(?:[/?#]|$)")
+        if self.mode == "record":
+            os.makedirs(self.directory, exist_ok=True)
+            # The file is written when the context closes
+            context.route_from_har(path, url=url, update=True, update_content="embed", update_mode="minimal")
+        elif not os.path.exists(path):
+            if self.mode == "replay-strict":
+                raise FileNotFoundError(f"No HAR file for {test_name} ({path}), record it with --har=record")
+            return None
+        else:
+            context.route_from_har(path, url=url, not_found="abort" if self.mode == "replay-strict" else "fallback")
+        session = HarSession(test_name, "record" if self.mode == "record" else "replay", path)
+        if self.mode == "replay-strict":
+            def unmatched(request: Request):
+                # Requests blocked by the routing policy fail with ERR_BLOCKED_BY_CLIENT, not because of the HAR
+                if url.search(request.url) and "BLOCKED_BY_CLIENT" not in (request.failure or ""):
+                    session.unmatched.append(f"{request.method} {request.url}")
+
+            context.on("requestfailed", unmatched)
+        self._active[id(context)] = session
+        self.sessions.append(session)
+        return session
+
+    def finish(self, context: BrowserContext) -> HarSession | None:
+        """
+        Ends the recording or replay of a test's context. A recording is written when the context closes.
+
+        Args:
+            context (BrowserContext): The test's browser context.
+
+        Returns:
+            HarSession | None: The test's session, None if the context wasn't recorded or replayed.
+        """
+        return self._active.pop(id(context), None)
+
+    def summary(self) -> str:
+        """
+        Builds a human-readable summary of the recorded and replayed tests.
+
+        Returns:
+            str: The summary text.
+        """
+        recorded: int = sum(session.mode == "record" for session in self.sessions)
+        replayed: list[HarSession] = [session for session in self.sessions if session.mode == "replay"]
+        unmatched: int = sum(len(session.unmatched) for session in replayed)
+        return (f"Recorded {recorded} and replayed {len(replayed)} tests with the HAR files in {self.directory}"
+                + (f", {unmatched} unmatched requests" if unmatched else ""))
+
+
+# Configured from --har by conftest.py
+har_router = HarRouter()
@@ -0,0 +1,169 @@
+import math
+
+
+class HdrHistogram:
+    """
+    A High Dynamic Range histogram of integer values, e.g. latencies in microseconds.
+
+    Values are counted in logarithmic buckets that are each split into linear sub-buckets, so every recorded value
+    is kept to `significant_digits` decimal digits over the whole range while the memory stays constant. This is a
+    pure Python port of the layout used by HdrHistogram.
+
+    Attributes:
+        lowest_trackable_value (int): The smallest value that can be told apart from 0.
+        highest_trackable_value (int): The largest value that can be recorded; larger values are clamped to it.
+        significant_digits (int): The number of significant decimal digits kept for every value.
+        total_count (int): The number of recorded values.
+        min_value (int): The smallest recorded value.
+        max_value (int): The largest recorded value.
+    """
+
+    def __init__(self, lowest_trackable_value: int = 1, highest_trackable_value: int = 3_600_000_000,
+                 significant_digits: int = 3):
+        """
+        Initializes an empty histogram.
+
+        Args:
+            lowest_trackable_value (int): The smallest value that can be told apart from 0 (at least 1).
+            highest_trackable_value (int): The largest value that can be recorded, 1 hour in microseconds by default.
+            significant_digits (int): The precision of the recorded values, between 1 and 5.
+        """
+        self.lowest_trackable_value = lowest_trackable_value
+        self.highest_trackable_value = highest_trackable_value
+        self.significant_digits = significant_digits
+
+        largest_single_unit_resolution: int = 2 * 10 ** significant_digits
+        sub_bucket_count_magnitude: int = math.ceil(math.log2(largest_single_unit_resolution))
+        self._sub_bucket_half_count_magnitude: int = max(sub_bucket_count_magnitude, 1) - 1
+        self._unit_magnitude: int = int(math.floor(math.log2(lowest_trackable_value)))
+        self._sub_bucket_count: int = 1 << (self._sub_bucket_half_count_magnitude + 1)
+        self._sub_bucket_half_count: int = self._sub_bucket_count // 2
+        self._sub_bucket_mask: int = (self._sub_bucket_count - 1) << self._unit_magnitude
+
+        smallest_untrackable_value: int = self._sub_bucket_count << self._unit_magnitude
+        bucket_count: int = 1
+        while smallest_untrackable_value <= highest_trackable_value:
+            smallest_untrackable_value <<= 1
+            bucket_count += 1
+        self._counts: list[int] = [0] * ((bucket_count + 1) * self._sub_bucket_half_count)
+
+        self.total_count: int = 0
+        self.min_value: int = 0
+        self.max_value: int = 0
+        self._total_value: int = 0
+
+    def _bucket_index(self, value: int) -> int:
+        return (value | self._sub_bucket_mask).bit_length() - self._unit_magnitude \
+            - (self._sub_bucket_half_count_magnitude + 1)
+
+    def _counts_index(self, value: int) -> int:
+        bucket_index: int = self._bucket_index(value)
+        sub_bucket_index: int = value >> (bucket_index + self._unit_magnitude)
+        return ((bucket_index + 1) << self._sub_bucket_half_count_magnitude) \
+            + sub_bucket_index - self._sub_bucket_half_count
+
+    def _value_from_index(self, index: int) -> int:
+        bucket_index: int = (index >> self._sub_bucket_half_count_magnitude) - 1
+        sub_bucket_index: int = (index & (self._sub_bucket_half_count - 1)) + self._sub_bucket_half_count
+        if bucket_index < 0:
+            sub_bucket_index -= self._sub_bucket_half_count
+            bucket_index = 0
+        return sub_bucket_index << (bucket_index + self._unit_magnitude)
+
+    def _highest_equivalent_value(self, value: int) -> int:
+        """
+        Returns the largest value that is counted in the same sub-bucket as `value`.
+
+        Args:
+            value (int): A recordable value.
+
+        Returns:
+            int: The upper end of the value's sub-bucket.
+        """
+        bucket_index: int = self._bucket_index(value)
+        sub_bucket_index: int = value >> (bucket_index + self._unit_magnitude)
+        lowest_equivalent: int = sub_bucket_index << (bucket_index + self._unit_magnitude)
+        range_bucket_index: int = bucket_index + 1 if sub_bucket_index >= self._sub_bucket_count else bucket_index
+        return lowest_equivalent + (1 << (self._unit_magnitude + range_bucket_index)) - 1
+
+    def record_value(self, value: int, count: int = 1):
+        """
+        Records a value.
+
+        Args:
+            value (int): The value, clamped to the trackable range.
+            count (int): How many times the value occurred.
+        """
+        value = min(max(int(value), 0), self.highest_trackable_value)
+        self._counts[self._counts_index(value)] += count
+        if self.total_count == 0 or value < self.min_value:
+            self.min_value = value
+        self.max_value = max(self.max_value, value)
+        self.total_count += count
+        self._total_value += value * count
+
+    def record_corrected_value(self, value: int, expected_interval: int):
+        """
+        Records a value and corrects it for coordinated omission.
+
+        A load generator that waits for a slow response before sending its next request silently skips the requests
+        it should have sent in the meantime. For every expected interval the value exceeds, this records the
+        latency such a skipped request would have seen.
+
+        Args:
+            value (int): The measured value.
+            expected_interval (int): The interval between requests the generator aimed for, 0 disables correction.
+        """
+        self.record_value(value)
+        if expected_interval <= 0:
+            return
+        missing_value: int = value - expected_interval
+        while missing_value >= expected_interval:
+            self.record_value(missing_value)
+            missing_value -= expected_interval
+
+    def add(self, other: "HdrHistogram"):
+        """
+        Adds the counts of a histogram with the same layout to this one.
+
+        Args:
+            other (HdrHistogram): The histogram to add.
+
+        Raises:
+            ValueError: If the histograms have different layouts.
+        """
+        if len(other._counts) != len(self._counts) or other._unit_magnitude != self._unit_magnitude:
+            raise ValueError("Histograms with different ranges or precision can't be added")
+        if other.total_count == 0:
+            return
+        for index, count in enumerate(other._counts):
+            if count:
+                self._counts[index] += count
+        self.min_value = other.min_value if self.total_count == 0 else min(self.min_value, other.min_value)
+        self.max_value = max(self.max_value, other.max_value)
+        self.total_count += other.total_count
+        self._total_value += other._total_value
+
+    @property
+    def mean(self) -> float:
+        return self._total_value / self.total_count if self.total_count else 0.0
+
+    def value_at_percentile(self, percentile: float) -> int:
+        """
+        Returns the value below or at which the given percentage of the recorded values fall.
+
+        Args:
+            percentile (float): The percentile between 0 and 100.
+
+        Returns:
+            int: The highest value equivalent to the percentile's value, 0 for an empty histogram.
+        """
+        if self.total_count == 0:
+            return 0
+        count_at_percentile: int = max(int(min(percentile, 100.0) / 100 * self.total_count + 0.5), 1)
+        running_count: int = 0
+        for index, count in enumerate(self._counts):
+            running_count += count
+            if running_count >= count_at_percentile:
+                return min(self._highest_equivalent_value(self._value_from_index(index)), self.max_value)
+        return self.max_value
@@ -0,0 +1,417 @@
+import asyncio
+import json
+import os
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+
+from playwright.async_api import APIRequestContext, APIResponse, async_playwright
+
+from utils.async_api import AsyncAPIClient
+from utils.histogram import HdrHistogram
+from utils.workers import unique_email
+
+# A step of a load scenario: sends one request with the virtual user's client and keeps what later steps need
+# (e.g. the contact ID) in the iteration's state
+Step = Callable[[AsyncAPIClient, dict[str, object]], Awaitable[APIResponse]]
+
+PERCENTILES: tuple[float, ...] = (50.0, 95.0, 99.0)
+
+
+async def _register(client: AsyncAPIClient, state: dict[str, object]) -> APIResponse:
+    state["email"] = unique_email("load-user@fake.com")
+    response: APIResponse = await client.post("users", {"firstName": "Load", "lastName": "User",
+                                                        "email": state["email"], "password": "myPassword"})
+    if response.ok:
+        client.set_token((await response.json()).get("token"))
+    return response
+
+
+async def _login(client: AsyncAPIClient, state: dict[str, object]) -> APIResponse:
+    response: APIResponse = await client.post("users/login", {"email": state["email"], "password": "myPassword"})
+    if response.ok:
+        client.set_token((await response.json()).get("token"))
+    return response
+
+
+async def _add_contact(client: AsyncAPIClient, state: dict[str, object]) -> APIResponse:
+    response: APIResponse = await client.post("contacts", {"firstName": "Amy", "lastName": "Miller",
+                                                           "email": "amiller@fake.com", "phone": "8005554242",
+                                                           "city": "Washington", "country": "USA"})
+    if response.ok:
+        client.set_contact_id((await response.json()).get("_id"))
+    return response
+
+
+async def _get_contact(client: AsyncAPIClient, state: dict[str, object]) -> APIResponse:
+    return await client.get(f"contacts/{client.get_contact_id()}")
+
+
+async def _update_contact(client: AsyncAPIClient, state: dict[str, object]) -> APIResponse:
+    return await client.put(f"contacts/{client.get_contact_id()}", {"firstName": "Amy", "lastName": "Miller",
+                                                                     "email": "amiller2@fake.com",
+                                                                     "country": "Canada"})
+
+
+async def _delete_contact(client: AsyncAPIClient, state: dict[str, object]) -> APIResponse:
+    return await client.delete(f"contacts/{client.get_contact_id()}")
+
+
+async def _delete_user(client: AsyncAPIClient, state: dict[str, object]) -> APIResponse:
+    return await client.delete("users/me")
+
+
+# The flow of test_api_contact_list.py as one iteration of a virtual user. The account is deleted at the end, so
+# long runs don't pile up users in the application.
+CONTACT_LIFECYCLE: list[tuple[str, Step]] = [
+    ("register", _register),
+    ("login", _login),
+    ("add_contact", _add_contact),
+    ("get_contact", _get_contact),
+    ("update_contact", _update_contact),
+    ("delete_contact", _delete_contact),
+    ("delete_user", _delete_user),
+]
+
+
+@dataclass
+class OperationStats:
+    """
+    The measurements of one step of the scenario.
+
+    Latencies are recorded in microseconds, for failed requests as well, so timeouts show up in the percentiles.
+    The histogram also holds the samples the coordinated omission correction adds for the requests a slow one held
+    back, so it is only used for the latencies; the request count, throughput and error rate come from `requests`.
+
+    Attributes:
+        name (str): The name of the step.
+        histogram (HdrHistogram): The latencies, corrected for coordinated omission.
+        requests (int): The number of requests actually sent.
+        errors (int): The number of error responses, exceptions and timeouts.
+        last_error (str): The most recent error, for the report.
+    """
+    name: str
+    histogram: HdrHistogram = field(default_factory=HdrHistogram)
+    requests: int = 0
+    errors: int = 0
+    last_error: str = ""
+
+    @property
+    def count(self) -> int:
+        return self.requests
+
+    def to_dict(self, elapsed_seconds: float) -> dict[str, object]:
+        """
+        Summarizes the step's measurements.
+
+        Args:
+            elapsed_seconds (float): The duration of the run, to compute the throughput.
+
+        Returns:
+            dict[str, object]: The request count, throughput, error rate and latencies in milliseconds.
+        """
+        return {
+            "requests": self.count,
+            "throughput_rps": round(self.count / elapsed_seconds, 2) if elapsed_seconds else 0.0,
+            "errors": self.errors,
+            "error_rate": round(self.errors / self.count, 4) if self.count else 0.0,
+            "latency_ms": _latencies(self.histogram),
+            "last_error": self.last_error,
+        }
+
+
+def _latencies(histogram: HdrHistogram) -> dict[str, float]:
+    """
+    Returns the mean, percentiles and maximum of a histogram of microseconds in milliseconds.
+
+    Args:
+        histogram (HdrHistogram): The latencies in microseconds.
+
+    Returns:
+        dict[str, float]: The 'mean', 'p50', 'p95', 'p99' and 'max' latency.
+    """
+    latencies: dict[str, float] = {"mean": round(histogram.mean / 1000, 3)}
+    for percentile in PERCENTILES:
+        latencies[f"p{percentile:g}"] = round(histogram.value_at_percentile(percentile) / 1000, 3)
+    latencies["max"] = round(histogram.max_value / 1000, 3)
+    return latencies
+
+
+@dataclass
+class LoadResult:
+    """
+    The outcome of a load run.
+
+    Attributes:
+        mode (str): 'closed' for a fixed number of virtual users, 'open' for a fixed arrival rate.
+        concurrency (int): The number of virtual users, or the maximum number of iterations in flight in open mode.
+        target_rps (float): The request rate aimed for, 0 for a closed run without pacing.
+        elapsed_seconds (float): The wall-clock duration of the run.
+        iterations (int): The number of scenario iterations started.
+        operations (dict[str, OperationStats]): The measurements of every step, in scenario order.
+    """
+    mode: str
+    concurrency: int
+    target_rps: float
+    elapsed_seconds: float = 0.0
+    iterations: int = 0
+    operations: dict[str, OperationStats] = field(default_factory=dict)
+
+    @property
+    def total(self) -> OperationStats:
+        """
+        Merges the measurements of every step.
+
+        Returns:
+            OperationStats: The measurements of all requests of the run.
+        """
+        total = OperationStats("total")
+        for stats in self.operations.values():
+            total.histogram.add(stats.histogram)
+            total.requests += stats.requests
+            total.errors += stats.errors
+            total.last_error = stats.last_error or total.last_error
+        return total
+
+    def to_dict(self) -> dict[str, object]:
+        """
+        Builds the JSON report of the run.
+
+        Returns:
+            dict[str, object]: The run settings, the totals and the summary of every step.
+        """
+        return {
+            "mode": self.mode,
+            "concurrency": self.concurrency,
+            "target_rps": self.target_rps,
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "iterations": self.iterations,
+            "total": self.total.to_dict(self.elapsed_seconds),
+            "operations": {name: stats.to_dict(self.elapsed_seconds) for name, stats in self.operations.items()},
+        }
+
+    def write_json(self, path: str):
+        """
+        Writes the JSON report of the run.
+
+        Args:
+            path (str): The file to write, its directory is created if needed.
+        """
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as file:
+            json.dump(self.to_dict(), file, indent=2)
+
+    def __str__(self) -> str:
+        target: str = f", target {self.target_rps:g} req/s" if self.target_rps else ""
+        lines: list[str] = [f"{self.mode}-loop, {self.concurrency} in flight{target}, {self.iterations} iterations "
+                            f"in {self.elapsed_seconds:.1f}s"]
+        for stats in [*self.operations.values(), self.total]:
+            summary: dict[str, object] = stats.to_dict(self.elapsed_seconds)
+            latency: dict[str, float] = summary["latency_ms"]
+            lines.append(f"  {stats.name:<15} {summary['requests']:>7} req {summary['throughput_rps']:>9.1f} req/s "
+                         f"{summary['error_rate']:>7.2%} err  p50 {latency['p50']:>8.1f}ms  "
+                         f"p95 {latency['p95']:>8.1f}ms  p99 {latency['p99']:>8.1f}ms")
+        return "\n".join(lines)
+
+
+class LoadGenerator:
+    """
+    Replays a scenario of API calls against the application with many virtual users.
+
+    Every virtual user has its own AsyncAPIClient (and so its own token and contact ID) on a shared request context
+    and runs the steps of the scenario in order. A step that fails ends the iteration, since later steps depend on
+    it; the account is still deleted.
+
+    Closed loop (`run_closed`) keeps `concurrency` users busy. With a target rate every user paces its requests
+    and a request that takes longer than its interval is recorded together with the requests it held back
+    (coordinated omission correction). Open loop (`run_open`) starts iterations at a fixed rate regardless of
+    the response times, and a request is timed from when it was due, so queueing in the generator is counted too.
+    """
+
+    def __init__(self, request_context: APIRequestContext, base_url: str,
+                 scenario: list[tuple[str, Step]] = CONTACT_LIFECYCLE, timeout: float = 30.0):
+        """
+        Initializes the LoadGenerator.
+
+        Args:
+            request_context (APIRequestContext): The async Playwright API request context shared by the users.
+            base_url (str): The base URL for API requests.
+            scenario (list[tuple[str, Step]]): The named steps of one iteration.
+            timeout (float): Seconds each request may take before it counts as an error.
+        """
+        self.request = request_context
+        self.base_url = base_url
+        self.scenario = scenario
+        self.timeout = timeout
+
+    async def _call(self, stats: OperationStats, step: Step, client: AsyncAPIClient, state: dict[str, object],
+                    start: float, expected_interval: int) -> bool:
+        """
+        Sends the request of one step and records its latency and outcome.
+
+        Args:
+            stats (OperationStats): The step's measurements.
+            step (Step): The step.
+            client (AsyncAPIClient): The virtual user's client.
+            state (dict[str, object]): The iteration's state.
+            start (float): The `perf_counter` time the latency is measured from.
+            expected_interval (int): The pacing interval in microseconds, 0 without pacing.
+
+        Returns:
+            bool: True if the request succeeded.
+        """
+        error: str = ""
+        try:
+            response: APIResponse = await asyncio.wait_for(step(client, state), self.timeout)
+            if not response.ok:
+                error = f"Status {response.status}: {await response.text()}"
+        except asyncio.TimeoutError:
+            error = f"Timed out after {self.timeout}s"
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        stats.histogram.record_corrected_value(int((time.perf_counter() - start) * 1_000_000), expected_interval)
+        stats.requests += 1
+        if error:
+            stats.errors += 1
+            stats.last_error = error[:500]
+        return not error
+
+    async def _iteration(self, result: LoadResult, due: float, interval: float = 0.0) -> float:
+        """
+        Runs the scenario once as a new virtual user.
+
+        Args:
+            result (LoadResult): The run the measurements are added to.
+            due (float): The `perf_counter` time the first request is due. Without pacing its latency is measured
+                from this time, so a late start counts as latency.
+            interval (float): Seconds between the user's requests in a paced closed loop, 0 to send them back to
+                back.
+
+        Returns:
+            float: The time the user's next request is due.
+        """
+        client = AsyncAPIClient(self.request, self.base_url)
+        state: dict[str, object] = {}
+        completed: bool = False
+        result.iterations += 1
+        try:
+            for index, (name, step) in enumerate(self.scenario):
+                if interval:
+                    await asyncio.sleep(max(due - time.perf_counter(), 0))
+                start: float = due if index == 0 and not interval else time.perf_counter()
+                if not await self._call(result.operations[name], step, client, state, start,
+                                        int(interval * 1_000_000)):
+                    break
+                # A user that fell behind its pace doesn't catch up in a burst, the correction accounts for the gap
+                due = max(due + interval, time.perf_counter())
+            else:
+                completed = True
+        finally:
+            if client.token and not completed:
+                # Don't leave the account of an aborted iteration behind
+                try:
+                    await asyncio.wait_for(client.delete("users/me"), self.timeout)
+                except Exception:
+                    pass
+        return due
+
+    def _new_result(self, mode: str, concurrency: int, target_rps: float) -> LoadResult:
+        return LoadResult(mode, concurrency, target_rps,
+                          operations={name: OperationStats(name) for name, _ in self.scenario})
+
+    async def run_closed(self, concurrency: int, duration: float, target_rps: float = 0.0) -> LoadResult:
+        """
+        Keeps `concurrency` virtual users running the scenario back to back for `duration` seconds.
+
+        Args:
+            concurrency (int): The number of virtual users.
+            duration (float): Seconds after which no new iteration is started.
+            target_rps (float): The request rate of all users together, 0 to send requests as fast as the
+                responses come back.
+
+        Returns:
+            LoadResult: The measurements of the run.
+        """
+        result: LoadResult = self._new_result("closed", concurrency, target_rps)
+        # Every user sends one request per interval, so all of them together send target_rps requests per second
+        interval: float = concurrency / target_rps if target_rps else 0.0
+        start: float = time.perf_counter()
+
+        async def user(offset: float):
+            # Paced users start spread over one interval instead of all at once
+            due: float = start + offset
+            while time.perf_counter() - start < duration:
+                due = await self._iteration(result, due if interval else time.perf_counter(), interval)
+
+        await asyncio.gather(*(user(index * interval / concurrency) for index in range(concurrency)))
+        result.elapsed_seconds = time.perf_counter() - start
+        return result
+
+    async def run_open(self, target_rps: float, duration: float, max_in_flight: int = 1000) -> LoadResult:
+        """
+        Starts iterations at a fixed rate for `duration` seconds, whether or not earlier ones have finished.
+
+        Args:
+            target_rps (float): The request rate to aim for; iterations start at this rate divided by the number of
+                steps.
+            duration (float): Seconds during which iterations are started.
+            max_in_flight (int): The maximum number of iterations running at once. Iterations beyond it wait, and
+                the wait is counted in their first request's latency.
+
+        Returns:
+            LoadResult: The measurements of the run.
+        """
+        result: LoadResult = self._new_result("open", max_in_flight, target_rps)
+        arrival_interval: float = len(self.scenario) / target_rps
+        semaphore = asyncio.Semaphore(max_in_flight)
+        start: float = time.perf_counter()
+
+        async def arrival(due: float):
+            async with semaphore:
+                await self._iteration(result, due)
+
+        tasks: list[asyncio.Task] = []
+        due: float = start
+        while due - start < duration:
+            await asyncio.sleep(max(due - time.perf_counter(), 0))
+            tasks.append(asyncio.create_task(arrival(due)))
+            due += arrival_interval
+        await asyncio.gather(*tasks)
+        result.elapsed_seconds = time.perf_counter() - start
+        return result
+
+
+async def run_load(base_url: str, duration: float, concurrency: int = 0, target_rps: float = 0.0,
+                   scenario: list[tuple[str, Step]] = CONTACT_LIFECYCLE) -> LoadResult:
+    """
+    Starts an async Playwright instance and runs a load test against the application.
+
+    Args:
+        base_url (str): The base URL for API requests.
+        duration (float): Seconds the load is generated for.
+        concurrency (int): The number of virtual users of a closed loop, 0 for an open loop.
+        target_rps (float): The request rate of an open loop, or the pacing of a closed loop (0 for none).
+        scenario (list[tuple[str, Step]]): The named steps of one iteration.
+
+    Returns:
+        LoadResult: The measurements of the run.
+
+    Raises:
+        ValueError: If neither a concurrency nor a target rate is given.
+    """
+    if not concurrency and not target_rps:
+        raise ValueError("A load run needs a concurrency, a target rate or both")
+    async with async_playwright() as playwright:
+        request_context: APIRequestContext = await playwright.request.new_context()
+        generator = LoadGenerator(request_context, base_url, scenario)
+        try:
+            if concurrency:
+                return await generator.run_closed(concurrency, duration, target_rps)
+            return await generator.run_open(target_rps, duration)
+        finally:
+            await request_context.dispose()
+
+
+# Results of every load test of the process, printed by conftest.py at the end of the run
+load_results: list[LoadResult] = []
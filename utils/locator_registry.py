@@ -0,0 +1,192 @@
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterator
+
+from playwright.sync_api import Page, Locator, Frame
+
+
+@dataclass
+class SelectorStats:
+    """
+    The cost of the actions on one selector over the whole run.
+
+    Attributes:
+        selector (str): The selector.
+        actions (int): The number of actions (fill, click, ...).
+        action_seconds (float): Time spent in the actions, including resolving the selector and auto-waiting.
+        probes (int): The number of actions whose resolution was measured separately.
+        resolve_seconds (float): Time the measured resolutions took.
+    """
+    selector: str
+    actions: int = 0
+    action_seconds: float = 0.0
+    probes: int = 0
+    resolve_seconds: float = 0.0
+
+    @property
+    def wait_seconds(self) -> float:
+        """
+        The estimated auto-wait and action time: the action time minus the average resolution time.
+        """
+        if not self.probes:
+            return self.action_seconds
+        return max(self.action_seconds - self.resolve_seconds / self.probes * self.actions, 0.0)
+
+
+class LocatorProfiler:
+    """
+    Records the time the page object actions spend per selector.
+
+    The time of every action is always recorded. With `probe_resolution` the selector is also resolved on its own
+    right before the action (`Locator.count`, which doesn't wait), which splits the time into resolution and
+    auto-wait but costs an extra round trip per action, so it is only meant for profiling runs.
+
+    Attributes:
+        probe_resolution (bool): Whether resolution is measured separately before every action.
+        selectors (dict[str, SelectorStats]): The statistics per selector.
+    """
+
+    def __init__(self, probe_resolution: bool = False):
+        """
+        Initializes the LocatorProfiler.
+
+        Args:
+            probe_resolution (bool): Whether resolution is measured separately before every action.
+        """
+        self.probe_resolution = probe_resolution
+        self.selectors: dict[str, SelectorStats] = {}
+
+    @contextmanager
+    def action(self, selector: str, locator: Locator) -> Iterator[None]:
+        """
+        Times the wrapped action on a selector.
+
+        Args:
+            selector (str): The selector, as written in the locator classes.
+            locator (Locator): The locator the action runs on.
+        """
+        stats: SelectorStats = self.selectors.setdefault(selector, SelectorStats(selector))
+        if self.probe_resolution:
+            start: float = time.perf_counter()
+            locator.count()
+            stats.resolve_seconds += time.perf_counter() - start
+            stats.probes += 1
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            stats.action_seconds += time.perf_counter() - start
+            stats.actions += 1
+
+    def summary(self, limit: int = 10) -> str:
+        """
+        Builds a report of the selectors with the most action time.
+
+        Args:
+            limit (int): The maximum number of selectors listed.
+
+        Returns:
+            str: One line per selector.
+        """
+        slowest: list[SelectorStats] = sorted(self.selectors.values(), key=lambda stats: stats.action_seconds,
+                                              reverse=True)[:limit]
+        lines: list[str] = []
+        for stats in slowest:
+            line: str = (f"{stats.actions:>5} actions {stats.action_seconds / stats.actions * 1000:>8.1f}ms avg "
+                         f"{stats.action_seconds:>7.2f}s total")
+            if stats.probes:
+                line += (f", resolve {stats.resolve_seconds / stats.probes * 1000:.1f}ms, "
+                         f"auto-wait {stats.wait_seconds / stats.actions * 1000:.1f}ms")
+            lines.append(f"{line}  {stats.selector}")
+        return "\n".join(lines)
+
+
+class LocatorRegistry:
+    """
+    The Locator objects of one page, created once per selector instead of on every action.
+
+    Locators are lazy, they are resolved again by every action, so a cached Locator stays correct across renders.
+    The registry is still cleared when the page's main frame navigates, so the cache only holds the selectors of the
+    current page.
+
+    Attributes:
+        page (Page): The page the locators belong to.
+        invalidations (int): How often the page's main frame navigated, clearing the registry.
+    """
+
+    def __init__(self, page: Page):
+        """
+        Initializes the LocatorRegistry and starts clearing it on navigation.
+
+        Args:
+            page (Page): The page the locators belong to.
+        """
+        self.page = page
+        self._locators: dict[tuple[str, int | None], Locator] = {}
+        self.invalidations: int = 0
+        page.on("framenavigated", self._on_navigation)
+
+    def _on_navigation(self, frame: Frame):
+        if frame == self.page.main_frame:
+            self._locators.clear()
+            self.invalidations += 1
+
+    def get(self, selector: str, index: int | None = None) -> Locator:
+        """
+        Returns the Locator of a selector, or of the element at an index among its matches.
+
+        Args:
+            selector (str): The CSS or XPath selector.
+            index (int | None): The 0-based index of the element, None for the selector itself.
+
+        Returns:
+            Locator: The cached Locator.
+        """
+        key: tuple[str, int | None] = (selector, index)
+        locator: Locator | None = self._locators.get(key)
+        if locator is None:
+            locator = self.page.locator(selector) if index is None else self.get(selector).nth(index)
+            self._locators[key] = locator
+        return locator
+
+    def compile(self, *locator_classes: type):
+        """
+        Creates the Locators of every selector of the locator classes up front.
+
+        Args:
+            *locator_classes (type): Classes like HomePageLocators, whose string attributes (and dicts of strings,
+                like the form selectors) are selectors.
+        """
+        for locator_class in locator_classes:
+            for name, value in vars(locator_class).items():
+                if name.startswith("_"):
+                    continue
+                for selector in value.values() if isinstance(value, dict) else [value]:
+                    if isinstance(selector, str):
+                        self.get(selector)
+
+
+# By id of the page, removed when the page closes
+_registries: dict[int, LocatorRegistry] = {}
+
+
+def locator_registry(page: Page) -> LocatorRegistry:
+    """
+    Returns the registry of a page, shared by all page objects created for it.
+
+    Args:
+        page (Page): The page.
+
+    Returns:
+        LocatorRegistry: The page's registry.
+    """
+    registry: LocatorRegistry | None = _registries.get(id(page))
+    if registry is None:
+        registry = _registries[id(page)] = LocatorRegistry(page)
+        page.once("close", lambda _: _registries.pop(id(page), None))
+    return registry
+
+
+# Shared by every page object of the process; conftest.py enables the resolution probes with --locator-profile
+locator_profiler = LocatorProfiler()
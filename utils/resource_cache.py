@@ -0,0 +1,192 @@
+import json
+import os
+import time
+from dataclasses import dataclass
+
+import json5
+
+# Bumped when the sidecar layout changes, so sidecars written by an older version are re-compiled
+CACHE_FORMAT: int = 1
+
+# Directory next to every resource file holding its compiled sidecars, like __pycache__ for modules
+CACHE_DIR: str = "__jsoncache__"
+
+
+@dataclass
+class LoadRecord:
+    """
+    How a resource file was loaded.
+
+    Attributes:
+        path (str): The resource file.
+        source (str): 'memo' (already loaded by this process), 'sidecar' (compiled by an earlier process) or
+            'parse' (parsed with json5).
+        seconds (float): How long loading took.
+        parse_seconds (float): How long parsing the file with json5 took when it was last compiled.
+    """
+    path: str
+    source: str
+    seconds: float
+    parse_seconds: float
+
+
+class ResourceCache:
+    """
+    Loads JSON5 resource files, parsing each version of a file only once across processes.
+
+    json5 is a pure-Python parser, and the data files are loaded at import time by `@pytest.mark.parametrize`
+    decorators in several test modules and by every xdist worker. The first load of a file compiles it to plain JSON
+    in a sidecar file (`__jsoncache__/<name>.json` next to it), which later processes read with the C JSON parser.
+    Within a process the compiled JSON is also kept in memory. Both are keyed by the file's modification time and
+    size, so an edited file is parsed again.
+
+    Every load returns new objects, since tests may modify the data they are given.
+
+    Attributes:
+        enabled (bool): Whether compiled files are used, False to parse every load.
+        records (list[LoadRecord]): Every load of the process.
+    """
+
+    def __init__(self, enabled: bool = True):
+        """
+        Initializes the ResourceCache.
+
+        Args:
+            enabled (bool): Whether compiled files are used, False to parse every load.
+        """
+        self.enabled = enabled
+        self.records: list[LoadRecord] = []
+        self._memo: dict[str, tuple[tuple[int, int], str, float]] = {}
+
+    @staticmethod
+    def sidecar_path(filepath: str) -> str:
+        """
+        Returns the path of a resource file's compiled sidecar.
+
+        Args:
+            filepath (str): The resource file.
+
+        Returns:
+            str: The sidecar's path.
+
+        Example:
+            >>> ResourceCache.sidecar_path("resources/login_data.jsonc")
+            'resources/__jsoncache__/login_data.jsonc.json'
+        """
+        directory, name = os.path.split(filepath)
+        return os.path.join(directory, CACHE_DIR, f"{name}.json")
+
+    @staticmethod
+    def _read_sidecar(path: str, key: tuple[int, int]) -> tuple[str, float] | None:
+        """
+        Reads a sidecar, if it was compiled from the current version of its resource file.
+
+        Args:
+            path (str): The sidecar.
+            key (tuple[int, int]): The resource file's modification time in nanoseconds and size.
+
+        Returns:
+            tuple[str, float] | None: The compiled JSON and the time parsing the file took, None if the sidecar is
+                missing, stale or unreadable.
+        """
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                header: dict[str, object] = json.loads(file.readline())
+                if header.get("format") != CACHE_FORMAT or header.get("key") != list(key):
+                    return None
+                return file.read(), float(header["parse_seconds"])
+        except (OSError, ValueError, KeyError, AttributeError):
+            return None
+
+    @staticmethod
+    def _write_sidecar(path: str, key: tuple[int, int], compiled: str, parse_seconds: float):
+        """
+        Writes a sidecar atomically, so a concurrent worker never reads half of it. Failures are ignored, the file
+        is then just parsed again next time.
+
+        Args:
+            path (str): The sidecar.
+            key (tuple[int, int]): The resource file's modification time in nanoseconds and size.
+            compiled (str): The file's data as JSON.
+            parse_seconds (float): How long parsing the file took.
+        """
+        temporary: str = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(temporary, "w", encoding="utf-8") as file:
+                file.write(json.dumps({"format": CACHE_FORMAT, "key": list(key), "parse_seconds": parse_seconds}))
+                file.write("\n")
+                file.write(compiled)
+            os.replace(temporary, path)
+        except OSError:
+            try:
+                os.remove(temporary)
+            except OSError:
+                pass
+
+    def load(self, filepath: str) -> object:
+        """
+        Loads a JSON5 file from the memo, its sidecar or by parsing it.
+
+        Args:
+            filepath (str): The path to the JSON5 file.
+
+        Returns:
+            object: The file's data, new objects on every call.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            ValueError: If the file is not valid JSON5.
+        """
+        start: float = time.perf_counter()
+        stat: os.stat_result = os.stat(filepath)
+        key: tuple[int, int] = (stat.st_mtime_ns, stat.st_size)
+        path: str = os.path.abspath(filepath)
+        source: str = "memo"
+        memo: tuple[tuple[int, int], str, float] | None = self._memo.get(path) if self.enabled else None
+        if memo is None or memo[0] != key:
+            sidecar: str = self.sidecar_path(path)
+            cached: tuple[str, float] | None = self._read_sidecar(sidecar, key) if self.enabled else None
+            if cached is not None:
+                source = "sidecar"
+                compiled, parse_seconds = cached
+            else:
+                source = "parse"
+                with open(filepath, "r", encoding="utf-8") as file:
+                    data: object = json5.load(file)
+                parse_seconds = time.perf_counter() - start
+                compiled = json.dumps(data, ensure_ascii=False)
+                if self.enabled:
+                    self._write_sidecar(sidecar, key, compiled, parse_seconds)
+            memo = (key, compiled, parse_seconds)
+            if self.enabled:
+                self._memo[path] = memo
+        result: object = json.loads(memo[1])
+        self.records.append(LoadRecord(filepath, source, time.perf_counter() - start, memo[2]))
+        return result
+
+    @property
+    def saved_seconds(self) -> float:
+        """
+        The parsing time the compiled files saved, the parse time of every cached load minus its load time.
+        """
+        return sum(max(record.parse_seconds - record.seconds, 0.0) for record in self.records
+                   if record.source != "parse")
+
+    def summary(self) -> str:
+        """
+        Builds a human-readable summary of how the resource files were loaded.
+
+        Returns:
+            str: The summary text.
+        """
+        counts: dict[str, int] = {source: sum(record.source == source for record in self.records)
+                                  for source in ("parse", "sidecar", "memo")}
+        seconds: float = sum(record.seconds for record in self.records)
+        return (f"Loaded {len(self.records)} resource files in {seconds * 1000:.1f}ms "
+                f"({counts['parse']} parsed, {counts['sidecar']} from sidecars, {counts['memo']} from memory), "
+                f"saved {self.saved_seconds * 1000:.1f}ms of parsing")
+
+
+# Shared by every get_json call of the process
+resource_cache = ResourceCache(enabled=os.environ.get("RESOURCE_CACHE", "1") != "0")
@@ -0,0 +1,269 @@
+import re
+import time
+from dataclasses import dataclass, field
+from urllib.parse import urlparse
+
+from playwright.sync_api import BrowserContext, Request, Route
+
+# A transparent 1x1 GIF, served instead of blocked images so the page sees them load
+BLANK_GIF: bytes = bytes.fromhex("47494638396101000100800000000000ffffff21f90401000000002c"
+                                 "00000000010001000002024401003b")
+
+# Asset URLs by resource type. Only matching URLs are routed, every other request goes straight to the network
+# without a round trip to Python.
+ASSET_PATTERNS: dict[str, str] = {
+    "image": r"\.(?:png|jpe?g|gif|svg|webp|avif|ico|bmp)(?:[?#]|$)",
+    "font": r"\.(?:woff2?|ttf|otf|eot)(?:[?#]|$)",
+    "media": r"\.(?:mp4|webm|ogg|mp3|wav|m4a)(?:[?#]|$)",
+}
+
+# Hosts of analytics, tag managers and ads, which never take part in an assertion
+TRACKER_HOSTS: tuple[str, ...] = (
+    "google-analytics.com", "googletagmanager.com", "doubleclick.net", "googlesyndication.com", "hotjar.com",
+    "segment.io", "segment.com", "mixpanel.com", "facebook.net", "clarity.ms", "newrelic.com", "nr-data.net",
+)
+
+
+@dataclass(frozen=True)
+class RoutingPolicy:
+    """
+    The requests a test context doesn't let through to the network.
+
+    Attributes:
+        name (str): The policy name used on the command line.
+        stub_types (frozenset[str]): Resource types answered with a placeholder (images get a blank GIF).
+        abort_types (frozenset[str]): Resource types whose requests fail.
+        block_trackers (bool): Whether requests to TRACKER_HOSTS are answered with an empty response.
+    """
+    name: str
+    stub_types: frozenset[str] = frozenset()
+    abort_types: frozenset[str] = frozenset()
+    block_trackers: bool = False
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.stub_types or self.abort_types or self.block_trackers)
+
+    def url_pattern(self) -> re.Pattern | None:
+        """
+        Compiles the pattern of the URLs the policy routes.
+
+        Returns:
+            re.Pattern | None: The pattern, None if the policy lets everything through.
+        """
+        parts: list[str] = [ASSET_PATTERNS[resource_type] for resource_type in sorted(self.stub_types
+                                                                                      | self.abort_types)
+                            if resource_type in ASSET_PATTERNS]
+        if self.block_trackers:
+            parts.append(r"^[a-z]+://(?:[^/?#]*\.)?(?:" + "|".join(re.escape(host) for host in TRACKER_HOSTS)
+                         + r")(?:[:/?#]|$)")
+        return re.compile("|".join(parts), re.IGNORECASE) if parts else None
+
+
+ROUTING_POLICIES: dict[str, RoutingPolicy] = {
+    # Full fidelity: every request reaches the network
+    "off": RoutingPolicy("off"),
+    # What the assertions need: documents, scripts, styles and API calls
+    "lean": RoutingPolicy("lean", stub_types=frozenset({"image"}), abort_types=frozenset({"font", "media"}),
+                          block_trackers=True),
+}
+
+# How long measuring a blocked asset may hold its request up, in milliseconds
+MEASURE_TIMEOUT_MS: float = 10_000
+
+# Every URL some policy routes, whose cost is measured when it is loaded in full
+ROUTABLE_URLS: re.Pattern = RoutingPolicy("all", stub_types=frozenset(ASSET_PATTERNS),
+                                          block_trackers=True).url_pattern()
+
+
+def is_tracker(url: str) -> bool:
+    """
+    Checks whether a URL belongs to one of the TRACKER_HOSTS or their subdomains.
+
+    Args:
+        url (str): The request URL.
+
+    Returns:
+        bool: True for analytics, tag manager and ad requests.
+
+    Example:
+        >>> is_tracker("https://www.google-analytics.com/g/collect?v=2")
+        True
+    """
+    host: str = urlparse(url).hostname or ""
+    return any(host == tracker or host.endswith(f".{tracker}") for tracker in TRACKER_HOSTS)
+
+
+@dataclass
+class RoutingStats:
+    """
+    The requests one test didn't send.
+
+    Attributes:
+        test_name (str): The node id of the test.
+        blocked (int): The number of requests stubbed or aborted.
+        saved_bytes (int): The response bytes those requests take when they are loaded.
+        saved_ms (float): The milliseconds those requests take when they are loaded.
+        unknown (int): Blocked requests whose cost couldn't be measured.
+        by_type (dict[str, int]): The blocked requests per resource type.
+    """
+    test_name: str
+    blocked: int = 0
+    saved_bytes: int = 0
+    saved_ms: float = 0.0
+    unknown: int = 0
+    by_type: dict[str, int] = field(default_factory=dict)
+
+    def __str__(self) -> str:
+        types: str = ", ".join(f"{count} {resource_type}" for resource_type, count in sorted(self.by_type.items()))
+        return (f"Blocked {self.blocked} requests ({types or 'none'}), saved {self.saved_bytes / 1024:.1f} KiB and "
+                f"{self.saved_ms:.0f}ms" + (f", {self.unknown} of unknown cost" if self.unknown else ""))
+
+
+class RequestRouter:
+    """
+    Applies a routing policy to the browser contexts of the tests and reports what it saved.
+
+    Blocked requests cost nothing, so what they would have cost is measured the first time the process blocks a
+    URL: the request is fetched once from the route, timed and its body size kept, before it is stubbed or aborted.
+    A URL loaded in full by a test that opted out is measured with the request's sizes and timing instead. Either
+    way, every later block of the URL reuses the cost, so each asset is downloaded at most once per process.
+
+    Attributes:
+        policy (RoutingPolicy): The policy applied to every context.
+        measure_blocked (bool): Whether blocked URLs of unknown cost are fetched once to measure them. Off when the
+            tests must not reach the network, e.g. in a HAR replay.
+        stats (list[RoutingStats]): The stats of every routed test.
+    """
+
+    def __init__(self, policy: RoutingPolicy = ROUTING_POLICIES["off"]):
+        """
+        Initializes the RequestRouter.
+
+        Args:
+            policy (RoutingPolicy): The policy applied to every context.
+        """
+        self.policy = policy
+        self.measure_blocked: bool = True
+        self.stats: list[RoutingStats] = []
+        self._costs: dict[str, tuple[int, float] | None] = {}
+        self._routed: dict[int, RoutingStats] = {}
+
+    def install(self, context: BrowserContext, test_name: str, full_fidelity: bool = False):
+        """
+        Routes a test's context according to the policy, or measures its assets if it needs full fidelity.
+
+        Args:
+            context (BrowserContext): The test's browser context, before its first navigation.
+            test_name (str): The node id of the test.
+            full_fidelity (bool): Whether the test opted out, so every request reaches the network.
+        """
+        if not self.policy.enabled:
+            return
+        if full_fidelity:
+            context.on("requestfinished", self._learn)
+            return
+        stats = RoutingStats(test_name)
+        self._routed[id(context)] = stats
+        context.route(self.policy.url_pattern(), lambda route: self._handle(route, stats))
+
+    def _learn(self, request: Request):
+        """
+        Remembers the cost of an asset loaded in full.
+
+        Args:
+            request (Request): The finished request.
+        """
+        if not ROUTABLE_URLS.search(request.url):
+            return
+        try:
+            size: int = request.sizes()["responseBodySize"]
+        except Exception:
+            return  # The context closed first
+        timing: dict[str, float] = request.timing
+        self._costs[request.url] = (size, max(timing["responseEnd"], 0.0))
+
+    def _measure(self, route: Route) -> tuple[int, float] | None:
+        """
+        Returns the cost of a blocked request, fetching it the first time its URL is blocked.
+
+        Args:
+            route (Route): The intercepted route, before it is stubbed or aborted.
+
+        Returns:
+            tuple[int, float] | None: The response bytes and milliseconds, None if they are unknown.
+        """
+        url: str = route.request.url
+        if url not in self._costs and self.measure_blocked:
+            start: float = time.perf_counter()
+            try:
+                body: bytes = route.fetch(timeout=MEASURE_TIMEOUT_MS).body()
+            except Exception:
+                self._costs[url] = None  # Unreachable, not tried again
+            else:
+                self._costs[url] = (len(body), (time.perf_counter() - start) * 1000)
+        return self._costs.get(url)
+
+    def _handle(self, route: Route, stats: RoutingStats):
+        """
+        Stubs or aborts a routed request, letting through assets that only matched by their URL.
+
+        Args:
+            route (Route): The intercepted route.
+            stats (RoutingStats): The stats of the test.
+        """
+        request: Request = route.request
+        resource_type: str = request.resource_type
+        tracker: bool = self.policy.block_trackers and is_tracker(request.url)
+        if not tracker and resource_type not in self.policy.stub_types | self.policy.abort_types:
+            route.fallback()
+            return
+        cost: tuple[int, float] | None = self._measure(route)
+        if tracker:
+            route.fulfill(status=204, body=b"")
+            resource_type = "tracker"
+        elif resource_type in self.policy.stub_types:
+            route.fulfill(status=200, content_type="image/gif", body=BLANK_GIF)
+        else:
+            route.abort("blockedbyclient")
+        stats.blocked += 1
+        stats.by_type[resource_type] = stats.by_type.get(resource_type, 0) + 1
+        if cost is None:
+            stats.unknown += 1
+        else:
+            stats.saved_bytes += cost[0]
+            stats.saved_ms += cost[1]
+
+    def finish(self, context: BrowserContext) -> RoutingStats | None:
+        """
+        Ends the routing of a test's context.
+
+        Args:
+            context (BrowserContext): The test's browser context.
+
+        Returns:
+            RoutingStats | None: The test's stats, None if the context wasn't routed.
+        """
+        stats: RoutingStats | None = self._routed.pop(id(context), None)
+        if stats is not None:
+            self.stats.append(stats)
+        return stats
+
+    def summary(self) -> str:
+        """
+        Builds a human-readable summary of the requests blocked in the run.
+
+        Returns:
+            str: The summary text.
+        """
+        blocked: int = sum(stats.blocked for stats in self.stats)
+        saved_bytes: int = sum(stats.saved_bytes for stats in self.stats)
+        saved_ms: float = sum(stats.saved_ms for stats in self.stats)
+        unknown: int = sum(stats.unknown for stats in self.stats)
+        return (f"Policy '{self.policy.name}' blocked {blocked} requests in {len(self.stats)} tests, saved "
+                f"{saved_bytes / 2 ** 20:.2f} MiB and {saved_ms / 1000:.2f}s of loading"
+                + (f" ({unknown} requests of unknown cost)" if unknown else ""))
+
+
+# Configured from --routing by conftest.py
+request_router = RequestRouter()
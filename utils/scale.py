@@ -0,0 +1,150 @@
+import time
+from dataclasses import dataclass
+
+from playwright.sync_api import Page, CDPSession
+
+from utils.async_api import BatchResult, async_api_client
+from utils.schemas import CONTACT, SchemaReport
+from utils.workers import unique_email
+
+
+def contact_payloads(count: int) -> list[dict[str, object]]:
+    """
+    Generates distinct, valid contacts for large-dataset runs.
+
+    Args:
+        count (int): The number of contacts.
+
+    Returns:
+        list[dict[str, object]]: The contact payloads, each with a unique email 'scale<index>@fake.com'.
+    """
+    return [{"firstName": f"Scale{index:06d}", "lastName": "Contact", "email": f"scale{index}@fake.com",
+             "phone": f"800{index:07d}", "city": "Anytown", "country": "USA"} for index in range(count)]
+
+
+async def seed_scale_account(base_url: str, count: int, concurrency: int = 200) -> dict[str, object]:
+    """
+    Registers a new account and adds `count` generated contacts to it through concurrent API requests. The contact
+    list is then read once and every contact validated against the CONTACT schema in one pass.
+
+    Args:
+        base_url (str): The base URL for API requests.
+        count (int): The number of contacts to add.
+        concurrency (int): The maximum number of requests in flight.
+
+    Returns:
+        dict[str, object]: The 'email', 'password' and 'token' of the account and the 'seed_seconds' the contacts
+            took to add.
+
+    Raises:
+        Exception: If the account can't be registered, any contact can't be added or the listed contacts violate the
+            CONTACT schema.
+    """
+    account: dict[str, object] = {"firstName": "Scale", "lastName": "User",
+                                  "email": unique_email("scale-user@fake.com"), "password": "myPassword"}
+    async with async_api_client(base_url) as client:
+        response = await client.post("users", account)
+        if not response.ok:
+            raise Exception(f"Error registering the scale account {account['email']}: {await response.text()}")
+        client.set_token((await response.json()).get("token"))
+        batch: BatchResult = await client.add_contacts(contact_payloads(count), concurrency, timeout=60.0)
+        if not batch.ok:
+            await client.delete("users/me")
+        batch.raise_for_failures(f"seed {count} contacts")
+        report: SchemaReport = CONTACT.check(await (await client.get("contacts")).json())
+        if not report.ok:
+            await client.delete("users/me")
+            raise Exception(f"The seeded contacts are invalid:\n{report}")
+        return {"email": account["email"], "password": account["password"], "token": client.token,
+                "seed_seconds": batch.elapsed_seconds}
+
+
+async def delete_account(base_url: str, token: str):
+    """
+    Deletes the account the token belongs to, together with its contacts.
+
+    Args:
+        base_url (str): The base URL for API requests.
+        token (str): The account's token.
+    """
+    async with async_api_client(base_url, token) as client:
+        await client.delete("users/me")
+
+
+def browser_memory(page: Page) -> dict[str, float]:
+    """
+    Reads the page's memory metrics through the Chrome DevTools Protocol.
+
+    Args:
+        page (Page): A page of a Chromium browser.
+
+    Returns:
+        dict[str, float]: The 'JSHeapUsedSize' and 'JSHeapTotalSize' in bytes and the number of DOM 'Nodes'.
+    """
+    session: CDPSession = page.context.new_cdp_session(page)
+    try:
+        session.send("HeapProfiler.collectGarbage")
+        session.send("Performance.enable")
+        metrics: list[dict[str, object]] = session.send("Performance.getMetrics")["metrics"]
+    finally:
+        session.detach()
+    values: dict[str, float] = {metric["name"]: metric["value"] for metric in metrics}
+    return {name: values.get(name, 0.0) for name in ("JSHeapUsedSize", "JSHeapTotalSize", "Nodes")}
+
+
+@dataclass
+class ScaleMetrics:
+    """
+    The measurements of one large-dataset run of the contact list.
+
+    Attributes:
+        contact_count (int): The number of contacts of the account.
+        seed_seconds (float): Time spent adding the contacts through the API.
+        render_seconds (float): Time from opening the contact list until every row was rendered.
+        scan_seconds (float): Time to find a contact by scraping all rows with `all_inner_texts()` and scanning them.
+        locate_seconds (float): Time to find the same contact with a text-filtered locator.
+        index_seconds (float): Time to find the same contact in an indexed snapshot of the table
+            (`ContactListPage.find_contact`), including the snapshot's read.
+        select_seconds (float): Time from clicking the contact until its details were shown.
+        heap_bytes (float): The page's used JS heap once the list was rendered.
+        dom_nodes (float): The page's number of DOM nodes once the list was rendered.
+    """
+    contact_count: int
+    seed_seconds: float = 0.0
+    render_seconds: float = 0.0
+    scan_seconds: float = 0.0
+    locate_seconds: float = 0.0
+    index_seconds: float = 0.0
+    select_seconds: float = 0.0
+    heap_bytes: float = 0.0
+    dom_nodes: float = 0.0
+
+    def __str__(self) -> str:
+        return (f"{self.contact_count:>7} contacts: seed {self.seed_seconds:.2f}s, render {self.render_seconds:.2f}s, "
+                f"scan {self.scan_seconds:.2f}s, locate {self.locate_seconds:.2f}s, index {self.index_seconds:.2f}s, "
+                f"select {self.select_seconds:.2f}s, heap {self.heap_bytes / 2 ** 20:.1f} MiB, "
+                f"{self.dom_nodes:.0f} DOM nodes")
+
+
+class Stopwatch:
+    """
+    Measures the time spent in a `with` block.
+
+    Attributes:
+        seconds (float): The duration of the last block.
+    """
+
+    def __init__(self):
+        self.seconds: float = 0.0
+        self._start: float = 0.0
+
+    def __enter__(self) -> "Stopwatch":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.seconds = time.perf_counter() - self._start
+
+
+# Measurements of every scale test of the process, printed by conftest.py at the end of the run
+scale_results: list[ScaleMetrics] = []
@@ -0,0 +1,199 @@
+import json
+from dataclasses import dataclass
+from enum import Enum
+from urllib.parse import urlparse
+
+from playwright.sync_api import Page, CDPSession
+
+# Keyboard events a page can listen to. If nothing listens to them, typing key by key has no effect a single fill
+# doesn't have.
+KEY_EVENTS: frozenset[str] = frozenset({"keydown", "keypress", "keyup"})
+
+# Returns the element, its ancestors up to the document and the window, the targets a key event propagates through
+KEY_EVENT_PATH_SCRIPT: str = """
+(() => {
+    const element = document.querySelector(%s);
+    if (!element) {
+        return null;
+    }
+    const path = [];
+    for (let node = element; node; node = node.parentNode) {
+        path.push(node);
+    }
+    path.push(window);
+    return path;
+})()
+"""
+
+
+class TypingStrategy(Enum):
+    """
+    How text is entered into an input field.
+
+    FILL: Sets the value in one driver call, with an 'input' event but no keyboard events.
+    BATCHED: Dispatches keydown, keypress, input and keyup for every character in one driver call. The events are
+        synthetic (untrusted), which is enough for listeners that only react to them, e.g. shortcut handlers.
+    KEYSTROKES: Presses every key through the browser's input pipeline, one call per character. Needed when the
+        field itself handles key events, e.g. input masks.
+    """
+    FILL = "fill"
+    BATCHED = "batched"
+    KEYSTROKES = "keystrokes"
+
+
+# Strategy forced for every field, None to detect it per field (set from --typing-strategy by conftest.py)
+_forced_strategy: TypingStrategy | None = None
+
+
+def set_forced_strategy(strategy: TypingStrategy | None):
+    """
+    Forces a typing strategy for every field, e.g. to compare strategies or to fall back to real typing.
+
+    Args:
+        strategy (TypingStrategy | None): The strategy, None to detect it per field.
+    """
+    global _forced_strategy
+    _forced_strategy = strategy
+
+
+def forced_strategy() -> TypingStrategy | None:
+    """
+    Returns the typing strategy forced for every field.
+
+    Returns:
+        TypingStrategy | None: The strategy, None when it is detected per field.
+    """
+    return _forced_strategy
+
+
+def detect_strategy(page: Page, selector: str) -> TypingStrategy:
+    """
+    Picks the cheapest strategy that still delivers every keyboard event the page listens to.
+
+    The key event listeners of the field and of everything a key event bubbles through are read with the Chrome
+    DevTools Protocol. Without listeners the field is filled, with listeners only on an ancestor (delegated
+    handlers) the key events are dispatched in a batch, and a field with listeners of its own is typed key by key.
+
+    Args:
+        page (Page): A page of a Chromium browser.
+        selector (str): The CSS selector of the field, waited for until it is visible.
+
+    Returns:
+        TypingStrategy: The detected strategy, KEYSTROKES if the listeners can't be read.
+    """
+    page.locator(selector).wait_for()
+    try:
+        session: CDPSession = page.context.new_cdp_session(page)
+    except Exception:
+        return TypingStrategy.KEYSTROKES  # Not Chromium
+    try:
+        path: dict[str, object] = session.send("Runtime.evaluate", {
+            "expression": KEY_EVENT_PATH_SCRIPT % json.dumps(selector)})["result"]
+        if "objectId" not in path:
+            return TypingStrategy.KEYSTROKES
+        targets: list[dict[str, object]] = [
+            prop for prop in session.send("Runtime.getProperties", {"objectId": path["objectId"],
+                                                                   "ownProperties": True})["result"]
+            if prop["name"].isdigit()]
+        for target in sorted(targets, key=lambda prop: int(prop["name"])):
+            listeners: list[dict[str, object]] = session.send("DOMDebugger.getEventListeners", {
+                "objectId": target["value"]["objectId"]})["listeners"]
+            if any(listener["type"] in KEY_EVENTS for listener in listeners):
+                return TypingStrategy.KEYSTROKES if target["name"] == "0" else TypingStrategy.BATCHED
+        return TypingStrategy.FILL
+    except Exception:
+        return TypingStrategy.KEYSTROKES
+    finally:
+        session.detach()
+
+
+class StrategyCache:
+    """
+    Remembers the detected strategy of every field, so the listeners of a page are only inspected once per process.
+
+    Fields are keyed by the page's path and the selector, since the same selector can be a different field on
+    another page.
+    """
+
+    def __init__(self):
+        self._strategies: dict[tuple[str, str], TypingStrategy] = {}
+
+    def strategy(self, page: Page, selector: str) -> TypingStrategy:
+        """
+        Returns the strategy of a field, detecting it the first time.
+
+        Args:
+            page (Page): The page showing the field.
+            selector (str): The CSS selector of the field.
+
+        Returns:
+            TypingStrategy: The field's strategy.
+        """
+        key: tuple[str, str] = (urlparse(page.url).path, selector)
+        if key not in self._strategies:
+            self._strategies[key] = detect_strategy(page, selector)
+        return self._strategies[key]
+
+
+@dataclass
+class TypingRecord:
+    """
+    A single field typed through `BasePage.type_text`.
+
+    Attributes:
+        strategy (TypingStrategy): The strategy used.
+        selector (str): The field's selector.
+        characters (int): The length of the text.
+        seconds (float): How long entering the text took.
+    """
+    strategy: TypingStrategy
+    selector: str
+    characters: int
+    seconds: float
+
+
+class TypingRecorder:
+    """
+    Collects the cost of every typed field, per strategy, over the whole run.
+
+    Attributes:
+        records (list[TypingRecord]): The typed fields.
+    """
+
+    def __init__(self):
+        self.records: list[TypingRecord] = []
+
+    def record(self, strategy: TypingStrategy, selector: str, characters: int, seconds: float):
+        """
+        Records a typed field.
+
+        Args:
+            strategy (TypingStrategy): The strategy used.
+            selector (str): The field's selector.
+            characters (int): The length of the text.
+            seconds (float): How long entering the text took.
+        """
+        self.records.append(TypingRecord(strategy, selector, characters, seconds))
+
+    def summary(self) -> str:
+        """
+        Builds a report of the average cost per field and per character of every strategy used.
+
+        Returns:
+            str: One line per strategy.
+        """
+        lines: list[str] = []
+        for strategy in TypingStrategy:
+            records: list[TypingRecord] = [record for record in self.records if record.strategy is strategy]
+            if not records:
+                continue
+            seconds: float = sum(record.seconds for record in records)
+            characters: int = sum(record.characters for record in records)
+            lines.append(f"{strategy.value:<10} {len(records):>5} fields, {seconds / len(records) * 1000:>8.1f}ms "
+                         f"per field, {seconds / max(characters, 1) * 1000:>6.2f}ms per character")
+        return "\n".join(lines)
+
+
+# Shared by every page object of the process
+strategy_cache = StrategyCache()
+typing_recorder = TypingRecorder()
@@ -0,0 +1,248 @@
+import base64
+import hashlib
+import json
+import os
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+def token_expiry(token: str) -> float | None:
+    """
+    Reads the expiry timestamp from a JWT without verifying its signature.
+
+    Args:
+        token (str): The JWT returned by the login endpoint.
+
+    Returns:
+        float | None: The 'exp' claim as a UNIX timestamp, or None if the token has no expiry or can't be decoded.
+    """
+    try:
+        payload: str = token.split(".")[1]
+        claims: dict[str, object] = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        expiry = claims.get("exp")
+        return float(expiry) if expiry is not None else None
+    except (IndexError, ValueError):
+        return None
+
+
+@contextmanager
+def _file_lock(path: str) -> Iterator[None]:
+    """
+    Holds an exclusive lock on a file, shared by every process on the machine, for the duration of the block.
+
+    Args:
+        path (str): The lock file, created if needed.
+    """
+    with open(path, "a+b") as file:
+        if fcntl is not None:
+            fcntl.flock(file, fcntl.LOCK_EX)
+        else:
+            file.seek(0)
+            msvcrt.locking(file.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(file, fcntl.LOCK_UN)
+            else:
+                file.seek(0)
+                msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+@dataclass
+class CachedToken:
+    """
+    A session token and when it stops being used.
+
+    Attributes:
+        token (str): The token.
+        expires_at (float): Its 'exp' claim, or the login time plus the manager's TTL if it has none.
+    """
+    token: str
+    expires_at: float
+
+
+class TokenManager:
+    """
+    Hands out a session token per credential set, logging in once for all workers on the machine.
+
+    Tokens are kept in memory and in a JSON file shared by every process, guarded by a file lock. A token that is
+    missing, or expires within `refresh_margin_seconds`, is replaced by a new login before it is handed out, so
+    requests never go out with a token about to expire. The lock is held during the login, so workers asking for
+    the same credentials at the same time wait for a single login instead of each sending their own. Within the
+    process a lock does the same for threads sharing clients, also when there is no file.
+
+    The store is keyed by the application URL and a hash of the credentials; no email or password is written.
+
+    Attributes:
+        path (str): The shared token file, None to keep the tokens in this process only.
+        ttl_seconds (float): How long a token without an 'exp' claim is used.
+        refresh_margin_seconds (float): How long before its expiry a token is replaced.
+        logins (int): Logins sent by this process.
+        memory_hits (int): Tokens handed out from this process's memory.
+        shared_hits (int): Tokens read from the file, logged in by another worker or run.
+        refreshes (int): Logins replacing a token that was about to expire.
+        rejections (int): Tokens the application rejected, replaced by a new login.
+    """
+
+    def __init__(self, path: str | None = ".auth/tokens.json", ttl_seconds: float = 3600.0,
+                 refresh_margin_seconds: float = 300.0):
+        """
+        Initializes the TokenManager.
+
+        Args:
+            path (str | None): The shared token file, None to keep the tokens in this process only.
+            ttl_seconds (float): How long a token without an 'exp' claim is used.
+            refresh_margin_seconds (float): How long before its expiry a token is replaced.
+        """
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.refresh_margin_seconds = refresh_margin_seconds
+        self._tokens: dict[str, CachedToken] = {}
+        self._lock = threading.Lock()
+        self.logins: int = 0
+        self.memory_hits: int = 0
+        self.shared_hits: int = 0
+        self.refreshes: int = 0
+        self.rejections: int = 0
+
+    @staticmethod
+    def key(base_url: str, email: str, password: str) -> str:
+        """
+        Builds the store key of a credential set.
+
+        Args:
+            base_url (str): The application the credentials belong to.
+            email (str): The user's email.
+            password (str): The user's password.
+
+        Returns:
+            str: The key, a hash of the three.
+        """
+        return hashlib.sha256(f"{base_url}\0{email}\0{password}".encode()).hexdigest()[:24]
+
+    def _is_fresh(self, cached: CachedToken | None) -> bool:
+        return cached is not None and cached.expires_at - self.refresh_margin_seconds > time.time()
+
+    def _read(self) -> dict[str, dict[str, object]]:
+        try:
+            with open(self.path, "r") as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    def _write(self, tokens: dict[str, dict[str, object]]):
+        # Drop expired tokens, then replace the file atomically so readers never see it half written
+        now: float = time.time()
+        tokens = {key: entry for key, entry in tokens.items() if float(entry["expires_at"]) > now}
+        temporary_path: str = f"{self.path}.{os.getpid()}.tmp"
+        with open(temporary_path, "w") as file:
+            json.dump(tokens, file)
+        os.replace(temporary_path, self.path)
+
+    @contextmanager
+    def _shared(self) -> Iterator[dict[str, dict[str, object]] | None]:
+        """
+        Locks the shared file and yields its tokens, which are written back if changed. Yields None if the manager
+        has no file.
+        """
+        if self.path is None:
+            yield None
+            return
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with _file_lock(f"{self.path}.lock"):
+            tokens: dict[str, dict[str, object]] = self._read()
+            before: dict[str, dict[str, object]] = dict(tokens)
+            yield tokens
+            if tokens != before:
+                self._write(tokens)
+
+    def token(self, key: str, login: Callable[[], str], rejected: str | None = None) -> str:
+        """
+        Returns a valid token for a credential set, logging in only if no process has one.
+
+        Args:
+            key (str): The store key of the credentials, see `key`.
+            login (Callable[[], str]): Logs in and returns a new token.
+            rejected (str | None): A token the application just rejected, which is never handed out again.
+
+        Returns:
+            str: The token.
+        """
+        with self._lock:
+            cached: CachedToken | None = self._tokens.get(key)
+            if self._is_fresh(cached) and cached.token != rejected:
+                self.memory_hits += 1
+                return cached.token
+            with self._shared() as shared:
+                if shared is not None and key in shared:
+                    stored = CachedToken(str(shared[key]["token"]), float(shared[key]["expires_at"]))
+                    if self._is_fresh(stored) and stored.token != rejected:
+                        self._tokens[key] = stored
+                        self.shared_hits += 1
+                        return stored.token
+                    cached = cached or stored
+                token: str = login()
+                expiry: float | None = token_expiry(token)
+                self._tokens[key] = CachedToken(token, expiry if expiry is not None else time.time() + self.ttl_seconds)
+                self.logins += 1
+                if rejected is not None:
+                    self.rejections += 1
+                elif cached is not None:
+                    self.refreshes += 1
+                if shared is not None:
+                    shared[key] = {"token": token, "expires_at": self._tokens[key].expires_at}
+                return token
+
+    def put(self, key: str, token: str):
+        """
+        Stores a token obtained without `token`, e.g. from a registration, so the next request doesn't log in.
+
+        Args:
+            key (str): The store key of the credentials, see `key`.
+            token (str): The token.
+        """
+        with self._lock:
+            if key in self._tokens and self._tokens[key].token == token:
+                return
+            expiry: float | None = token_expiry(token)
+            self._tokens[key] = CachedToken(token, expiry if expiry is not None else time.time() + self.ttl_seconds)
+            with self._shared() as shared:
+                if shared is not None:
+                    shared[key] = {"token": token, "expires_at": self._tokens[key].expires_at}
+
+    def forget(self, key: str):
+        """
+        Drops the token of a credential set, e.g. after its user was deleted.
+
+        Args:
+            key (str): The store key of the credentials, see `key`.
+        """
+        with self._lock:
+            self._tokens.pop(key, None)
+            with self._shared() as shared:
+                if shared is not None:
+                    shared.pop(key, None)
+
+    def summary(self) -> str:
+        """
+        Builds a human-readable summary of the tokens handed out by this process.
+
+        Returns:
+            str: The summary text.
+        """
+        return (f"{self.logins} logins ({self.refreshes} proactive refreshes, {self.rejections} after a 401), "
+                f"{self.memory_hits} tokens from memory, {self.shared_hits} from {self.path or 'no shared file'}")
+
+
+# TOKEN_CACHE=0 keeps the tokens in each process only
+token_manager = TokenManager(".auth/tokens.json" if os.environ.get("TOKEN_CACHE", "1") != "0" else None)
@@ -0,0 +1,132 @@
+import os
+import re
+import time
+from dataclasses import dataclass
+
+from playwright.sync_api import BrowserContext
+
+
+@dataclass
+class TraceRecord:
+    """
+    The tracing cost and outcome of one test.
+
+    Attributes:
+        test_name (str): The node id of the test.
+        overhead_seconds (float): Time spent starting and stopping the trace.
+        path (str): The retained trace file, empty if the trace was discarded.
+        size_bytes (int): The size of the retained trace.
+    """
+    test_name: str
+    overhead_seconds: float = 0.0
+    path: str = ""
+    size_bytes: int = 0
+
+
+class TraceRecorder:
+    """
+    Records a Playwright trace of every UI test and keeps it only if the test failed or was retried.
+
+    Tracing is started once per browser context and every test is recorded as a chunk of it. A green test's chunk is
+    stopped without a path, so Playwright drops it without writing anything. Retained traces count against a size
+    budget; once it is used up no further tests are traced. The time spent starting and stopping the traces is
+    recorded per test.
+
+    Attributes:
+        enabled (bool): Whether tests are traced.
+        directory (str): Where retained traces are written.
+        budget_bytes (int): The total size of retained traces after which tracing stops.
+        records (list[TraceRecord]): The traced tests.
+    """
+
+    def __init__(self, enabled: bool = False, directory: str = "traces", budget_bytes: int = 0):
+        """
+        Initializes the TraceRecorder.
+
+        Args:
+            enabled (bool): Whether tests are traced.
+            directory (str): Where retained traces are written.
+            budget_bytes (int): The total size of retained traces after which tracing stops, 0 for no limit.
+        """
+        self.enabled = enabled
+        self.directory = directory
+        self.budget_bytes = budget_bytes
+        self.records: list[TraceRecord] = []
+        self._traced: dict[int, TraceRecord] = {}
+
+    @property
+    def retained_bytes(self) -> int:
+        return sum(record.size_bytes for record in self.records)
+
+    @property
+    def over_budget(self) -> bool:
+        return bool(self.budget_bytes) and self.retained_bytes >= self.budget_bytes
+
+    def start(self, context: BrowserContext, test_name: str):
+        """
+        Starts recording a test in the context, unless tracing is disabled or its budget is used up.
+
+        Args:
+            context (BrowserContext): The test's browser context.
+            test_name (str): The node id of the test.
+        """
+        if not self.enabled or self.over_budget:
+            return
+        record = TraceRecord(test_name)
+        start: float = time.perf_counter()
+        context.tracing.start(screenshots=True, snapshots=True, sources=False)
+        context.tracing.start_chunk(title=test_name)
+        record.overhead_seconds = time.perf_counter() - start
+        self.records.append(record)
+        self._traced[id(context)] = record
+
+    def stop(self, context: BrowserContext, retain: bool) -> TraceRecord | None:
+        """
+        Stops recording the context's test, writing the trace only if it is retained.
+
+        Args:
+            context (BrowserContext): The test's browser context, before it is closed.
+            retain (bool): Whether to keep the trace, i.e. the test failed or was retried.
+
+        Returns:
+            TraceRecord | None: The test's record, None if the context wasn't traced.
+        """
+        record: TraceRecord | None = self._traced.pop(id(context), None)
+        if record is None:
+            return None
+        path: str = ""
+        if retain and not self.over_budget:
+            file_name: str = re.sub(r"[^\w.-]+", "_", record.test_name).strip("_")
+            path = os.path.join(self.directory, f"{file_name}-{len(self.records)}.zip")
+            os.makedirs(self.directory, exist_ok=True)
+        start: float = time.perf_counter()
+        try:
+            context.tracing.stop_chunk(path=path or None)
+            context.tracing.stop()
+        finally:
+            record.overhead_seconds += time.perf_counter() - start
+        if path:
+            record.path, record.size_bytes = path, os.path.getsize(path)
+        return record
+
+    def summary(self) -> str:
+        """
+        Builds a human-readable summary of the tracing cost and the retained traces.
+
+        Returns:
+            str: The summary text.
+        """
+        overhead: float = sum(record.overhead_seconds for record in self.records)
+        retained: list[TraceRecord] = [record for record in self.records if record.path]
+        budget: str = f" of {self.budget_bytes / 2 ** 20:.0f} MiB" if self.budget_bytes else ""
+        lines: list[str] = [f"Traced {len(self.records)} tests, overhead {overhead:.2f}s "
+                            f"({overhead / max(len(self.records), 1) * 1000:.0f}ms per test), retained "
+                            f"{len(retained)} traces, {self.retained_bytes / 2 ** 20:.1f} MiB{budget}"]
+        if self.over_budget:
+            lines.append("  The trace budget was used up, later tests weren't traced")
+        lines.extend(f"  {record.path}" for record in retained)
+        return "\n".join(lines)
+
+
+# Configured from --tracing by conftest.py
+trace_recorder = TraceRecorder()
@@ -0,0 +1,360 @@
+import asyncio
+import json
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+import requests
+from playwright.async_api import async_playwright
+from playwright.sync_api import APIRequestContext, APIResponse, expect
+from requests.adapters import HTTPAdapter
+
+from utils.histogram import HdrHistogram
+
+TRANSPORTS: tuple[str, ...] = ("playwright", "requests", "async")
+
+
+class HttpResponse:
+    """
+    A response of the 'requests' or 'async' transport, with the parts of Playwright's APIResponse the tests use.
+
+    Attributes:
+        url (str): The URL of the response.
+        status (int): The HTTP status.
+        status_text (str): The HTTP reason phrase.
+        headers (dict[str, str]): The response headers, with lower-case names.
+    """
+
+    def __init__(self, url: str, status: int, status_text: str, headers: dict[str, str], body: bytes):
+        """
+        Initializes the HttpResponse.
+
+        Args:
+            url (str): The URL of the response.
+            status (int): The HTTP status.
+            status_text (str): The HTTP reason phrase.
+            headers (dict[str, str]): The response headers.
+            body (bytes): The response body.
+        """
+        self.url = url
+        self.status = status
+        self.status_text = status_text
+        self.headers = {name.lower(): value for name, value in headers.items()}
+        self._body = body
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status <= 299
+
+    def body(self) -> bytes:
+        return self._body
+
+    def text(self) -> str:
+        return self._body.decode("utf-8", errors="replace")
+
+    def json(self) -> object:
+        return json.loads(self._body)
+
+
+class HttpResponseAssertions:
+    """
+    The status assertions of Playwright's APIResponseAssertions, for an HttpResponse.
+    """
+
+    def __init__(self, response: HttpResponse):
+        self._response = response
+
+    def _message(self) -> str:
+        return (f"Response status expected to be within [200..299] range, was '{self._response.status}'\n"
+                f"{self._response.url}\n{self._response.text()[:1000]}")
+
+    def to_be_ok(self):
+        assert self._response.ok, self._message()
+
+    def not_to_be_ok(self):
+        assert not self._response.ok, self._message().replace("expected to be", "expected not to be", 1)
+
+
+def expect_response(response: APIResponse | HttpResponse) -> object:
+    """
+    Starts an assertion on a response of any transport, like Playwright's `expect`.
+
+    Args:
+        response (APIResponse | HttpResponse): The response.
+
+    Returns:
+        object: Playwright's APIResponseAssertions for an APIResponse, HttpResponseAssertions otherwise.
+
+    Example:
+        >>> expect_response(api_client.get("contacts")).to_be_ok()
+    """
+    return expect(response) if isinstance(response, APIResponse) else HttpResponseAssertions(response)
+
+
+class Transport(ABC):
+    """
+    Sends the HTTP requests of an APIClient.
+
+    Attributes:
+        name (str): The name used by --api-transport.
+        thread_safe (bool): Whether clients on this transport may send requests from several threads at once.
+    """
+    name: str = ""
+    thread_safe: bool = False
+
+    @abstractmethod
+    def request(self, method: str, url: str, headers: dict[str, str],
+                payload: dict | None = None) -> APIResponse | HttpResponse:
+        """
+        Sends a request.
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The full URL.
+            headers (dict[str, str]): The request headers.
+            payload (dict | None): Data sent as the JSON body, if any.
+
+        Returns:
+            APIResponse | HttpResponse: The response.
+        """
+
+    def close(self):
+        """
+        Releases the connections of the transport.
+        """
+
+
+class PlaywrightTransport(Transport):
+    """
+    Sends the requests through a Playwright APIRequestContext, over the Playwright driver.
+
+    The context belongs to the thread that created it, so requests from any other thread are refused.
+    """
+    name = "playwright"
+
+    def __init__(self, request_context: APIRequestContext):
+        """
+        Initializes the PlaywrightTransport.
+
+        Args:
+            request_context (APIRequestContext): The request context, disposed of by its owner.
+        """
+        self.request_context = request_context
+        self._thread: int = threading.get_ident()
+
+    def request(self, method: str, url: str, headers: dict[str, str],
+                payload: dict | None = None) -> APIResponse:
+        """
+        Sends a request through the request context.
+
+        Raises:
+            RuntimeError: If called from another thread than the one that created the transport.
+        """
+        if threading.get_ident() != self._thread:
+            raise RuntimeError("The Playwright transport can only be used from the thread that created it, "
+                               "use --api-transport=requests or async for threads")
+        return self.request_context.fetch(url, method=method, headers=headers, data=payload)
+
+
+class RequestsTransport(Transport):
+    """
+    Sends the requests with `requests`, without the Playwright driver.
+
+    Every thread gets its own Session, whose pool keeps up to `pool_size` connections per host alive between
+    requests, so clients can be shared by a thread pool.
+
+    Attributes:
+        pool_size (int): Keep-alive connections per host and thread.
+        timeout (float): Seconds a request may take.
+    """
+    name = "requests"
+    thread_safe = True
+
+    def __init__(self, pool_size: int = 10, timeout: float = 30.0):
+        """
+        Initializes the RequestsTransport.
+
+        Args:
+            pool_size (int): Keep-alive connections per host and thread.
+            timeout (float): Seconds a request may take.
+        """
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self._local = threading.local()
+        self._sessions: list[requests.Session] = []
+        self._lock = threading.Lock()
+
+    def _session(self) -> requests.Session:
+        session: requests.Session | None = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            self._local.session = session
+            with self._lock:
+                self._sessions.append(session)
+        return session
+
+    def request(self, method: str, url: str, headers: dict[str, str],
+                payload: dict | None = None) -> HttpResponse:
+        # Serialized like Playwright does, without whitespace
+        data: bytes | None = json.dumps(payload, separators=(",", ":")).encode() if payload is not None else None
+        response: requests.Response = self._session().request(method, url, headers=headers, data=data,
+                                                               timeout=self.timeout)
+        return HttpResponse(response.url, response.status_code, response.reason or "", dict(response.headers),
+                            response.content)
+
+    def close(self):
+        with self._lock:
+            sessions, self._sessions = self._sessions, []
+        for session in sessions:
+            session.close()
+
+
+class AsyncTransport(Transport):
+    """
+    Sends the requests through an async Playwright request context on an event loop of its own.
+
+    The loop runs in a helper thread; any thread can send a request, which is handed to the loop and multiplexed
+    with the requests of the other threads over the one driver connection.
+
+    Attributes:
+        timeout (float): Seconds a request may take.
+    """
+    name = "async"
+    thread_safe = True
+
+    def __init__(self, timeout: float = 30.0):
+        """
+        Initializes the AsyncTransport and starts its event loop and Playwright driver.
+
+        Args:
+            timeout (float): Seconds a request may take.
+        """
+        self.timeout = timeout
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="async-transport", daemon=True)
+        self._thread.start()
+        self._playwright, self._request_context = self._run(self._start())
+
+    async def _start(self):
+        playwright = await async_playwright().start()
+        return playwright, await playwright.request.new_context()
+
+    def _run(self, coroutine):
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+
+    async def _fetch(self, method: str, url: str, headers: dict[str, str], payload: dict | None) -> HttpResponse:
+        response = await self._request_context.fetch(url, method=method, headers=headers, data=payload,
+                                                     timeout=self.timeout * 1000)
+        try:
+            return HttpResponse(response.url, response.status, response.status_text, response.headers,
+                                await response.body())
+        finally:
+            await response.dispose()
+
+    def request(self, method: str, url: str, headers: dict[str, str],
+                payload: dict | None = None) -> HttpResponse:
+        return self._run(self._fetch(method, url, headers, payload))
+
+    def close(self):
+        async def stop():
+            await self._request_context.dispose()
+            await self._playwright.stop()
+
+        if self._loop.is_running():
+            self._run(stop())
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
+
+
+def create_transport(name: str, request_context: APIRequestContext | None = None) -> Transport:
+    """
+    Creates the transport selected by --api-transport.
+
+    Args:
+        name (str): One of TRANSPORTS.
+        request_context (APIRequestContext | None): The request context of the 'playwright' transport.
+
+    Returns:
+        Transport: The transport.
+
+    Raises:
+        ValueError: If the name is unknown, or the 'playwright' transport has no request context.
+    """
+    if name == "playwright":
+        if request_context is None:
+            raise ValueError("The 'playwright' transport needs a request context")
+        return PlaywrightTransport(request_context)
+    if name == "requests":
+        return RequestsTransport()
+    if name == "async":
+        return AsyncTransport()
+    raise ValueError(f"Unknown API transport '{name}', expected one of {', '.join(TRANSPORTS)}")
+
+
+@dataclass
+class TransportBenchmark:
+    """
+    The cost of one transport, measured with the same request.
+
+    Attributes:
+        transport (str): The transport's name.
+        requests (int): The requests sent one after the other.
+        latency (HdrHistogram): The wall time of those requests, in microseconds.
+        threads (int): The threads of the throughput run, 1 if the transport isn't thread-safe.
+        throughput (float): Requests per second with `threads` threads sending at once.
+    """
+    transport: str
+    requests: int
+    latency: HdrHistogram
+    threads: int
+    throughput: float
+
+    def __str__(self) -> str:
+        return (f"{self.transport:<10} {self.requests} req  mean {self.latency.mean / 1000:7.2f}ms  "
+                f"p50 {self.latency.value_at_percentile(50) / 1000:7.2f}ms  "
+                f"p99 {self.latency.value_at_percentile(99) / 1000:7.2f}ms  "
+                f"{self.throughput:8.0f} req/s with {self.threads} threads")
+
+
+def benchmark_transport(transport: Transport, url: str, headers: dict[str, str], requests_count: int = 200,
+                        threads: int = 8) -> TransportBenchmark:
+    """
+    Measures the per-request wall time of a transport, then its throughput from a thread pool.
+
+    Args:
+        transport (Transport): The transport.
+        url (str): A cheap GET endpoint.
+        headers (dict[str, str]): The request headers, e.g. with a token.
+        requests_count (int): The requests of each run.
+        threads (int): The threads of the throughput run, if the transport is thread-safe.
+
+    Returns:
+        TransportBenchmark: The measurements.
+    """
+    transport.request("GET", url, headers)  # Warm up the connection
+    latency = HdrHistogram()
+    for _ in range(requests_count):
+        start: float = time.perf_counter()
+        transport.request("GET", url, headers)
+        latency.record_value(int((time.perf_counter() - start) * 1_000_000))
+
+    threads = threads if transport.thread_safe else 1
+    start = time.perf_counter()
+    if threads == 1:
+        for _ in range(requests_count):
+            transport.request("GET", url, headers)
+    else:
+        with ThreadPoolExecutor(threads) as executor:
+            list(executor.map(lambda _: transport.request("GET", url, headers), range(requests_count)))
+    throughput: float = requests_count / (time.perf_counter() - start)
+    return TransportBenchmark(transport.name, requests_count, latency, threads, throughput)
+
+
+# Filled by the transport benchmark, printed in the terminal summary
+transport_benchmarks: list[TransportBenchmark] = []
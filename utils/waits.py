@@ -0,0 +1,99 @@
+from dataclasses import dataclass
+
+# Resolves as soon as the condition holds, re-checking on every DOM mutation instead of polling
+WAIT_FOR_DOM_SCRIPT: str = """
+([selector, condition, expected, timeout]) => new Promise((resolve, reject) => {
+    const satisfied = () => {
+        const nodes = document.querySelectorAll(selector);
+        if (condition === 'count') {
+            return nodes.length >= expected;
+        }
+        return nodes.length > 0 && nodes[0].textContent.trim() !== '';
+    };
+    if (satisfied()) {
+        return resolve(true);
+    }
+    const observer = new MutationObserver(() => {
+        if (satisfied()) {
+            observer.disconnect();
+            clearTimeout(timer);
+            resolve(true);
+        }
+    });
+    const timer = setTimeout(() => {
+        observer.disconnect();
+        reject(new Error(`Timed out after ${timeout}ms waiting for '${condition}' on ${selector}`));
+    }, timeout);
+    observer.observe(document, {childList: true, subtree: true, characterData: true});
+})
+"""
+
+@dataclass
+class WaitRecord:
+    """
+    A single wait performed through the BasePage wait methods.
+
+    Attributes:
+        kind (str): The signal waited for ('response', 'url' or 'dom').
+        target (str): What was waited on, e.g. 'POST contacts' or a selector.
+        seconds (float): How long the wait actually blocked.
+        baseline_seconds (float): The fixed sleep this wait replaced, 0 if it didn't replace one.
+    """
+    kind: str
+    target: str
+    seconds: float
+    baseline_seconds: float = 0.0
+
+
+class WaitRecorder:
+    """
+    Collects the waits of the running test so their cost can be reported.
+
+    The saving of a test is the sum of the fixed sleeps its waits replaced minus the time it blocked in all of its
+    waits, including the ones that didn't replace a sleep themselves.
+
+    Attributes:
+        records (list[WaitRecord]): The waits of the current test.
+        total_blocked_seconds (float): Time blocked in waits over the whole run.
+        total_saved_seconds (float): Time saved over the whole run compared to the fixed sleeps that were replaced.
+    """
+
+    def __init__(self):
+        self.records: list[WaitRecord] = []
+        self.total_blocked_seconds: float = 0.0
+        self.total_saved_seconds: float = 0.0
+
+    def record(self, kind: str, target: str, seconds: float, baseline_seconds: float = 0.0):
+        """
+        Records a finished wait.
+
+        Args:
+            kind (str): The signal waited for.
+            target (str): What was waited on.
+            seconds (float): How long the wait blocked.
+            baseline_seconds (float): The fixed sleep the wait replaced, if any.
+        """
+        self.records.append(WaitRecord(kind, target, seconds, baseline_seconds))
+
+    def finish_test(self) -> str:
+        """
+        Adds the current test's waits to the run totals and clears them for the next test.
+
+        Returns:
+            str: A report with one line per wait followed by the test's totals.
+        """
+        blocked: float = sum(record.seconds for record in self.records)
+        replaced: float = sum(record.baseline_seconds for record in self.records)
+        saved: float = max(replaced - blocked, 0.0)
+        self.total_blocked_seconds += blocked
+        self.total_saved_seconds += saved
+        lines: list[str] = [f"{record.kind:<13} {record.target:<50} blocked {record.seconds:.3f}s"
+                            + (f" (replaced {record.baseline_seconds:.1f}s sleep)" if record.baseline_seconds else "")
+                            for record in self.records]
+        lines.append(f"Total blocked {blocked:.3f}s, replaced {replaced:.1f}s of fixed sleeps, saved {saved:.3f}s")
+        self.records = []
+        return "\n".join(lines)
+
+
+# Shared by every page object of the process; conftest.py reports and clears it after each test
+wait_recorder = WaitRecorder()
@@ -0,0 +1,44 @@
+import itertools
+import os
+import uuid
+
+# Shared by all workers of an xdist run, unique per run otherwise
+_RUN_ID: str = os.environ.get("PYTEST_XDIST_TESTRUNUID", uuid.uuid4().hex)[:8]
+_email_counter = itertools.count(1)
+
+
+def worker_id() -> str:
+    """
+    Returns the id of the current xdist worker.
+
+    Returns:
+        str: The worker id ('gw0', 'gw1', ...), or 'main' when the tests run in a single process.
+    """
+    return os.environ.get("PYTEST_XDIST_WORKER", "main")
+
+
+def worker_count() -> int:
+    """
+    Returns the number of xdist workers of the run.
+
+    Returns:
+        int: The worker count, 1 when the tests run in a single process.
+    """
+    return int(os.environ.get("PYTEST_XDIST_WORKER_COUNT", "1"))
+
+
+def unique_email(email: str) -> str:
+    """
+    Turns an email from the test data into one that is unique for this run, worker and call.
+
+    The run, worker and a counter are added as a '+' sub-address, so parallel workers and repeated runs never
+    register the same account.
+
+    Args:
+        email (str): The email from the test data, e.g. 'email0001@fake.com'.
+
+    Returns:
+        str: The unique email, e.g. 'email0001+3f2a9c1d-gw1-1@fake.com'.
+    """
+    local_part, _, domain = email.partition("@")
+    return f"{local_part}+{_RUN_ID}-{worker_id()}-{next(_email_counter)}@{domain}"